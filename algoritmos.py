@@ -1,23 +1,204 @@
 import heapq
+from array import array
+from bisect import bisect_left
+from collections import deque
 from typing import List, Tuple, Dict, Set
 import sys
 
+from instrumentacao import Estatisticas
+
 class Grafo:
     def __init__(self, num_vertices: int, direcionado: bool = False):
         self.num_vertices = num_vertices
         self.direcionado = direcionado
         self.arestas = []
         self.adj_list = [[] for _ in range(num_vertices)]
+        # Incrementada a cada alteração; permite invalidar resultados guardados em cache
+        self.versao = 0
+        # (u, v) -> posição da primeira aresta em arestas; criado no primeiro alterar_peso
+        self._indice_arestas = None
+        # Maior peso se todos forem inteiros não-negativos, -1 caso contrário (ver limite_pesos_inteiros)
+        self._limite_pesos = None
         
     def adicionar_aresta(self, u: int, v: int, peso: int):
         # Add aresta ao grafo
+        self.versao += 1
+        if self._indice_arestas is not None:
+            self._indice_arestas.setdefault((u, v), len(self.arestas))
+        if self._limite_pesos is not None:
+            self._limite_pesos = _acumular_limite(self._limite_pesos, peso)
         self.arestas.append((u, v, peso))
         self.adj_list[u].append((v, peso))
         
         if not self.direcionado:
             self.adj_list[v].append((u, peso))
 
-def dijkstra(grafo: Grafo, origem: int) -> Tuple[List[int], List[int]]:
+    def alterar_peso(self, u: int, v: int, peso: int) -> int:
+        """
+        Altera o peso da aresta (u, v) e retorna o peso antigo
+        Com arestas paralelas, altera a primeira inserida.
+        """
+        if self._indice_arestas is None:
+            self._indice_arestas = {}
+            for i, (a, b, _) in enumerate(self.arestas):
+                self._indice_arestas.setdefault((a, b), i)
+
+        posicoes = [self._indice_arestas.get((u, v))]
+        if not self.direcionado:
+            posicoes.append(self._indice_arestas.get((v, u)))
+        posicoes = [i for i in posicoes if i is not None]
+        if not posicoes:
+            raise ValueError(f"Aresta ({u}, {v}) não existe no grafo")
+
+        i = min(posicoes)
+        a, b, peso_antigo = self.arestas[i]
+        self.versao += 1
+        self.arestas[i] = (a, b, peso)
+        if self._limite_pesos is not None:
+            self._limite_pesos = _acumular_limite(self._limite_pesos, peso)
+        _trocar_peso(self.adj_list[a], b, peso_antigo, peso)
+        if not self.direcionado:
+            _trocar_peso(self.adj_list[b], a, peso_antigo, peso)
+        return peso_antigo
+
+def _trocar_peso(vizinhos: list, v: int, peso_antigo: int, peso: int):
+    """Troca (v, peso_antigo) por (v, peso) em uma lista de adjacência"""
+    vizinhos[vizinhos.index((v, peso_antigo))] = (v, peso)
+
+def _acumular_limite(limite: int, peso) -> int:
+    """Atualiza o limite de pesos inteiros com mais um peso (continua sendo um limite superior)"""
+    if limite < 0 or not isinstance(peso, int) or peso < 0:
+        return -1
+    return max(limite, peso)
+
+class _AdjacenciaCSR:
+    """Visão de adj_list sobre os buffers CSR: adj_list[u] itera pares (v, peso)"""
+    __slots__ = ('_offsets', '_alvos', '_pesos')
+
+    def __init__(self, offsets, alvos, pesos):
+        self._offsets = offsets
+        self._alvos = alvos
+        self._pesos = pesos
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, u: int):
+        ini, fim = self._offsets[u], self._offsets[u + 1]
+        return zip(self._alvos[ini:fim], self._pesos[ini:fim])
+
+class _ArestasCSR:
+    """Visão de arestas sobre os buffers CSR: itera triplas (u, v, peso)"""
+    __slots__ = ('_grafo',)
+
+    def __init__(self, grafo: 'GrafoCSR'):
+        self._grafo = grafo
+
+    def __len__(self):
+        return self._grafo.num_arestas
+
+    def __iter__(self):
+        g = self._grafo
+        offsets, alvos, pesos, sentido = g.offsets, g.alvos, g.pesos, g.sentido
+        for u in range(g.num_vertices):
+            for i in range(offsets[u], offsets[u + 1]):
+                v = alvos[i]
+                # Em grafos não-direcionados cada aresta aparece duas vezes no CSR:
+                # sai só a entrada no sentido em que foi dada (bellman_ford percorre
+                # arestas em um sentido só); sem sentido, a de u <= v
+                if g.direcionado or (sentido[i] if sentido is not None else u <= v):
+                    yield u, v, pesos[i]
+
+class GrafoCSR:
+    """
+    Grafo em formato CSR (compressed sparse row)
+
+    Os vizinhos de u ficam em alvos[offsets[u]:offsets[u + 1]], com os pesos
+    correspondentes em pesos. Os três buffers são arrays do módulo array, então
+    cada aresta custa poucos bytes em vez de uma tupla por entrada.
+    Expõe adj_list e arestas com a mesma interface de Grafo, de forma que
+    dijkstra, bellman_ford e floyd_warshall o consomem diretamente.
+    Em grafos não-direcionados, sentido[i] = 1 marca a entrada i que tem a
+    orientação de entrada da aresta (a outra é a cópia reversa), para que arestas
+    produza cada aresta como foi dada; só a ordem entre vértices diferentes muda.
+    O grafo é imutável: deve ser construído de uma vez via from_edges.
+    """
+
+    def __init__(self, num_vertices: int, direcionado: bool, offsets: array,
+                 alvos: array, pesos: array, num_arestas: int, sentido: array = None):
+        self.num_vertices = num_vertices
+        self.direcionado = direcionado
+        self.offsets = offsets
+        self.alvos = alvos
+        self.pesos = pesos
+        self.num_arestas = num_arestas
+        self.sentido = None if direcionado else sentido
+        self._limite_pesos = None
+        self.adj_list = _AdjacenciaCSR(offsets, alvos, pesos)
+        self.arestas = _ArestasCSR(self)
+
+    @classmethod
+    def from_edges(cls, num_vertices: int, arestas, direcionado: bool = False) -> 'GrafoCSR':
+        """Constrói o grafo a partir de um iterável de triplas (u, v, peso)"""
+        origens, destinos, pesos = array('i'), array('i'), []
+        for u, v, peso in arestas:
+            origens.append(u)
+            destinos.append(v)
+            pesos.append(peso)
+        return cls.from_arrays(num_vertices, origens, destinos, pesos, direcionado)
+
+    @classmethod
+    def from_grafo(cls, grafo: Grafo) -> 'GrafoCSR':
+        """Converte um Grafo já montado"""
+        return cls.from_edges(grafo.num_vertices, grafo.arestas, grafo.direcionado)
+
+    @classmethod
+    def from_arrays(cls, num_vertices: int, origens, destinos, pesos,
+                    direcionado: bool = False) -> 'GrafoCSR':
+        """
+        Constrói o grafo a partir de três sequências paralelas (origem, destino, peso)
+        ordenando as entradas pela origem, preservando a ordem de inserção dentro
+        de cada lista de adjacência
+        """
+        num_arestas = len(origens)
+        if isinstance(pesos, array):
+            tipo_peso = 'd' if pesos.typecode in 'fd' else 'q'
+        else:
+            tipo_peso = 'q' if all(isinstance(p, int) for p in pesos) else 'd'
+
+        # Em grafos não-direcionados cada aresta (exceto laços) entra nos dois sentidos
+        if direcionado:
+            fontes, alvos_brutos, pesos_brutos = origens, destinos, pesos
+        else:
+            reversas = [i for i in range(num_arestas) if origens[i] != destinos[i]]
+            fontes = list(origens) + [destinos[i] for i in reversas]
+            alvos_brutos = list(destinos) + [origens[i] for i in reversas]
+            pesos_brutos = list(pesos) + [pesos[i] for i in reversas]
+            sentido_bruto = bytes([1]) * num_arestas + bytes(len(reversas))
+
+        # Ordenação estável pela origem (equivale ao counting sort, mas roda em C)
+        ordem = sorted(range(len(fontes)), key=fontes.__getitem__)
+        alvos = array('i', map(alvos_brutos.__getitem__, ordem))
+        pesos_csr = array(tipo_peso, map(pesos_brutos.__getitem__, ordem))
+
+        # offsets[u] = primeira posição com origem >= u
+        fontes_ordenadas = array('i', map(fontes.__getitem__, ordem))
+        offsets = array('q', (bisect_left(fontes_ordenadas, u) for u in range(num_vertices + 1)))
+        sentido = None if direcionado else array('B', map(sentido_bruto.__getitem__, ordem))
+
+        return cls(num_vertices, direcionado, offsets, alvos, pesos_csr, num_arestas, sentido)
+
+    def grau(self, u: int) -> int:
+        """Número de entradas na lista de adjacência de u"""
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def memoria_bytes(self) -> int:
+        """Bytes ocupados pelos buffers CSR"""
+        buffers = (self.offsets, self.alvos, self.pesos) + ((self.sentido,) if self.sentido is not None else ())
+        return sum(memoryview(buf).nbytes for buf in buffers)
+
+def dijkstra(grafo: Grafo, origem: int, fila: str = 'auto',
+             estatisticas: Estatisticas = None) -> Tuple[List[int], List[int]]:
     """
     Algoritmo de Dijkstra para caminho mínimo de origem única
     
@@ -31,7 +212,22 @@ def dijkstra(grafo: Grafo, origem: int) -> Tuple[List[int], List[int]]:
     6         S ← S ∪ {u}
     7         for each vertex v ∈ Adj[u]
     8             do RELAX(u, v, w)
+
+    fila: 'heap' (heapq), 'baldes' (dijkstra_baldes) ou 'auto', que usa a fila de
+    baldes quando os pesos são inteiros não-negativos até LIMITE_BALDES.
+    As duas filas devolvem exatamente o mesmo resultado.
+    Com estatisticas, soma inserções/remoções da fila, remoções obsoletas,
+    relaxamentos e vértices assentados.
     """
+    if fila not in ('auto', 'heap', 'baldes'):
+        raise ValueError(f"Fila desconhecida para dijkstra: {fila}")
+    if fila == 'baldes':
+        return dijkstra_baldes(grafo, origem, estatisticas=estatisticas)
+    if fila == 'auto':
+        peso_max = limite_pesos_inteiros(grafo)
+        if 0 <= peso_max <= LIMITE_BALDES:
+            return dijkstra_baldes(grafo, origem, peso_max, estatisticas)
+
     INF = float('inf')
     
     # INITIALIZE-SINGLE-SOURCE(G, s)
@@ -41,29 +237,395 @@ def dijkstra(grafo: Grafo, origem: int) -> Tuple[List[int], List[int]]:
     
     # Q ← V[G] (usando heap para eficiência)
     heap = [(0, origem)]
-    visitados = set()
+    visitados = bytearray(grafo.num_vertices)
+    adj_list = grafo.adj_list
+    heappush, heappop = heapq.heappush, heapq.heappop
+    remocoes = 0
     
     # while Q diferente de vazio
     while heap:
         """Extract-min de Q e processamento do vértice"""
-        dist_atual, u = heapq.heappop(heap)
+        dist_atual, u = heappop(heap)
+        remocoes += 1
         
-        if u in visitados:
+        if visitados[u]:
             continue
             
-        visitados.add(u)
+        visitados[u] = 1
         
         # for each vertex v ∈ Adj[u]
-        for v, peso in grafo.adj_list[u]:
+        for v, peso in adj_list[u]:
             # RELAX(u, v, w)
-            if dist[u] + peso < dist[v]:
-                dist[v] = dist[u] + peso
+            nova = dist_atual + peso
+            if nova < dist[v]:
+                dist[v] = nova
                 anterior[v] = u
-                heapq.heappush(heap, (dist[v], v))
-    
+                heappush(heap, (nova, v))
+
+    if estatisticas is not None:
+        # O heap termina vazio: cada inserção teve uma remoção
+        assentados = visitados.count(1)
+        estatisticas.somar('insercoes_heap', remocoes)
+        estatisticas.somar('remocoes_heap', remocoes)
+        estatisticas.somar('remocoes_obsoletas', remocoes - assentados)
+        estatisticas.somar('relaxamentos', remocoes - 1)
+        estatisticas.somar('vertices_assentados', assentados)
+
+    return dist, anterior
+
+# Maior peso para o qual dijkstra escolhe a fila de baldes: acima disso
+# percorrer baldes vazios passa a custar mais que o heap
+LIMITE_BALDES = 1024
+
+def limite_pesos_inteiros(grafo: Grafo) -> int:
+    """
+    Maior peso do grafo se todos forem inteiros não-negativos; -1 caso contrário
+
+    O valor fica guardado no grafo (Grafo o mantém atualizado a cada aresta), de
+    forma que chamadas repetidas de dijkstra não percorrem as arestas de novo.
+    """
+    limite = getattr(grafo, '_limite_pesos', None)
+    if limite is not None:
+        return limite
+
+    if isinstance(grafo, GrafoCSR):
+        pesos = grafo.pesos
+        # array.array (GrafoCSR montado em memória) ou memoryview (cache .csr, memória compartilhada)
+        if (getattr(pesos, 'typecode', None) or pesos.format) in 'fd':
+            limite = -1
+        else:
+            limite = max(pesos, default=0) if min(pesos, default=0) >= 0 else -1
+    else:
+        limite = 0
+        for _, _, peso in grafo.arestas:
+            limite = _acumular_limite(limite, peso)
+            if limite < 0:
+                break
+
+    try:
+        grafo._limite_pesos = limite
+    except AttributeError:
+        pass
+    return limite
+
+def dijkstra_baldes(grafo: Grafo, origem: int, peso_max: int = None,
+                    estatisticas: Estatisticas = None) -> Tuple[List[int], List[int]]:
+    """
+    Dijkstra com a fila de baldes de Dial, para pesos inteiros em [0, peso_max]
+
+    Todos os rótulos ainda não assentados ficam em [d, d + peso_max], onde d é a
+    distância sendo assentada, então peso_max + 1 baldes usados circularmente
+    (balde d % (peso_max + 1)) bastam. Inserir é um append e extrair o mínimo é
+    avançar d até o próximo balde não vazio: O(V + E + maior distância), sem tuplas.
+
+    Dentro de um balde os vértices são assentados em ordem crescente, como o heap
+    de (dist, vértice) de dijkstra faria, então dist e anterior são idênticos.
+    Vértices alcançados por arestas de peso 0 entram em um heap auxiliar do balde atual.
+    """
+    if peso_max is None:
+        peso_max = limite_pesos_inteiros(grafo)
+        if peso_max < 0:
+            raise ValueError("dijkstra_baldes exige pesos inteiros não-negativos")
+
+    INF = float('inf')
+    dist = [INF] * grafo.num_vertices
+    anterior = [-1] * grafo.num_vertices
+    # Consome o gerador em C, sem laço Python por vértice assentado
+    deque(_assentar_baldes(grafo.adj_list, origem, peso_max, dist, anterior, estatisticas), maxlen=0)
     return dist, anterior
 
-def bellman_ford(grafo: Grafo, origem: int) -> Tuple[List[int], List[int], bool]:
+def _assentar_baldes(adj_list, origem: int, peso_max: int, dist: List[float], anterior: List[int],
+                     estatisticas: Estatisticas = None):
+    """
+    Núcleo de dijkstra_baldes: gera (u, dist[u]) na ordem em que os vértices são
+    assentados, relaxando as arestas de u quando o consumidor pede o próximo.
+    Quem só precisa de alguns vértices (tabela_distancias) pode parar antes.
+    """
+    dist[origem] = 0
+    tamanho = peso_max + 1
+    baldes = [[] for _ in range(tamanho)]
+    baldes[0].append(origem)
+    pendentes = 1
+    zeros = []
+    d = 0
+    # Contados por balde e em arestas de peso 0 (raras), não por relaxamento
+    remocoes = 0
+    insercoes_zeros = 0
+    assentados = 0
+
+    while pendentes:
+        balde = baldes[d % tamanho]
+        if not balde:
+            d += 1
+            continue
+        baldes[d % tamanho] = []
+        pendentes -= len(balde)
+        remocoes += len(balde)
+        balde.sort()
+
+        i = 0
+        while i < len(balde) or zeros:
+            if zeros and (i == len(balde) or zeros[0] < balde[i]):
+                u = heapq.heappop(zeros)
+            else:
+                u = balde[i]
+                i += 1
+            # Entrada obsoleta: u foi inserido de novo com distância menor
+            if dist[u] != d:
+                continue
+            assentados += 1
+            yield u, d
+
+            for v, peso in adj_list[u]:
+                nova = d + peso
+                if nova < dist[v]:
+                    dist[v] = nova
+                    anterior[v] = u
+                    if peso:
+                        baldes[nova % tamanho].append(v)
+                        pendentes += 1
+                    else:
+                        heapq.heappush(zeros, v)
+                        insercoes_zeros += 1
+        d += 1
+
+    if estatisticas is not None:
+        remocoes += insercoes_zeros
+        estatisticas.somar('insercoes_baldes', remocoes)
+        estatisticas.somar('remocoes_baldes', remocoes)
+        estatisticas.somar('remocoes_obsoletas', remocoes - assentados)
+        estatisticas.somar('relaxamentos', remocoes - 1)
+        estatisticas.somar('vertices_assentados', assentados)
+        estatisticas.somar('baldes_percorridos', d)
+
+def _assentar_heap(adj_list, origem: int, dist: List[float], anterior: List[int]):
+    """Como _assentar_baldes, mas com o heap de dijkstra (qualquer peso não-negativo)"""
+    dist[origem] = 0
+    heap = [(0, origem)]
+    visitados = set()
+    while heap:
+        dist_atual, u = heapq.heappop(heap)
+        if u in visitados:
+            continue
+        visitados.add(u)
+        yield u, dist_atual
+
+        for v, peso in adj_list[u]:
+            nova = dist_atual + peso
+            if nova < dist[v]:
+                dist[v] = nova
+                anterior[v] = u
+                heapq.heappush(heap, (nova, v))
+
+def adjacencia_reversa(grafo: Grafo):
+    """
+    Lista de adjacência do grafo transposto: para cada v, pares (u, peso) das arestas u -> v.
+    Em grafos não-direcionados é a própria adj_list.
+    """
+    if not grafo.direcionado:
+        return grafo.adj_list
+
+    reversa = [[] for _ in range(grafo.num_vertices)]
+    for u, v, peso in grafo.arestas:
+        reversa[v].append((u, peso))
+    return reversa
+
+def dijkstra_ponto_a_ponto(grafo: Grafo, origem: int, destino: int,
+                           estatisticas: Estatisticas = None) -> Tuple[float, List[int], int]:
+    """
+    Dijkstra com parada antecipada para uma única consulta origem -> destino
+
+    Interrompe a busca assim que o destino é extraído do heap (assentado), já que
+    a partir desse ponto dist[destino] não muda mais. Distâncias e predecessores
+    ficam em dicionários, então o custo é proporcional à região explorada e não a |V|.
+
+    Retorna: (distância, caminho, número de vértices assentados)
+    """
+    INF = float('inf')
+
+    dist = {origem: 0}
+    anterior = {origem: -1}
+    heap = [(0, origem)]
+    visitados = set()
+    remocoes = 0
+
+    while heap:
+        dist_atual, u = heapq.heappop(heap)
+        remocoes += 1
+
+        if u in visitados:
+            continue
+
+        visitados.add(u)
+
+        # Destino assentado: distância definitiva
+        if u == destino:
+            _somar_ponto_a_ponto(estatisticas, remocoes, len(heap), len(visitados))
+            caminho = []
+            while u != -1:
+                caminho.append(u)
+                u = anterior[u]
+            caminho.reverse()
+            return dist_atual, caminho, len(visitados)
+
+        for v, peso in grafo.adj_list[u]:
+            nova_dist = dist_atual + peso
+            if nova_dist < dist.get(v, INF):
+                dist[v] = nova_dist
+                anterior[v] = u
+                heapq.heappush(heap, (nova_dist, v))
+
+    _somar_ponto_a_ponto(estatisticas, remocoes, 0, len(visitados))
+    return INF, [], len(visitados)
+
+def _somar_ponto_a_ponto(estatisticas: Estatisticas, remocoes: int, restantes: int, assentados: int):
+    """Contadores de dijkstra_ponto_a_ponto: as inserções são as remoções mais o que sobrou no heap"""
+    if estatisticas is None:
+        return
+    estatisticas.somar('insercoes_heap', remocoes + restantes)
+    estatisticas.somar('remocoes_heap', remocoes)
+    estatisticas.somar('remocoes_obsoletas', remocoes - assentados)
+    estatisticas.somar('relaxamentos', remocoes + restantes - 1)
+    estatisticas.somar('vertices_assentados', assentados)
+
+def dijkstra_bidirecional(grafo: Grafo, origem: int, destino: int,
+                          adj_reversa=None) -> Tuple[float, List[int], int]:
+    """
+    Dijkstra bidirecional: busca para frente a partir da origem e para trás
+    (sobre o grafo transposto) a partir do destino, alternando pelo menor topo de heap.
+
+    melhor guarda o menor custo origem ~> x ~> destino visto ao alcançar um vértice x
+    já rotulado pela outra busca; a execução para quando topo_frente + topo_tras >= melhor,
+    pois nenhum caminho ainda não examinado pode ser mais curto.
+
+    adj_reversa pode ser pré-calculada com adjacencia_reversa() e reutilizada entre consultas.
+
+    Retorna: (distância, caminho, número de vértices assentados)
+    """
+    INF = float('inf')
+
+    if origem == destino:
+        return 0, [origem], 1
+
+    if adj_reversa is None:
+        adj_reversa = adjacencia_reversa(grafo)
+
+    # Índice 0: busca para frente, índice 1: busca para trás
+    adjacencias = (grafo.adj_list, adj_reversa)
+    dist = ({origem: 0}, {destino: 0})
+    anterior = ({origem: -1}, {destino: -1})
+    heaps = ([(0, origem)], [(0, destino)])
+    visitados = (set(), set())
+
+    melhor = INF
+    encontro = -1
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= melhor:
+            break
+
+        # Expande o lado com menor topo
+        lado = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        dist_lado, dist_outro = dist[lado], dist[1 - lado]
+
+        dist_atual, u = heapq.heappop(heaps[lado])
+        if u in visitados[lado]:
+            continue
+        visitados[lado].add(u)
+
+        for v, peso in adjacencias[lado][u]:
+            nova_dist = dist_atual + peso
+            if nova_dist < dist_lado.get(v, INF):
+                dist_lado[v] = nova_dist
+                anterior[lado][v] = u
+                heapq.heappush(heaps[lado], (nova_dist, v))
+
+                # Caminho candidato passando por v, já alcançado pela outra busca
+                if v in dist_outro and nova_dist + dist_outro[v] < melhor:
+                    melhor = nova_dist + dist_outro[v]
+                    encontro = v
+
+    assentados = len(visitados[0]) + len(visitados[1])
+    if encontro == -1:
+        return INF, [], assentados
+
+    # Metade da frente: origem ~> encontro
+    caminho = []
+    u = encontro
+    while u != -1:
+        caminho.append(u)
+        u = anterior[0][u]
+    caminho.reverse()
+
+    # Metade de trás: encontro ~> destino
+    u = anterior[1][encontro]
+    while u != -1:
+        caminho.append(u)
+        u = anterior[1][u]
+
+    return melhor, caminho, assentados
+
+def tabela_distancias(grafo: Grafo, origens: List[int], destinos: List[int]) -> array:
+    """
+    Tabela de distâncias muitos-para-muitos (ex.: robôs x pontos de coleta)
+
+    Em vez da matriz n x n de floyd_warshall, roda uma busca por origem (com a
+    mesma fila que dijkstra escolheria) que para assim que todos os destinos
+    foram assentados. Se houver menos destinos que origens, as buscas partem dos
+    destinos no grafo transposto, o que dá a mesma tabela com menos buscas (com
+    pesos float as somas são feitas na ordem inversa e podem diferir no último bit).
+
+    Retorna: array('d') de len(origens) * len(destinos) posições, em ordem de
+    linhas: a distância de origens[i] a destinos[j] fica em i * len(destinos) + j
+    (inf se não houver caminho)
+    """
+    INF = float('inf')
+    num_destinos = len(destinos)
+    tabela = array('d', [INF]) * (len(origens) * num_destinos)
+
+    reverso = len(destinos) < len(origens)
+    if reverso:
+        adj_list = adjacencia_reversa(grafo)
+        partidas, alvos = destinos, origens
+    else:
+        adj_list = grafo.adj_list
+        partidas, alvos = origens, destinos
+
+    # Posições de cada alvo (um vértice pode aparecer mais de uma vez na lista)
+    indices_alvo = {}
+    for k, alvo in enumerate(alvos):
+        indices_alvo.setdefault(alvo, []).append(k)
+
+    if not indices_alvo:
+        return tabela
+
+    peso_max = limite_pesos_inteiros(grafo)
+    for p, partida in enumerate(partidas):
+        dist = [INF] * grafo.num_vertices
+        anterior = [-1] * grafo.num_vertices
+        if 0 <= peso_max <= LIMITE_BALDES:
+            ordem = _assentar_baldes(adj_list, partida, peso_max, dist, anterior)
+        else:
+            ordem = _assentar_heap(adj_list, partida, dist, anterior)
+
+        restantes = len(indices_alvo)
+        for u, dist_u in ordem:
+            ks = indices_alvo.get(u)
+            if ks is None:
+                continue
+            for k in ks:
+                if reverso:
+                    tabela[k * num_destinos + p] = dist_u
+                else:
+                    tabela[p * num_destinos + k] = dist_u
+            restantes -= 1
+            if not restantes:
+                break
+
+    return tabela
+
+def bellman_ford(grafo: Grafo, origem: int,
+                 estatisticas: Estatisticas = None) -> Tuple[List[int], List[int], bool]:
     """
     Algoritmo de Bellman-Ford para grafos com arestas negativas
     
@@ -77,6 +639,9 @@ def bellman_ford(grafo: Grafo, origem: int) -> Tuple[List[int], List[int], bool]
     6      do if d[v] > d[u] + w(u, v)
     7             then return FALSE
     8  return TRUE
+
+    Para assim que um passe completo não relaxa nenhuma aresta.
+    Com estatisticas, soma passes, arestas examinadas e relaxamentos.
     """
     INF = float('inf')
     
@@ -85,14 +650,30 @@ def bellman_ford(grafo: Grafo, origem: int) -> Tuple[List[int], List[int], bool]
     anterior = [-1] * grafo.num_vertices
     dist[origem] = 0
     
+    passes = 0
+    relaxamentos = 0
+
     # for i ← 1 to |V[G]| - 1 - linha 2
     for i in range(grafo.num_vertices - 1):
+        mudou = False
+        passes += 1
         # for each edge (u, v) ∈ E[G] - linha 3
         for u, v, peso in grafo.arestas:
             # RELAX(u, v, w) - linha 4
             if dist[u] != INF and dist[u] + peso < dist[v]:
                 dist[v] = dist[u] + peso
                 anterior[v] = u
+                mudou = True
+                relaxamentos += 1
+
+        # Passe sem relaxação: as distâncias já são definitivas e a
+        # verificação das linhas 5-7 também não encontraria nada
+        if not mudou:
+            _somar_bellman_ford(estatisticas, grafo, passes, relaxamentos)
+            return dist, anterior, True
+    
+    # A verificação das linhas 5-7 é mais um passe sobre as arestas
+    _somar_bellman_ford(estatisticas, grafo, passes + 1, relaxamentos)
     
     # Verificação de ciclo negativo - linhas 5-7
     # for each edge (u, v) ∈ E[G]
@@ -104,9 +685,132 @@ def bellman_ford(grafo: Grafo, origem: int) -> Tuple[List[int], List[int], bool]
     # return TRUE - linha 8
     return dist, anterior, True
 
-def floyd_warshall(grafo: Grafo) -> List[List[int]]:
+def _somar_bellman_ford(estatisticas: Estatisticas, grafo: Grafo, passes: int, relaxamentos: int):
+    if estatisticas is None:
+        return
+    estatisticas.somar('passes', passes)
+    # Visões de arestas como a de GridImplicito não têm len(): conta-se uma vez,
+    # só quando há estatísticas
+    try:
+        num_arestas = len(grafo.arestas)
+    except TypeError:
+        num_arestas = sum(1 for _ in grafo.arestas)
+    estatisticas.somar('arestas_examinadas', passes * num_arestas)
+    estatisticas.somar('relaxamentos', relaxamentos)
+
+def bellman_ford_fila(grafo: Grafo, origem: int,
+                      estatisticas: Estatisticas = None) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Bellman-Ford orientado por fila (SPFA)
+
+    Só reexamina as arestas de vértices cuja distância mudou, em vez de varrer
+    todas as arestas |V| - 1 vezes; em grafos sem ciclo negativo o custo típico
+    fica próximo de O(E). Vértices não alcançados nunca entram na fila.
+
+    Detecção de ciclo negativo por contagem: arestas[v] guarda quantas arestas tem
+    o caminho que produziu dist[v]. Sem ciclo negativo esse número nunca passa de
+    |V| - 1; ao chegar a |V| o caminho repete um vértice, e o ciclo é procurado
+    nos predecessores.
+
+    Retorna: (dist, anterior, ciclo) com ciclo = [] se não houver ciclo negativo
+    alcançável, ou a lista de vértices do ciclo com o primeiro repetido no fim.
+    Com estatisticas, soma inserções/remoções da fila e relaxamentos.
+    """
+    INF = float('inf')
+    n = grafo.num_vertices
+
+    dist = [INF] * n
+    anterior = [-1] * n
+    arestas_caminho = [0] * n
+    dist[origem] = 0
+
+    fila = deque([origem])
+    na_fila = bytearray(n)
+    na_fila[origem] = 1
+    remocoes = 0
+    relaxamentos = 0
+
+    while fila:
+        u = fila.popleft()
+        na_fila[u] = 0
+        remocoes += 1
+        dist_u = dist[u]
+
+        for v, peso in grafo.adj_list[u]:
+            # RELAX(u, v, w)
+            if dist_u + peso < dist[v]:
+                dist[v] = dist_u + peso
+                anterior[v] = u
+                arestas_caminho[v] = arestas_caminho[u] + 1
+                relaxamentos += 1
+
+                if arestas_caminho[v] >= n:
+                    ciclo = ciclo_em_predecessores(anterior, v)
+                    if ciclo:
+                        _somar_fila(estatisticas, remocoes, len(fila), relaxamentos)
+                        return dist, anterior, ciclo
+
+                if not na_fila[v]:
+                    na_fila[v] = 1
+                    fila.append(v)
+
+    _somar_fila(estatisticas, remocoes, 0, relaxamentos)
+    return dist, anterior, []
+
+def _somar_fila(estatisticas: Estatisticas, remocoes: int, restantes: int, relaxamentos: int):
+    if estatisticas is None:
+        return
+    estatisticas.somar('insercoes_fila', remocoes + restantes)
+    estatisticas.somar('remocoes_fila', remocoes)
+    estatisticas.somar('relaxamentos', relaxamentos)
+
+def ciclo_em_predecessores(anterior: List[int], inicio: int) -> List[int]:
+    """
+    Procura um ciclo no grafo de predecessores, começando por inicio e,
+    se necessário, por todos os vértices.
+    Retorna o ciclo na ordem das arestas (primeiro vértice repetido no fim) ou [].
+    """
+    n = len(anterior)
+    # 0 = não visitado, 1 = no percurso atual, 2 = já resolvido
+    estado = bytearray(n)
+
+    for partida in [inicio] + list(range(n)):
+        percurso = []
+        x = partida
+        while x != -1 and not estado[x]:
+            estado[x] = 1
+            percurso.append(x)
+            x = anterior[x]
+
+        if x != -1 and estado[x] == 1:
+            # Percurso anda para trás (v -> anterior[v]); inverter dá a ordem das arestas
+            ciclo = percurso[percurso.index(x):]
+            ciclo.reverse()
+            return ciclo + [ciclo[0]]
+
+        for y in percurso:
+            estado[y] = 2
+
+    return []
+
+def floyd_warshall(grafo: Grafo, modo: str = 'python', tamanho_bloco: int = 256,
+                   predecessores: bool = False, estatisticas: Estatisticas = None, arquivo: str = None):
     """
     Algoritmo de Floyd-Warshall para todos os pares de vértices
+
+    modo:
+      'python' - laço triplo em Python puro (implementação de referência)
+      'numpy'  - cada passo k é uma atualização min-plus vetorizada da matriz inteira
+      'blocos' - versão em blocos (tiles de tamanho_bloco) para caber em cache com n grande
+      'disco'  - versão em blocos com a matriz em int32 no arquivo indicado, fora da memória;
+                 retorna uma matriz_disco.MatrizDistanciasDisco (pesos inteiros)
+    Os modos 'numpy', 'blocos' e 'disco' exigem NumPy e retornam as mesmas distâncias do modo 'python'.
+
+    Com predecessores=True (modos 'python' e 'numpy') retorna (dist, pred), onde
+    pred[i][j] é o vértice anterior a j no caminho mínimo de i a j (-1 se não
+    houver): cada linha pred[i] é um vetor anterior, e Caminho(pred[i], i, j)
+    recupera qualquer caminho sem refazer buscas.
+    Com estatisticas, soma as iterações de k e, no modo 'python', os relaxamentos.
     
     Pseudocódigo:
     FLOYD-WARSHALL(W)
@@ -118,6 +822,20 @@ def floyd_warshall(grafo: Grafo) -> List[List[int]]:
     6                    do d_ij⁽ᵏ⁾ ← min(d_ij⁽ᵏ⁻¹⁾, d_ik⁽ᵏ⁻¹⁾ + d_kj⁽ᵏ⁻¹⁾)
     7  return D⁽ⁿ⁾
     """
+    if modo in ('blocos', 'disco') and predecessores:
+        raise ValueError(f"O modo '{modo}' do floyd_warshall não calcula predecessores")
+    if modo == 'disco' and arquivo is None:
+        raise ValueError("O modo 'disco' do floyd_warshall exige arquivo")
+    if estatisticas is not None:
+        estatisticas.somar('iteracoes_k', grafo.num_vertices)
+    if modo == 'disco':
+        from matriz_disco import MatrizDistanciasDisco
+        return MatrizDistanciasDisco.construir(grafo, arquivo, 'blocos', tamanho_bloco)
+    if modo in ('numpy', 'blocos'):
+        return _floyd_warshall_numpy(grafo, modo == 'blocos', tamanho_bloco, predecessores)
+    if modo != 'python':
+        raise ValueError(f"Modo desconhecido para floyd_warshall: {modo}")
+
     INF = float('inf')
     n = grafo.num_vertices
     
@@ -134,7 +852,19 @@ def floyd_warshall(grafo: Grafo) -> List[List[int]]:
         dist[u][v] = peso
         if not grafo.direcionado:
             dist[v][u] = peso
+
+    # Π⁽⁰⁾: pred_ij = i se houver aresta (i, j) com i ≠ j; pred_ii = NIL
+    pred = None
+    if predecessores:
+        pred = [[-1] * n for _ in range(n)]
+        for u, v, _ in grafo.arestas:
+            if u == v:
+                continue
+            pred[u][v] = u
+            if not grafo.direcionado:
+                pred[v][u] = v
     
+    relaxamentos = 0
     # for k ← 1 to n - linha 3
     for k in range(n):
         # for i ← 1 to n - linha 4
@@ -144,10 +874,184 @@ def floyd_warshall(grafo: Grafo) -> List[List[int]]:
                 # d_ij⁽ᵏ⁾ ← min(d_ij⁽ᵏ⁻¹⁾, d_ik⁽ᵏ⁻¹⁾ + d_kj⁽ᵏ⁻¹⁾) - linha 6
                 if dist[i][k] + dist[k][j] < dist[i][j]:
                     dist[i][j] = dist[i][k] + dist[k][j]
+                    relaxamentos += 1
+                    # π_ij⁽ᵏ⁾ ← π_kj⁽ᵏ⁻¹⁾; π_ii fica NIL mesmo se um laço positivo
+                    # deixar d_ii acima de 0 e um ciclo por k o "melhorar"
+                    if pred is not None and i != j:
+                        pred[i][j] = pred[k][j]
     
+    if estatisticas is not None:
+        estatisticas.somar('relaxamentos', relaxamentos)
+
     # return D⁽ⁿ⁾ - linha 7
+    if predecessores:
+        return dist, pred
     return dist
 
+def potenciais_johnson(grafo: Grafo) -> Tuple[List[int], bool]:
+    """
+    Potenciais h(v) = δ(s, v) de Johnson, com s um vértice virtual ligado a todos por peso 0
+    Retorna: (h, sem_ciclo_negativo)
+    """
+    n = grafo.num_vertices
+
+    # Bellman-Ford a partir de s: como w(s, v) = 0, basta começar com
+    # h(v) = 0 para todos e relaxar as arestas de G
+    h = [0] * n
+    for _ in range(max(n, 1)):
+        mudou = False
+        for u in range(n):
+            h_u = h[u]
+            for v, peso in grafo.adj_list[u]:
+                if h_u + peso < h[v]:
+                    h[v] = h_u + peso
+                    mudou = True
+        if not mudou:
+            return h, True
+
+    # n passes com relaxação (G' tem n + 1 vértices): existe ciclo negativo
+    return [], False
+
+def reponderar(grafo: Grafo, h: List[int]) -> Grafo:
+    """Grafo direcionado com pesos ŵ(u, v) = w(u, v) + h(u) - h(v), não-negativos para h de Johnson"""
+    reponderado = Grafo(grafo.num_vertices, direcionado=True)
+    for u in range(grafo.num_vertices):
+        for v, peso in grafo.adj_list[u]:
+            reponderado.adicionar_aresta(u, v, peso + h[u] - h[v])
+    return reponderado
+
+def johnson(grafo: Grafo) -> Tuple[List[List[int]], bool]:
+    """
+    Algoritmo de Johnson para todos os pares em grafos esparsos com arestas negativas
+
+    Pseudocódigo:
+    JOHNSON(G)
+    1  G' ← G com um vértice s novo e arestas (s, v) de peso 0 para todo v
+    2  if BELLMAN-FORD(G', w, s) = FALSE
+    3      then ciclo negativo
+    4  for each vertex v ∈ V[G'] do h(v) ← δ(s, v)
+    5  for each edge (u, v) ∈ E[G'] do ŵ(u, v) ← w(u, v) + h(u) - h(v)
+    6  for each vertex u ∈ V[G]
+    7      do DIJKSTRA(G, ŵ, u)
+    8         for each vertex v ∈ V[G] do d_uv ← δ̂(u, v) + h(v) - h(u)
+    9  return D
+
+    O(V·E log V) contra O(V³) do Floyd-Warshall: vale a pena quando E ≪ V².
+    Retorna: (matriz no mesmo formato de floyd_warshall, sem_ciclo_negativo)
+    """
+    INF = float('inf')
+    n = grafo.num_vertices
+
+    # Linhas 1-4
+    h, sem_ciclo_negativo = potenciais_johnson(grafo)
+    if not sem_ciclo_negativo:
+        return [], False
+
+    # Linha 5: pesos reponderados ŵ(u, v) >= 0
+    reponderado = reponderar(grafo, h)
+
+    # Linhas 6-8: Dijkstra de cada origem, desfazendo a reponderação
+    matriz = []
+    for u in range(n):
+        dist, _ = dijkstra(reponderado, u)
+        h_u = h[u]
+        matriz.append([d - h_u + h[v] if d != INF else INF for v, d in enumerate(dist)])
+
+    return matriz, True
+
+def _floyd_warshall_numpy(grafo: Grafo, em_blocos: bool, tamanho_bloco: int, predecessores: bool = False):
+    """Floyd-Warshall sobre uma matriz NumPy float64; converte o resultado para listas"""
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("Os modos 'numpy' e 'blocos' do floyd_warshall exigem NumPy") from None
+
+    INF = float('inf')
+    n = grafo.num_vertices
+
+    # D⁽⁰⁾ ← W (mesma ordem de preenchimento da versão em Python)
+    dist = np.full((n, n), INF)
+    np.fill_diagonal(dist, 0)
+    pesos_inteiros = True
+    for u, v, peso in grafo.arestas:
+        dist[u, v] = peso
+        if not grafo.direcionado:
+            dist[v, u] = peso
+        pesos_inteiros = pesos_inteiros and isinstance(peso, int)
+
+    pred = None
+    if predecessores:
+        pred = np.full((n, n), -1, dtype=np.int64)
+        for u, v, _ in grafo.arestas:
+            # Laços não entram: pred_ii = NIL
+            if u == v:
+                continue
+            pred[u, v] = u
+            if not grafo.direcionado:
+                pred[v, u] = v
+
+    if em_blocos:
+        _floyd_warshall_blocos(np, dist, tamanho_bloco)
+    elif pred is not None:
+        diagonal = np.arange(n)
+        for k in range(n):
+            # Só as células que melhoram recebem o novo valor e o predecessor π_kj
+            candidato = dist[:, k, None] + dist[None, k, :]
+            melhora = candidato < dist
+            dist[melhora] = candidato[melhora]
+            pred[melhora] = np.broadcast_to(pred[k], (n, n))[melhora]
+            # π_ii fica NIL, como na versão em Python
+            pred[diagonal, diagonal] = -1
+    else:
+        for k in range(n):
+            # d_ij ← min(d_ij, d_ik + d_kj) para todos os i, j de uma vez
+            np.minimum(dist, dist[:, k, None] + dist[None, k, :], out=dist)
+
+    linhas = dist.tolist()
+    if pesos_inteiros:
+        linhas = [[int(d) if d != INF else INF for d in linha] for linha in linhas]
+    if pred is not None:
+        return linhas, pred.tolist()
+    return linhas
+
+def _floyd_warshall_blocos(np, dist, b: int):
+    """
+    Floyd-Warshall em blocos (três fases por bloco diagonal K):
+    1. fecha o bloco diagonal (K, K)
+    2. atualiza os blocos da linha K e da coluna K usando (K, K)
+    3. atualiza os demais blocos (I, J) com (I, K) e (K, J), já definitivos nesta rodada
+    Cada atualização mexe apenas em tiles b x b, que cabem em cache.
+    """
+    n = dist.shape[0]
+    blocos = [(ini, min(ini + b, n)) for ini in range(0, n, b)]
+
+    def fechar(destino, coluna_k, linha_k):
+        # Relaxa destino[i, j] por todo k do bloco: coluna_k[:, k] + linha_k[k, :]
+        for k in range(coluna_k.shape[1]):
+            np.minimum(destino, coluna_k[:, k, None] + linha_k[None, k, :], out=destino)
+
+    for k0, k1 in blocos:
+        kk = dist[k0:k1, k0:k1]
+        # Fase 1: bloco diagonal depende apenas de si mesmo
+        fechar(kk, kk, kk)
+
+        # Fase 2: linha e coluna do bloco K
+        for i0, i1 in blocos:
+            if i0 == k0:
+                continue
+            fechar(dist[k0:k1, i0:i1], kk, dist[k0:k1, i0:i1])
+            fechar(dist[i0:i1, k0:k1], dist[i0:i1, k0:k1], kk)
+
+        # Fase 3: demais blocos
+        for i0, i1 in blocos:
+            if i0 == k0:
+                continue
+            coluna_k = dist[i0:i1, k0:k1]
+            for j0, j1 in blocos:
+                if j0 == k0:
+                    continue
+                fechar(dist[i0:i1, j0:j1], coluna_k, dist[k0:k1, j0:j1])
+
 def reconstruir_caminho(anterior: List[int], origem: int, destino: int) -> List[int]:
     """Reconstrói o caminho a partir do vetor de predecessores"""
     caminho = []
@@ -163,4 +1067,86 @@ def reconstruir_caminho(anterior: List[int], origem: int, destino: int) -> List[
     if caminho[0] != origem:
         return []
     
-    return caminho
\ No newline at end of file
+    return caminho
+
+class Caminho:
+    """
+    Caminho origem -> destino lido sob demanda de um vetor de predecessores
+
+    Criar o objeto não percorre nada; os vértices são extraídos de anterior (em
+    O(comprimento)) no primeiro acesso e guardados em um array compacto. Serve
+    para os vetores de dijkstra/bellman_ford e para as linhas de pred de
+    floyd_warshall(predecessores=True).
+
+    Com o grafo, pesos() e arestas() dão o peso de cada trecho procurando v só na
+    lista de adjacência de u (a aresta mais barata u -> v, que é a usada por um
+    caminho mínimo), então detalhar o caminho custa a soma dos graus dos
+    vértices do caminho, e não comprimento x E. Com dist, custo vem de dist[destino].
+    """
+
+    def __init__(self, anterior: List[int], origem: int, destino: int,
+                 grafo: Grafo = None, dist: List[int] = None):
+        self.anterior = anterior
+        self.origem = origem
+        self.destino = destino
+        self.grafo = grafo
+        self.dist = dist
+        self._vertices = None
+
+    def vertices(self) -> array:
+        """Vértices da origem ao destino (vazio se não houver caminho)"""
+        if self._vertices is None:
+            anterior = self.anterior
+            vertices = array('q')
+            atual = self.destino
+            while atual != -1:
+                vertices.append(atual)
+                if len(vertices) > len(anterior):
+                    raise ValueError("Vetor de predecessores com ciclo")
+                atual = anterior[atual]
+            vertices.reverse()
+            if not vertices or vertices[0] != self.origem:
+                vertices = array('q')
+            self._vertices = vertices
+        return self._vertices
+
+    def __iter__(self):
+        return iter(self.vertices())
+
+    def __len__(self):
+        return len(self.vertices())
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def lista(self) -> List[int]:
+        """Mesmo resultado de reconstruir_caminho"""
+        return self.vertices().tolist()
+
+    @property
+    def num_arestas(self) -> int:
+        return max(len(self) - 1, 0)
+
+    @property
+    def custo(self):
+        """Custo total: dist[destino] se dist foi dado, senão a soma de pesos() (inf se não houver caminho)"""
+        if not self:
+            return float('inf')
+        if self.dist is not None:
+            return self.dist[self.destino]
+        return sum(self.pesos())
+
+    def pesos(self):
+        """Gera o peso de cada trecho, em ordem"""
+        for _, _, peso in self.arestas():
+            yield peso
+
+    def arestas(self):
+        """Gera as triplas (u, v, peso) de cada trecho, em ordem"""
+        if self.grafo is None:
+            raise ValueError("Caminho sem grafo: os pesos dos trechos não estão disponíveis")
+        adj_list = self.grafo.adj_list
+        vertices = self.vertices()
+        for i in range(len(vertices) - 1):
+            u, v = vertices[i], vertices[i + 1]
+            yield u, v, min(peso for x, peso in adj_list[u] if x == v)
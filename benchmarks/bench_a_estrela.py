@@ -0,0 +1,51 @@
+"""
+Benchmark: A* no grid contra Dijkstra sobre o grafo de grid_para_grafo
+
+Uso: python benchmarks/bench_a_estrela.py [lado] [consultas]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import dijkstra_ponto_a_ponto
+from busca_grid import a_estrela_grid
+from utils import grid_para_grafo
+
+def main():
+    lado = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    rng = random.Random(3)
+    grid = [[rng.choice('......~~#') for _ in range(lado)] for _ in range(lado)]
+    livres = [(i, j) for i in range(lado) for j in range(lado) if grid[i][j] != '#']
+    pares = [(rng.choice(livres), rng.choice(livres)) for _ in range(consultas)]
+    print(f"Grid {lado}x{lado}, {consultas} consultas aleatórias")
+
+    inicio = time.perf_counter()
+    grafo, pos_para_id, _ = grid_para_grafo(grid)
+    t_conversao = time.perf_counter() - inicio
+
+    assentados_d = assentados_a = 0
+    t_dijkstra = t_a_estrela = 0.0
+    for s, g in pares:
+        inicio = time.perf_counter()
+        custo_d, _, k = dijkstra_ponto_a_ponto(grafo, pos_para_id[s], pos_para_id[g])
+        t_dijkstra += time.perf_counter() - inicio
+        assentados_d += k
+
+        inicio = time.perf_counter()
+        custo_a, _, k = a_estrela_grid(grid, s, g)
+        t_a_estrela += time.perf_counter() - inicio
+        assentados_a += k
+        assert custo_a == custo_d, (s, g, custo_a, custo_d)
+
+    print(f"grid_para_grafo: {t_conversao:.2f} s (uma vez)")
+    print(f"\n{'':12} {'assentados médios':>18} {'ms/consulta':>12}")
+    print(f"{'Dijkstra':12} {assentados_d / consultas:18.0f} {t_dijkstra / consultas * 1000:12.1f}")
+    print(f"{'A*':12} {assentados_a / consultas:18.0f} {t_a_estrela / consultas * 1000:12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark: dijkstra com heap contra a fila de baldes (dijkstra_baldes)
+em grids grandes (custos 1 e 3) e em grafos esparsos com pesos até 30
+
+Uso: python benchmarks/bench_baldes.py [lado do grid]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import dijkstra, GrafoCSR
+from busca_grid import GridImplicito
+from geradores import gerar_grafo_esparso, gerar_grid
+from utils import grid_para_grafo
+
+def cronometrar(funcao, repeticoes: int = 3):
+    """Menor tempo entre as repetições e o último resultado"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+def main():
+    lado = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    grid, _, _ = gerar_grid(lado, lado, semente=0)
+    grafo_grid, _, _ = grid_para_grafo(grid)
+    esparso = gerar_grafo_esparso(lado * lado, arestas_por_vertice=3, semente=0)
+
+    casos = [
+        (f"grid {lado}x{lado} (Grafo)", grafo_grid),
+        (f"grid {lado}x{lado} (implícito)", GridImplicito.de_grid(grid)),
+        (f"esparso n={lado * lado} (Grafo)", esparso),
+        (f"esparso n={lado * lado} (CSR)", GrafoCSR.from_grafo(esparso)),
+    ]
+
+    print(f"{'entrada':32} {'heap (s)':>9} {'baldes (s)':>11} {'ganho':>6}")
+    for nome, grafo in casos:
+        t_heap, r_heap = cronometrar(lambda: dijkstra(grafo, 0, fila='heap'))
+        t_baldes, r_baldes = cronometrar(lambda: dijkstra(grafo, 0, fila='baldes'))
+        assert r_heap == r_baldes, "resultados diferentes"
+        print(f"{nome:32} {t_heap:9.3f} {t_baldes:11.3f} {t_heap / t_baldes:5.2f}x")
+
+if __name__ == "__main__":
+    main()
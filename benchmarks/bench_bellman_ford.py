@@ -0,0 +1,35 @@
+"""
+Benchmark: Bellman-Ford por passes (com parada antecipada) contra a versão com fila (SPFA)
+em grafos direcionados com arestas negativas e sem ciclos negativos
+
+Uso: python benchmarks/bench_bellman_ford.py [n1 n2 ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import bellman_ford, bellman_ford_fila
+from geradores import gerar_grafo_negativo
+
+def main():
+    tamanhos = [int(a) for a in sys.argv[1:]] or [1000, 10_000, 100_000]
+    print(f"{'V':>8} {'E':>8} {'passes (s)':>11} {'fila (s)':>9}")
+    for n in tamanhos:
+        grafo = gerar_grafo_negativo(n, semente=13)
+
+        inicio = time.perf_counter()
+        dist, _, sem_ciclo = bellman_ford(grafo, 0)
+        t_passes = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        dist_fila, _, ciclo = bellman_ford_fila(grafo, 0)
+        t_fila = time.perf_counter() - inicio
+
+        assert sem_ciclo and not ciclo and dist == dist_fila
+        print(f"{n:8} {len(grafo.arestas):8} {t_passes:11.3f} {t_fila:9.3f}")
+
+if __name__ == "__main__":
+    main()
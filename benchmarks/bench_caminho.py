@@ -0,0 +1,59 @@
+"""
+Benchmark: detalhamento por trecho de caminhos longos, com a busca linear em
+grafo.arestas a cada trecho (como o Cenário 2 fazia) contra Caminho.arestas()
+
+Grafo: uma cadeia 0 -> 1 -> ... -> n-1 (o caminho mínimo tem n-1 trechos) mais
+arestas aleatórias mais caras, para que E seja maior que o caminho.
+
+Uso: python benchmarks/bench_caminho.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import Grafo, Caminho, bellman_ford_fila, reconstruir_caminho
+
+def gerar_cadeia(n: int, semente: int = 0) -> Grafo:
+    rng = random.Random(semente)
+    grafo = Grafo(n, direcionado=True)
+    for u in range(n - 1):
+        grafo.adicionar_aresta(u, u + 1, rng.randint(-2, 5))
+    for _ in range(2 * n):
+        u = rng.randrange(n - 1)
+        grafo.adicionar_aresta(u, rng.randrange(u + 1, n), 10 * n)
+    return grafo
+
+def detalhar_linear(grafo: Grafo, caminho):
+    trechos = []
+    for i in range(len(caminho) - 1):
+        u, v = caminho[i], caminho[i + 1]
+        for aresta_u, aresta_v, peso in grafo.arestas:
+            if aresta_u == u and aresta_v == v:
+                trechos.append((u, v, peso))
+                break
+    return trechos
+
+def main():
+    print(f"{'trechos':>8} {'E':>7} {'busca em arestas (s)':>21} {'Caminho.arestas (s)':>20}")
+    for n in (1_000, 2_000, 4_000, 10_000, 100_000):
+        grafo = gerar_cadeia(n)
+        dist, anterior, _ = bellman_ford_fila(grafo, 0)
+
+        inicio = time.perf_counter()
+        trechos = list(Caminho(anterior, 0, n - 1, grafo, dist).arestas())
+        t_caminho = time.perf_counter() - inicio
+
+        if n <= 4_000:
+            inicio = time.perf_counter()
+            assert detalhar_linear(grafo, reconstruir_caminho(anterior, 0, n - 1)) == trechos
+            t_linear = f"{time.perf_counter() - inicio:21.3f}"
+        else:
+            t_linear = f"{'-':>21}"
+        print(f"{len(trechos):8} {len(grafo.arestas):7} {t_linear} {t_caminho:20.4f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark: tempo de carregamento de um arquivo de arestas grande
+Compara o leitor para Grafo, a leitura em bloco para arrays, a montagem do GrafoCSR
+e o carregamento do cache binário mapeado em memória
+
+Uso: python benchmarks/bench_carregamento.py [num_arestas]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import ler_grafo_arquivo, ler_arestas_arquivo, ler_grafo_csr
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return resultado, time.perf_counter() - inicio
+
+def main():
+    num_arestas = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    num_vertices = max(num_arestas // 10, 1)
+    rng = random.Random(17)
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, 'arestas.txt')
+        with open(caminho, 'w') as arquivo:
+            arquivo.write(f"{num_vertices} {num_arestas}\n")
+            for _ in range(num_arestas):
+                arquivo.write(f"{rng.randrange(num_vertices)} {rng.randrange(num_vertices)} "
+                              f"{rng.randint(-10, 30)}\n")
+        tamanho_mb = os.path.getsize(caminho) / 2**20
+        print(f"Arquivo: {num_arestas} arestas, {tamanho_mb:.0f} MB")
+
+        _, t = cronometrar(lambda: ler_grafo_arquivo(caminho, direcionado=True))
+        print(f"  ler_grafo_arquivo (Grafo):           {t:7.2f} s")
+        _, t = cronometrar(lambda: ler_arestas_arquivo(caminho))
+        print(f"  ler_arestas_arquivo (só arrays):     {t:7.2f} s")
+        _, t = cronometrar(lambda: ler_grafo_csr(caminho, direcionado=True))
+        print(f"  ler_grafo_csr, 1ª vez (gera cache):  {t:7.2f} s")
+        grafo, t = cronometrar(lambda: ler_grafo_csr(caminho, direcionado=True))
+        print(f"  ler_grafo_csr, cache mmap:           {t:7.4f} s")
+        del grafo
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark: escolha da estação central por somas_distancias (buscas com poda,
+memória O(n)) contra todas as buscas completas e contra floyd_warshall
+
+Uso: python benchmarks/bench_centralidade.py [n1 n2 ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import floyd_warshall
+from centralidade import somas_distancias
+from geradores import gerar_grafo_esparso
+from instrumentacao import Estatisticas
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, resultado
+
+def main():
+    tamanhos = [int(x) for x in sys.argv[1:]] or [1000, 2000, 5000]
+
+    print(f"{'n':>7} {'sem poda':>10} {'com poda':>10} {'descartadas':>12} {'abandonadas':>12} "
+          f"{'floyd (numpy)':>14} {'matriz n x n':>13}")
+    for n in tamanhos:
+        # Não-direcionado e conexo com alta probabilidade (3 arestas por vértice)
+        grafo = gerar_grafo_esparso(n, 3, direcionado=False, semente=0)
+
+        # Sem poda só nos tamanhos menores: são n buscas completas
+        t_sem = None
+        if n <= 5000:
+            t_sem, esperado = cronometrar(lambda: somas_distancias(grafo, podar=False))
+        estatisticas = Estatisticas('centralidade')
+        t_com, resultado = cronometrar(lambda: somas_distancias(grafo, estatisticas=estatisticas))
+        if t_sem is not None:
+            assert resultado == esperado
+
+        t_floyd = None
+        if n <= 3000:
+            t_floyd, matriz = cronometrar(lambda: floyd_warshall(grafo, modo='numpy'))
+            somas = [sum(linha) for linha in matriz]
+            assert somas[resultado[0][0]] == min(somas)
+
+        contadores = estatisticas.como_dict()['contadores']
+        texto_sem = f"{t_sem:9.2f}s" if t_sem is not None else f"{'-':>10}"
+        texto_floyd = f"{t_floyd:13.2f}s" if t_floyd is not None else f"{'-':>14}"
+        print(f"{n:7} {texto_sem} {t_com:9.2f}s {contadores['origens_descartadas_sem_busca']:12} "
+              f"{contadores['buscas_abandonadas']:12} {texto_floyd} {n * n * 8 / 2**20:10.0f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark: Contraction Hierarchies contra dijkstra_ponto_a_ponto
+Reporta tempo de pré-processamento, número de atalhos e latência por consulta
+em um grafo de grid (parecido com malha viária)
+
+Uso: python benchmarks/bench_contracao.py [lado] [consultas]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import dijkstra_ponto_a_ponto
+from contracao import HierarquiaContracao
+from geradores import gerar_grid
+from utils import grid_para_grafo
+
+def main():
+    lado = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    grid, _, _ = gerar_grid(lado, lado, prob_obstaculo=0.2, semente=4)
+    grafo, _, _ = grid_para_grafo(grid)
+    rng = random.Random(4)
+    pares = [(rng.randrange(grafo.num_vertices), rng.randrange(grafo.num_vertices))
+             for _ in range(consultas)]
+    print(f"Grid {lado}x{lado}: {grafo.num_vertices} vértices, {len(grafo.arestas)} arestas")
+
+    hierarquia = HierarquiaContracao(grafo)
+    print(f"  pré-processamento: {hierarquia.tempo_preprocessamento:.2f} s")
+    print(f"  atalhos criados:   {hierarquia.num_atalhos} "
+          f"({hierarquia.num_atalhos / len(grafo.arestas):.2f} por aresta original)")
+
+    t_ch = t_dij = 0.0
+    assentados_ch = assentados_dij = 0
+    for origem, destino in pares:
+        inicio = time.perf_counter()
+        custo_ch, _ = hierarquia.consultar(origem, destino)
+        t_ch += time.perf_counter() - inicio
+        assentados_ch += hierarquia.ultima_consulta_assentados
+
+        inicio = time.perf_counter()
+        custo_dij, _, assentados = dijkstra_ponto_a_ponto(grafo, origem, destino)
+        t_dij += time.perf_counter() - inicio
+        assentados_dij += assentados
+        assert custo_ch == custo_dij
+
+    print(f"\n{'':26} {'ms/consulta':>12} {'assentados médios':>18}")
+    print(f"{'contraction hierarchies':26} {t_ch / consultas * 1000:12.3f} {assentados_ch / consultas:18.0f}")
+    print(f"{'dijkstra ponto a ponto':26} {t_dij / consultas * 1000:12.3f} {assentados_dij / consultas:18.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: memória por aresta e velocidade de iteração da adjacência
+Compara Grafo (listas de tuplas) com GrafoCSR (buffers array) em grafos sintéticos
+
+Uso: python benchmarks/bench_csr.py [num_vertices] [arestas_por_vertice]
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import Grafo, GrafoCSR, dijkstra
+
+def gerar_arestas(num_vertices: int, arestas_por_vertice: int, semente: int = 42):
+    """Gera arestas aleatórias com pesos inteiros pequenos"""
+    rng = random.Random(semente)
+    return [(u, rng.randrange(num_vertices), rng.randint(1, 30))
+            for u in range(num_vertices) for _ in range(arestas_por_vertice)]
+
+def medir_construcao(construtor):
+    """Retorna (objeto, segundos, bytes alocados) da construção"""
+    # Tempo e memória medidos separadamente: o tracemalloc distorce o tempo
+    inicio = time.perf_counter()
+    objeto = construtor()
+    tempo = time.perf_counter() - inicio
+    del objeto
+    tracemalloc.start()
+    objeto = construtor()
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objeto, tempo, memoria
+
+def construir_grafo(num_vertices, arestas):
+    grafo = Grafo(num_vertices, direcionado=True)
+    for u, v, peso in arestas:
+        grafo.adicionar_aresta(u, v, peso)
+    return grafo
+
+def medir_iteracao(grafo) -> float:
+    """Tempo para percorrer toda a adjacência uma vez"""
+    inicio = time.perf_counter()
+    total = 0
+    adj = grafo.adj_list
+    for u in range(grafo.num_vertices):
+        for v, peso in adj[u]:
+            total += peso
+    return time.perf_counter() - inicio
+
+def main():
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    por_vertice = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    arestas = gerar_arestas(num_vertices, por_vertice)
+    m = len(arestas)
+    print(f"Grafo sintético: {num_vertices} vértices, {m} arestas (direcionado)")
+
+    grafo, t_grafo, mem_grafo = medir_construcao(lambda: construir_grafo(num_vertices, arestas))
+    csr, t_csr, mem_csr = medir_construcao(
+        lambda: GrafoCSR.from_edges(num_vertices, arestas, direcionado=True))
+
+    print(f"\n{'':10} {'build (s)':>10} {'bytes/aresta':>13} {'iteração (ns/aresta)':>21} {'dijkstra (s)':>13}")
+    for nome, g, t, mem in (("Grafo", grafo, t_grafo, mem_grafo), ("GrafoCSR", csr, t_csr, mem_csr)):
+        t_iter = medir_iteracao(g)
+        inicio = time.perf_counter()
+        dijkstra(g, 0)
+        t_dij = time.perf_counter() - inicio
+        print(f"{nome:10} {t:10.3f} {mem / m:13.1f} {t_iter / m * 1e9:21.1f} {t_dij:13.3f}")
+
+if __name__ == "__main__":
+    main()
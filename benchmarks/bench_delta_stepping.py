@@ -0,0 +1,41 @@
+"""
+Benchmark: delta_stepping (uma busca, fronteiras repartidas entre processos)
+contra dijkstra sequencial, por número de processos
+
+Uso: python benchmarks/bench_delta_stepping.py [num_vertices] [p1 p2 ...]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import GrafoCSR, dijkstra
+from paralelo import delta_stepping
+
+def main():
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    contagens = [int(a) for a in sys.argv[2:]] or [1, 2, 4, 8, 16]
+    rng = random.Random(1)
+    arestas = [(u, rng.randrange(num_vertices), rng.randint(1, 30))
+               for u in range(num_vertices) for _ in range(3)]
+    grafo = GrafoCSR.from_edges(num_vertices, arestas, direcionado=False)
+    print(f"{num_vertices} vértices, {len(arestas)} arestas (os.cpu_count() = {os.cpu_count()})")
+
+    inicio = time.perf_counter()
+    esperado, _ = dijkstra(grafo, 0)
+    base = time.perf_counter() - inicio
+    print(f"\ndijkstra sequencial: {base:.2f} s")
+
+    print(f"\n{'processos':>10} {'tempo (s)':>10} {'speedup':>8}")
+    for processos in contagens:
+        inicio = time.perf_counter()
+        dist, _ = delta_stepping(grafo, 0, processos=processos)
+        tempo = time.perf_counter() - inicio
+        assert dist == esperado
+        print(f"{processos:10} {tempo:10.2f} {base / tempo:8.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark: reparo incremental da árvore de caminhos mínimos (ArvoreCaminhos)
+contra refazer dijkstra a cada alteração de peso
+
+Uso: python benchmarks/bench_dinamico.py [num_vertices] [alteracoes]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import dijkstra
+from dinamico import ArvoreCaminhos
+from geradores import gerar_grafo_esparso
+
+def main():
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    alteracoes = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    grafo = gerar_grafo_esparso(num_vertices, arestas_por_vertice=3, semente=21)
+    rng = random.Random(21)
+    arvore = ArvoreCaminhos(grafo, 0)
+    print(f"{num_vertices} vértices, {len(grafo.arestas)} arestas, {alteracoes} alterações de peso")
+
+    t_reparo = 0.0
+    mudaram = 0
+    for _ in range(alteracoes):
+        u, v, peso = rng.choice(grafo.arestas)
+        novo = max(1, peso + rng.choice((-10, -5, 5, 10)))
+        inicio = time.perf_counter()
+        mudaram += arvore.alterar_peso(u, v, novo)
+        t_reparo += time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    referencia, _ = dijkstra(grafo, 0)
+    t_completo = time.perf_counter() - inicio
+    assert referencia == arvore.dist
+
+    print(f"  distâncias alteradas por mudança (média): {mudaram / alteracoes:.1f}")
+    print(f"  reparo incremental: {t_reparo / alteracoes * 1000:8.3f} ms/alteração")
+    print(f"  dijkstra completo:  {t_completo * 1000:8.3f} ms/alteração")
+
+if __name__ == "__main__":
+    main()
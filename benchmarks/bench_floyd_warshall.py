@@ -0,0 +1,39 @@
+"""
+Benchmark: Floyd-Warshall em Python puro, vetorizado (NumPy) e em blocos
+O modo 'python' só roda até n = 300 (O(n³) interpretado)
+
+Uso: python benchmarks/bench_floyd_warshall.py [n1 n2 ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import floyd_warshall
+from geradores import gerar_grafo_esparso
+
+LIMITE_PYTHON = 300
+
+def main():
+    tamanhos = [int(a) for a in sys.argv[1:]] or [200, 500, 1000, 2000]
+    print(f"{'n':>6} {'python (s)':>11} {'numpy (s)':>10} {'blocos (s)':>11}")
+    for n in tamanhos:
+        grafo = gerar_grafo_esparso(n, arestas_por_vertice=2, direcionado=False, semente=5)
+        tempos = {}
+        resultados = {}
+        for modo in ('python', 'numpy', 'blocos'):
+            if modo == 'python' and n > LIMITE_PYTHON:
+                continue
+            inicio = time.perf_counter()
+            resultados[modo] = floyd_warshall(grafo, modo)
+            tempos[modo] = time.perf_counter() - inicio
+        assert resultados['numpy'] == resultados['blocos']
+        if 'python' in resultados:
+            assert resultados['python'] == resultados['numpy']
+        python = f"{tempos['python']:11.2f}" if 'python' in tempos else f"{'-':>11}"
+        print(f"{n:6} {python} {tempos['numpy']:10.2f} {tempos['blocos']:11.2f}")
+
+if __name__ == "__main__":
+    main()
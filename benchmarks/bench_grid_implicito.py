@@ -0,0 +1,64 @@
+"""
+Benchmark: tempo de construção e memória do GridImplicito contra grid_para_grafo
+Gera um arquivo de grid aleatório e mede leitura + conversão de cada abordagem
+
+Uso: python benchmarks/bench_grid_implicito.py [lado]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import dijkstra
+from busca_grid import GridImplicito
+from utils import ler_grid_arquivo, grid_para_grafo
+
+def medir(funcao):
+    """Retorna (resultado, segundos, pico de bytes alocados)"""
+    inicio = time.perf_counter()
+    resultado = funcao()
+    tempo = time.perf_counter() - inicio
+    del resultado
+    tracemalloc.start()
+    resultado = funcao()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, tempo, pico
+
+def main():
+    lado = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rng = random.Random(11)
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as arquivo:
+        arquivo.write(f"{lado} {lado}\n")
+        for _ in range(lado):
+            arquivo.write(''.join(rng.choice('.....~~#') for _ in range(lado)) + "\n")
+        caminho_arquivo = arquivo.name
+
+    try:
+        celulas = lado * lado
+        print(f"Grid {lado}x{lado} ({celulas} células)")
+
+        def classico():
+            grid, _, _ = ler_grid_arquivo(caminho_arquivo)
+            return grid_para_grafo(grid)
+
+        (grafo, _, _), t_classico, m_classico = medir(classico)
+        implicito, t_implicito, m_implicito = medir(lambda: GridImplicito.de_arquivo(caminho_arquivo))
+
+        print(f"\n{'':24} {'construção (s)':>15} {'bytes/célula':>13} {'dijkstra (s)':>13}")
+        for nome, g, t, m in (("ler + grid_para_grafo", grafo, t_classico, m_classico),
+                              ("GridImplicito", implicito, t_implicito, m_implicito)):
+            inicio = time.perf_counter()
+            dijkstra(g, 0 if g is grafo else next(u for u in range(celulas) if implicito.custo(u)))
+            t_dij = time.perf_counter() - inicio
+            print(f"{nome:24} {t:15.3f} {m / celulas:13.1f} {t_dij:13.3f}")
+    finally:
+        os.remove(caminho_arquivo)
+
+if __name__ == "__main__":
+    main()
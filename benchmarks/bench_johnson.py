@@ -0,0 +1,37 @@
+"""
+Benchmark: Johnson contra Floyd-Warshall (NumPy) em grafos esparsos
+com arestas negativas e sem ciclos negativos (E ≈ 3V)
+
+Uso: python benchmarks/bench_johnson.py [n1 n2 ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import floyd_warshall, johnson
+from geradores import gerar_grafo_negativo
+
+def main():
+    tamanhos = [int(a) for a in sys.argv[1:]] or [500, 1000, 2000]
+    print(f"{'V':>6} {'E':>7} {'negativas':>10} {'johnson (s)':>12} {'floyd numpy (s)':>16}")
+    for n in tamanhos:
+        grafo = gerar_grafo_negativo(n, semente=9)
+        negativas = sum(1 for _, _, peso in grafo.arestas if peso < 0)
+
+        inicio = time.perf_counter()
+        matriz, sem_ciclo = johnson(grafo)
+        t_johnson = time.perf_counter() - inicio
+        assert sem_ciclo
+
+        inicio = time.perf_counter()
+        referencia = floyd_warshall(grafo, 'numpy')
+        t_floyd = time.perf_counter() - inicio
+        assert matriz == referencia
+
+        print(f"{n:6} {len(grafo.arestas):7} {negativas:10} {t_johnson:12.2f} {t_floyd:16.2f}")
+
+if __name__ == "__main__":
+    main()
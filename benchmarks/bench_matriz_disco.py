@@ -0,0 +1,81 @@
+"""
+Benchmark: matriz de distâncias de todos os pares fora da memória
+
+Cada construção roda em um processo próprio para medir o pico de memória
+residente (ru_maxrss): MatrizDistanciasDisco por buscas e por Floyd-Warshall em
+tiles, contra floyd_warshall modo 'blocos' com a matriz float64 inteira na
+memória. Depois mede a leitura preguiçosa de linhas e a soma por linha
+(estação central no estilo do Cenário 1) direto do arquivo.
+
+Uso: python benchmarks/bench_matriz_disco.py [n] [tamanho do bloco] [n máximo para a matriz em memória]
+"""
+
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import floyd_warshall
+from geradores import gerar_grafo_esparso
+from matriz_disco import MatrizDistanciasDisco
+
+def pico_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def filho(metodo: str, n: int, tamanho_bloco: int, arquivo: str):
+    """Executado no processo filho: uma construção, imprime tempo e pico de RSS"""
+    grafo = gerar_grafo_esparso(n, 4, direcionado=False, semente=0)
+    base = pico_rss_mb()
+    inicio = time.perf_counter()
+    if metodo == 'memoria':
+        floyd_warshall(grafo, 'blocos', tamanho_bloco)
+    else:
+        MatrizDistanciasDisco.construir(grafo, arquivo, metodo, tamanho_bloco).fechar()
+    print(time.perf_counter() - inicio, base, pico_rss_mb())
+
+def medir(metodo: str, n: int, tamanho_bloco: int, arquivo: str):
+    saida = subprocess.run([sys.executable, os.path.abspath(__file__), '--filho', metodo,
+                            str(n), str(tamanho_bloco), arquivo],
+                           check=True, capture_output=True, text=True).stdout
+    return [float(x) for x in saida.split()]
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    tamanho_bloco = int(sys.argv[2]) if len(sys.argv) > 2 else 512
+    n_memoria = int(sys.argv[3]) if len(sys.argv) > 3 else 3000
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = os.path.join(pasta, "distancias.mdis")
+        casos = [("disco, buscas", 'dijkstra', n), ("disco, tiles", 'blocos', n)]
+        if n <= n_memoria:
+            casos.append(("memória (floyd 'blocos')", 'memoria', n))
+
+        print(f"n = {n}, bloco = {tamanho_bloco}, matriz int32 = {4 * n * n / 2**20:.0f} MB, "
+              f"float64 = {8 * n * n / 2**20:.0f} MB")
+        print(f"{'construção':26} {'tempo (s)':>10} {'RSS extra (MB)':>15}")
+        for nome, metodo, tamanho in casos:
+            duracao, base, pico = medir(metodo, tamanho, tamanho_bloco, arquivo)
+            print(f"{nome:26} {duracao:10.2f} {pico - base:15.1f}")
+
+        with MatrizDistanciasDisco(arquivo) as matriz:
+            rng = random.Random(0)
+            inicio = time.perf_counter()
+            for _ in range(1000):
+                matriz.linha(rng.randrange(n))
+            t_linha = (time.perf_counter() - inicio) / 1000
+            inicio = time.perf_counter()
+            somas = matriz.somas()
+            t_somas = time.perf_counter() - inicio
+        print(f"\nlinha(i) sob demanda: {t_linha * 1000:.2f} ms por linha")
+        print(f"somas de todas as linhas: {t_somas:.2f} s (estação central: vértice {somas.index(min(somas))})")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--filho':
+        filho(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]), sys.argv[5])
+    else:
+        main()
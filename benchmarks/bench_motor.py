@@ -0,0 +1,66 @@
+"""
+Benchmark: dijkstra contra MotorDijkstra (buffers reutilizáveis, heap preguiçoso
+ou indexado) em buscas repetidas de várias origens no mesmo grafo
+
+Reporta ns por aresta relaxada e o pico de memória alocada durante uma busca.
+Pesos reais (float) para que dijkstra use o heap, e não a fila de baldes.
+
+Uso: python benchmarks/bench_motor.py [n] [origens]
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import Grafo, dijkstra
+from motor_dijkstra import MotorDijkstra
+
+def gerar_grafo(n: int, semente: int = 0) -> Grafo:
+    rng = random.Random(semente)
+    grafo = Grafo(n, direcionado=True)
+    for u in range(n):
+        for _ in range(4):
+            grafo.adicionar_aresta(u, rng.randrange(n), rng.uniform(1, 30))
+    return grafo
+
+def pico_memoria(funcao) -> int:
+    tracemalloc.start()
+    funcao()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return pico
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    num_origens = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    grafo = gerar_grafo(n)
+    origens = random.Random(1).sample(range(n), num_origens)
+    arestas_relaxadas = len(grafo.arestas) * num_origens
+
+    motor_heap = MotorDijkstra(grafo)
+    motor_indexado = MotorDijkstra(grafo, fila='indexado')
+    variantes = [
+        ("dijkstra (heap)", lambda s: dijkstra(grafo, s, fila='heap')),
+        ("MotorDijkstra heap", lambda s: motor_heap.caminhos(s, copiar=False)),
+        ("MotorDijkstra indexado", lambda s: motor_indexado.caminhos(s, copiar=False)),
+    ]
+
+    referencia = [dijkstra(grafo, s, fila='heap') for s in origens[:2]]
+    print(f"n={n}, m={len(grafo.arestas)}, {num_origens} origens")
+    print(f"\n{'variante':24} {'total (s)':>10} {'ns/aresta':>10} {'pico (MB)':>10}")
+    for nome, busca in variantes:
+        for s, esperado in zip(origens, referencia):
+            assert busca(s) == esperado, f"{nome}: resultado diferente"
+        inicio = time.perf_counter()
+        for s in origens:
+            busca(s)
+        total = time.perf_counter() - inicio
+        pico = pico_memoria(lambda: busca(origens[0]))
+        print(f"{nome:24} {total:10.3f} {total / arestas_relaxadas * 1e9:10.1f} {pico / 2**20:10.2f}")
+
+if __name__ == "__main__":
+    main()
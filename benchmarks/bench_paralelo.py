@@ -0,0 +1,40 @@
+"""
+Benchmark: vazão de dijkstra_multiplas_origens por número de processos
+
+Uso: python benchmarks/bench_paralelo.py [num_vertices] [num_origens] [p1 p2 ...]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import GrafoCSR
+from paralelo import dijkstra_multiplas_origens
+
+def main():
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    num_origens = int(sys.argv[2]) if len(sys.argv) > 2 else 128
+    contagens = [int(a) for a in sys.argv[3:]] or [1, 2, 4, 8, 16]
+    rng = random.Random(1)
+    arestas = [(u, rng.randrange(num_vertices), rng.randint(1, 30))
+               for u in range(num_vertices) for _ in range(3)]
+    grafo = GrafoCSR.from_edges(num_vertices, arestas, direcionado=False)
+    origens = rng.sample(range(num_vertices), num_origens)
+    print(f"{num_vertices} vértices, {len(arestas)} arestas, {num_origens} origens "
+          f"(os.cpu_count() = {os.cpu_count()})")
+
+    print(f"\n{'processos':>10} {'tempo (s)':>10} {'origens/s':>10} {'speedup':>8}")
+    base = None
+    for processos in contagens:
+        inicio = time.perf_counter()
+        for _ in dijkstra_multiplas_origens(grafo, origens, processos, agregado=True, tamanho_lote=4):
+            pass
+        tempo = time.perf_counter() - inicio
+        base = base or tempo
+        print(f"{processos:10} {tempo:10.2f} {num_origens / tempo:10.1f} {base / tempo:8.2f}")
+
+if __name__ == "__main__":
+    main()
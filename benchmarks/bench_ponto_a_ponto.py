@@ -0,0 +1,47 @@
+"""
+Benchmark: vértices assentados por consulta origem -> destino
+Compara dijkstra completo, dijkstra_ponto_a_ponto e dijkstra_bidirecional
+em um grid aberto convertido com grid_para_grafo
+
+Uso: python benchmarks/bench_ponto_a_ponto.py [lado] [consultas]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import dijkstra, dijkstra_ponto_a_ponto, dijkstra_bidirecional, adjacencia_reversa
+from utils import grid_para_grafo
+
+def main():
+    lado = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    rng = random.Random(7)
+    grid = [[rng.choice('....~#') for _ in range(lado)] for _ in range(lado)]
+    grafo, _, _ = grid_para_grafo(grid)
+    reversa = adjacencia_reversa(grafo)
+    print(f"Grid {lado}x{lado}: {grafo.num_vertices} vértices, {consultas} consultas aleatórias")
+
+    pares = [(rng.randrange(grafo.num_vertices), rng.randrange(grafo.num_vertices))
+             for _ in range(consultas)]
+
+    def completo(o, d):
+        dist, _ = dijkstra(grafo, o)
+        return dist[d], None, grafo.num_vertices
+
+    print(f"\n{'':22} {'assentados médios':>18} {'ms/consulta':>12}")
+    for nome, funcao in (("dijkstra completo", completo),
+                         ("ponto a ponto", lambda o, d: dijkstra_ponto_a_ponto(grafo, o, d)),
+                         ("bidirecional", lambda o, d: dijkstra_bidirecional(grafo, o, d, reversa))):
+        total = 0
+        inicio = time.perf_counter()
+        for o, d in pares:
+            total += funcao(o, d)[2]
+        tempo = time.perf_counter() - inicio
+        print(f"{nome:22} {total / consultas:18.0f} {tempo / consultas * 1000:12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: N robôs no mesmo armazém, com objetivos sorteados entre poucas docas
+
+Compara o fluxo atual do Cenário 3 repetido por robô (ler o arquivo, grid_para_grafo,
+dijkstra_ponto_a_ponto), estimado a partir de uma amostra, com encontrar_caminhos_robos
+em um processo e em vários.
+
+Uso: python benchmarks/bench_robos.py [lado do grid] [robôs] [docas] [processos]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import dijkstra_ponto_a_ponto
+from cenario3 import encontrar_caminhos_robos
+from geradores import gerar_grid, escrever_grid_arquivo
+from utils import ler_grid_arquivo, grid_para_grafo
+
+AMOSTRA_FLUXO_ATUAL = 20
+
+def fluxo_atual(arquivo: str, pos_inicial, pos_objetivo) -> float:
+    """Um robô pelo caminho do Cenário 3: arquivo e grafo refeitos a cada chamada"""
+    grid, _, _ = ler_grid_arquivo(arquivo)
+    grafo, pos_para_id, _ = grid_para_grafo(grid)
+    if pos_inicial not in pos_para_id or pos_objetivo not in pos_para_id:
+        return float('inf')
+    custo, _, _ = dijkstra_ponto_a_ponto(grafo, pos_para_id[pos_inicial], pos_para_id[pos_objetivo])
+    return custo
+
+def main():
+    lado = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    num_robos = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    num_docas = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    processos = int(sys.argv[4]) if len(sys.argv) > 4 else os.cpu_count()
+
+    # Mapa misto (piso difícil '~') e mapa de custo único (só '.' e '#'): no
+    # segundo cada balde do CampoCustos tem uma só frente, o caso mais exigente
+    for nome_mapa, prob_dificil in (("misto", 0.15), ("uniforme", 0.0)):
+        grid, _, _ = gerar_grid(lado, lado, prob_dificil=prob_dificil, semente=0)
+        medir_mapa(f"{nome_mapa}, {lado}x{lado}", grid, lado, num_robos, num_docas, processos)
+
+def medir_mapa(descricao: str, grid, lado: int, num_robos: int, num_docas: int, processos: int):
+    livres = [(i, j) for i in range(lado) for j in range(lado) if grid[i][j] != '#']
+    rng = random.Random(1)
+    docas = rng.sample(livres, num_docas)
+    robos = [(rng.choice(livres), rng.choice(docas)) for _ in range(num_robos)]
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = os.path.join(pasta, "grid.txt")
+        escrever_grid_arquivo(grid, arquivo)
+
+        amostra = robos[:AMOSTRA_FLUXO_ATUAL]
+        inicio = time.perf_counter()
+        esperados = [fluxo_atual(arquivo, s, g) for s, g in amostra]
+        t_por_robo = (time.perf_counter() - inicio) / len(amostra)
+
+        resultados = {}
+        for p in sorted({1, processos}):
+            inicio = time.perf_counter()
+            resultados[p] = encontrar_caminhos_robos(arquivo, robos, processos=p, quieto=True)
+            resultados[p] = (time.perf_counter() - inicio, resultados[p])
+            assert [custo for custo, _ in resultados[p][1][:len(amostra)]] == esperados
+
+    print(f"\nGrid {descricao}, {num_robos} robôs, {num_docas} docas")
+    print(f"Fluxo atual por robô:  {t_por_robo * 1000:9.1f} ms  (x {num_robos} = {t_por_robo * num_robos:.1f} s estimado)")
+    for p, (t, _) in resultados.items():
+        print(f"Lote, {p:2} processo(s):  {t:9.2f} s   ({t_por_robo * num_robos / t:.0f}x mais rápido)")
+
+if __name__ == "__main__":
+    main()
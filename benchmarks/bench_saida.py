@@ -0,0 +1,80 @@
+"""
+Benchmark: gravação de uma matriz de distâncias n x n
+
+Compara, em tempo e pico de memória alocada (tracemalloc), imprimir_matriz para
+/dev/null e json.dumps da matriz inteira com os escritores em fluxo de utils
+(escrever_json e escrever_matriz_binaria), que recebem as linhas de um gerador
+e nunca montam a matriz nem uma string do tamanho dela.
+
+Uso: python benchmarks/bench_saida.py [n] [n máximo para os métodos com a matriz inteira]
+"""
+
+import contextlib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import escrever_json, escrever_matriz_binaria, imprimir_matriz
+
+def linhas_sinteticas(n: int):
+    """Linhas de distâncias inteiras (algumas inalcançáveis) geradas uma a uma"""
+    rng = random.Random(0)
+    base = [rng.randint(1, 500) if rng.random() > 0.01 else float('inf') for _ in range(2 * n)]
+    for i in range(n):
+        linha = base[i % n:i % n + n]
+        linha[i] = 0
+        yield linha
+
+def medir(funcao):
+    """Tempo de uma execução normal e pico de memória de outra, sob tracemalloc"""
+    inicio = time.perf_counter()
+    funcao()
+    duracao = time.perf_counter() - inicio
+    tracemalloc.start()
+    funcao()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duracao, pico / 2**20
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    n_inteira = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    with tempfile.TemporaryDirectory() as pasta:
+        def json_fluxo(tamanho):
+            with open(os.path.join(pasta, "m.json"), 'w') as arquivo:
+                escrever_json({'matriz_distancias': linhas_sinteticas(tamanho)}, arquivo)
+
+        def binario_fluxo(tamanho):
+            escrever_matriz_binaria(linhas_sinteticas(tamanho), os.path.join(pasta, "m.bin"), tamanho)
+
+        def json_inteiro(tamanho):
+            matriz = list(linhas_sinteticas(tamanho))
+            texto = json.dumps({'matriz_distancias': [[d if d != float('inf') else None for d in linha]
+                                                      for linha in matriz]})
+            with open(os.path.join(pasta, "m_inteira.json"), 'w') as arquivo:
+                arquivo.write(texto)
+
+        def texto_impresso(tamanho):
+            matriz = list(linhas_sinteticas(tamanho))
+            with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+                imprimir_matriz(matriz, "Matriz")
+
+        casos = [("escrever_json (fluxo)", json_fluxo, n),
+                 ("escrever_matriz_binaria", binario_fluxo, n),
+                 ("json.dumps da matriz", json_inteiro, min(n, n_inteira)),
+                 ("imprimir_matriz", texto_impresso, min(n, n_inteira))]
+
+        print(f"{'método':26} {'n':>6} {'tempo (s)':>10} {'pico (MB)':>10}")
+        for nome, funcao, tamanho in casos:
+            duracao, pico = medir(lambda: funcao(tamanho))
+            print(f"{nome:26} {tamanho:6} {duracao:10.2f} {pico:10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Gerador de carga para servidor.py: clientes simultâneos em localhost medindo
+latência (p50/p99) e consultas por segundo, com e sem agrupamento de consultas
+
+Cada cliente envia uma consulta por vez e espera a resposta (laço fechado).
+As origens são sorteadas de um conjunto "quente" pequeno (depósitos), o caso em
+que o agrupamento e o cache fazem diferença; os destinos são uniformes.
+
+Uso: python benchmarks/bench_servidor.py [clientes] [consultas por cliente] [origens quentes] [n]
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from busca_grid import GridImplicito
+from cache_consultas import CacheConsultas
+from geradores import gerar_grafo_esparso, gerar_grid
+from servidor import ServicoRotas
+
+def percentil(valores, p: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p * len(ordenados)))]
+
+async def cliente(porta: int, consultas: list, latencias: list):
+    leitor, escritor = await asyncio.open_connection('127.0.0.1', porta)
+    for consulta in consultas:
+        inicio = time.perf_counter()
+        escritor.write(json.dumps(consulta).encode() + b'\n')
+        await escritor.drain()
+        resposta = json.loads(await leitor.readline())
+        latencias.append(time.perf_counter() - inicio)
+        assert resposta['id'] == consulta['id'] and 'erro' not in resposta, resposta
+    escritor.close()
+    await escritor.wait_closed()
+
+async def rodada(servico: ServicoRotas, consultas_por_cliente: list) -> dict:
+    servidor = await servico.iniciar(porta=0)
+    porta = servidor.sockets[0].getsockname()[1]
+    latencias = []
+    async with servidor:
+        inicio = time.perf_counter()
+        await asyncio.gather(*(cliente(porta, consultas, latencias) for consultas in consultas_por_cliente))
+        duracao = time.perf_counter() - inicio
+    return {
+        'qps': len(latencias) / duracao,
+        'p50_ms': percentil(latencias, 0.50) * 1000,
+        'p99_ms': percentil(latencias, 0.99) * 1000,
+        **servico.estatisticas(),
+    }
+
+def gerar_consultas(rng: random.Random, clientes: int, por_cliente: int, quentes: int,
+                    n: int, grid: GridImplicito) -> list:
+    origens = rng.sample(range(n), quentes)
+    livres = [u for u in range(grid.num_vertices) if grid.custo(u)]
+    origens_grid = rng.sample(livres, quentes)
+    consultas = []
+    for c in range(clientes):
+        lista = []
+        for i in range(por_cliente):
+            id_consulta = c * por_cliente + i
+            if rng.random() < 0.8:
+                lista.append({'id': id_consulta, 'grafo': 'cidade', 'algoritmo': 'dijkstra',
+                              'origem': rng.choice(origens), 'destino': rng.randrange(n)})
+            else:
+                lista.append({'id': id_consulta, 'grafo': 'armazem', 'algoritmo': 'grid',
+                              'origem': list(grid.posicao(rng.choice(origens_grid))),
+                              'destino': list(grid.posicao(rng.choice(livres)))})
+        consultas.append(lista)
+    return consultas
+
+def main():
+    clientes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    por_cliente = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    quentes = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    n = int(sys.argv[4]) if len(sys.argv) > 4 else 20000
+
+    grafo = gerar_grafo_esparso(n, 3, direcionado=False, semente=0)
+    grid = GridImplicito.de_grid(gerar_grid(150, 150, semente=0)[0])
+    consultas = gerar_consultas(random.Random(1), clientes, por_cliente, quentes, n, grid)
+    print(f"{clientes} clientes x {por_cliente} consultas, {quentes} origens quentes, "
+          f"grafo com {n} vértices e grid 150x150")
+
+    print(f"\n{'configuração':22} {'consultas/s':>12} {'p50 (ms)':>9} {'p99 (ms)':>9} {'buscas':>7} "
+          f"{'agrupadas':>10} {'cache':>6}")
+    configuracoes = [
+        ("sem agrupamento", False, None),
+        ("agrupamento", True, None),
+        ("agrupamento + cache", True, CacheConsultas()),
+    ]
+    for nome, coalescer, cache in configuracoes:
+        servico = ServicoRotas(coalescer=coalescer, cache=cache)
+        servico.registrar_grafo('cidade', grafo)
+        servico.registrar_grid('armazem', grid)
+        r = asyncio.run(rodada(servico, consultas))
+        servico.executor.shutdown()
+        print(f"{nome:22} {r['qps']:12.1f} {r['p50_ms']:9.1f} {r['p99_ms']:9.1f} "
+              f"{r['buscas']:7} {r['agrupadas']:10} {r['acertos_cache']:6}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: tabela de distâncias S x T (tabela_distancias e HierarquiaContracao)
+contra S buscas dijkstra completas e contra floyd_warshall
+
+Uso: python benchmarks/bench_tabela.py [lado do grid] [S] [T]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import dijkstra, floyd_warshall, tabela_distancias
+from contracao import HierarquiaContracao
+from geradores import gerar_grid
+from utils import grid_para_grafo
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, resultado
+
+def main():
+    lado = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    num_origens = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    num_destinos = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    grid, _, _ = gerar_grid(lado, lado, semente=0)
+    grafo, _, _ = grid_para_grafo(grid)
+    t_pre, hierarquia = cronometrar(lambda: HierarquiaContracao(grafo))
+    print(f"Grid {lado}x{lado}: {grafo.num_vertices} vértices, tabela {num_origens}x{num_destinos}")
+    print(f"Pré-processamento da HierarquiaContracao: {t_pre:.2f} s")
+
+    # Espalhados: pontos em todo o grid; regionais: só na faixa de cima (10% dos vértices)
+    rng = random.Random(1)
+    regiao = grafo.num_vertices // 10
+    casos = [
+        ("espalhados", rng.sample(range(grafo.num_vertices), num_origens),
+         rng.sample(range(grafo.num_vertices), num_destinos)),
+        ("regionais", rng.sample(range(regiao), num_origens), rng.sample(range(regiao), num_destinos)),
+    ]
+
+    print(f"\n{'pontos':11} {'S x dijkstra':>13} {'tabela_distancias':>18} {'hierarquia':>11}")
+    for nome, origens, destinos in casos:
+        def dijkstras_completos():
+            linhas = [dijkstra(grafo, s)[0] for s in origens]
+            return [linha[t] for linha in linhas for t in destinos]
+
+        t_dijkstra, esperado = cronometrar(dijkstras_completos)
+        t_tabela, tabela = cronometrar(lambda: tabela_distancias(grafo, origens, destinos))
+        t_ch, tabela_ch = cronometrar(lambda: hierarquia.tabela_distancias(origens, destinos))
+        assert list(tabela) == esperado and list(tabela_ch) == esperado
+        print(f"{nome:11} {t_dijkstra:13.3f} {t_tabela:18.3f} {t_ch:11.3f}")
+
+    if grafo.num_vertices <= 3000:
+        t_floyd, _ = cronometrar(lambda: floyd_warshall(grafo, modo='numpy'))
+        print(f"\nfloyd_warshall (numpy), matriz completa: {t_floyd:.3f} s")
+
+if __name__ == "__main__":
+    main()
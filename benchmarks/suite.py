@@ -0,0 +1,152 @@
+"""
+Suíte de benchmarks para acompanhamento de regressões de desempenho
+
+Gera entradas sintéticas com semente fixa (geradores.py), cronometra dijkstra,
+bellman_ford, floyd_warshall e grid_para_grafo em vários tamanhos e grava os
+resultados em JSON ou CSV, junto com os metadados da execução (versão do
+Python, plataforma, commit), para comparação entre versões.
+
+Uso:
+  python benchmarks/suite.py                          # perfil rápido, tabela no terminal
+  python benchmarks/suite.py --perfil completo --saida resultados.json
+  python benchmarks/suite.py --algoritmos dijkstra,bellman_ford --saida r.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from algoritmos import dijkstra, bellman_ford, floyd_warshall
+from geradores import gerar_grafo_esparso, gerar_grafo_denso, gerar_grafo_negativo, gerar_grid
+from utils import grid_para_grafo
+
+# Tamanhos por perfil: n (vértices) para grafos, lado para grids
+PERFIS = {
+    'rapido': {
+        'dijkstra': [1_000, 10_000],
+        'bellman_ford': [1_000, 10_000],
+        'floyd_warshall': [50, 100],
+        'grid_para_grafo': [50, 100],
+    },
+    'completo': {
+        'dijkstra': [10_000, 100_000, 1_000_000],
+        'bellman_ford': [10_000, 100_000],
+        'floyd_warshall': [100, 200, 400],
+        'grid_para_grafo': [200, 500, 1_000],
+    },
+}
+
+def caso_dijkstra(n: int, semente: int):
+    grafo = gerar_grafo_esparso(n, arestas_por_vertice=3, semente=semente)
+    return 'esparso', len(grafo.arestas), lambda: dijkstra(grafo, 0)
+
+def caso_bellman_ford(n: int, semente: int):
+    grafo = gerar_grafo_negativo(n, arestas_por_vertice=3, semente=semente)
+    return 'negativo', len(grafo.arestas), lambda: bellman_ford(grafo, 0)
+
+def caso_floyd_warshall(n: int, semente: int):
+    grafo = gerar_grafo_denso(n, densidade=0.3, semente=semente)
+    return 'denso', len(grafo.arestas), lambda: floyd_warshall(grafo)
+
+def caso_grid_para_grafo(lado: int, semente: int):
+    grid, _, _ = gerar_grid(lado, lado, semente=semente)
+    return 'grid', lado * lado, lambda: grid_para_grafo(grid)
+
+CASOS = {
+    'dijkstra': caso_dijkstra,
+    'bellman_ford': caso_bellman_ford,
+    'floyd_warshall': caso_floyd_warshall,
+    'grid_para_grafo': caso_grid_para_grafo,
+}
+
+def metadados() -> dict:
+    """Informações do ambiente gravadas junto com os resultados"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=RAIZ, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'data': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'processador': platform.processor() or platform.machine(),
+        'commit': commit,
+    }
+
+def executar(algoritmos, perfil: str, repeticoes: int, semente: int):
+    """Roda os casos e produz um dicionário por (algoritmo, tamanho)"""
+    for algoritmo in algoritmos:
+        for n in PERFIS[perfil][algoritmo]:
+            entrada, m, funcao = CASOS[algoritmo](n, semente)
+            tempos = []
+            for _ in range(repeticoes):
+                inicio = time.perf_counter()
+                funcao()
+                tempos.append(time.perf_counter() - inicio)
+            yield {
+                'algoritmo': algoritmo,
+                'entrada': entrada,
+                'n': n,
+                'm': m,
+                'repeticoes': repeticoes,
+                'minimo_s': min(tempos),
+                'mediana_s': statistics.median(tempos),
+                'tempos_s': tempos,
+            }
+
+def gravar(resultados, meta: dict, caminho: str):
+    """Grava em JSON (resultados + metadados) ou CSV (uma linha por caso), pela extensão"""
+    if caminho.endswith('.csv'):
+        campos = ['algoritmo', 'entrada', 'n', 'm', 'repeticoes', 'minimo_s', 'mediana_s',
+                  'commit', 'python']
+        with open(caminho, 'w', newline='') as arquivo:
+            escritor = csv.DictWriter(arquivo, fieldnames=campos, extrasaction='ignore')
+            escritor.writeheader()
+            for resultado in resultados:
+                escritor.writerow({**resultado, 'commit': meta['commit'], 'python': meta['python']})
+    else:
+        with open(caminho, 'w') as arquivo:
+            json.dump({'metadados': meta, 'resultados': resultados}, arquivo, indent=2)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks dos algoritmos de caminho mínimo")
+    parser.add_argument('--perfil', choices=sorted(PERFIS), default='rapido')
+    parser.add_argument('--algoritmos', default=','.join(CASOS),
+                        help="lista separada por vírgulas (padrão: todos)")
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--saida', help="arquivo .json ou .csv para os resultados")
+    args = parser.parse_args()
+
+    algoritmos = [a.strip() for a in args.algoritmos.split(',') if a.strip()]
+    desconhecidos = [a for a in algoritmos if a not in CASOS]
+    if desconhecidos:
+        parser.error(f"algoritmos desconhecidos: {', '.join(desconhecidos)}")
+
+    meta = metadados()
+    print(f"Perfil {args.perfil}, {args.repeticoes} repetições, Python {meta['python']}")
+    print(f"\n{'algoritmo':16} {'entrada':9} {'n':>9} {'m':>10} {'mínimo (s)':>11} {'mediana (s)':>12}")
+
+    resultados = []
+    for resultado in executar(algoritmos, args.perfil, args.repeticoes, args.semente):
+        resultados.append(resultado)
+        print(f"{resultado['algoritmo']:16} {resultado['entrada']:9} {resultado['n']:9} "
+              f"{resultado['m']:10} {resultado['minimo_s']:11.4f} {resultado['mediana_s']:12.4f}")
+
+    if args.saida:
+        gravar(resultados, meta, args.saida)
+        print(f"\nResultados gravados em {args.saida}")
+
+if __name__ == "__main__":
+    main()
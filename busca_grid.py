@@ -0,0 +1,431 @@
+"""
+Buscas que operam diretamente sobre as coordenadas do grid do armazém
+
+Diferente do Cenário 3, que converte o grid em um Grafo genérico, aqui as
+células são indexadas por i * colunas + j e a geometria do grid é usada
+para guiar a busca.
+"""
+
+import heapq
+import os
+from array import array
+from multiprocessing import Pool
+from typing import List, Tuple, Union
+
+from utils import obter_custo_celula, ler_grid_compacto
+
+# NumPy é opcional: quando disponível, CampoCustos propaga frentes inteiras por vez
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Direções: Norte, Sul, Leste, Oeste
+DIRECOES = [(-1, 0), (1, 0), (0, 1), (0, -1)]
+
+# Menor grupo de robôs com o mesmo objetivo que justifica um CampoCustos do grid
+# inteiro; grupos menores usam a_estrela_grid, que explora só parte do grid
+MIN_ROBOS_CAMPO = 2
+
+# Grid recebido por cada processo do pool de rotear_robos
+_grid_trabalhador = None
+
+def tabela_custos() -> bytearray:
+    """Custo de entrar em uma célula indexado pelo código do caractere; 0 marca obstáculo"""
+    tabela = bytearray(256)
+    for codigo in range(256):
+        celula = chr(codigo)
+        if celula != '#':
+            tabela[codigo] = obter_custo_celula(celula)
+    return tabela
+
+class _AdjacenciaGrid:
+    """Visão de adj_list: adj_list[u] gera os pares (v, custo) calculados na hora"""
+    __slots__ = ('_grid',)
+
+    def __init__(self, grid: 'GridImplicito'):
+        self._grid = grid
+
+    def __len__(self):
+        return self._grid.num_vertices
+
+    def __getitem__(self, u: int):
+        return self._grid.vizinhos(u)
+
+class _ArestasGrid:
+    """Visão de arestas: itera triplas (u, v, custo) de todas as células"""
+    __slots__ = ('_grid',)
+
+    def __init__(self, grid: 'GridImplicito'):
+        self._grid = grid
+
+    def __iter__(self):
+        vizinhos = self._grid.vizinhos
+        for u in range(self._grid.num_vertices):
+            for v, custo in vizinhos(u):
+                yield u, v, custo
+
+class GridImplicito:
+    """
+    Grafo implícito de um grid: nenhuma aresta é materializada
+
+    O único estado é o buffer celulas (1 byte por célula, código do caractere)
+    e uma tabela de 256 custos. O vértice da célula (i, j) é i * colunas + j;
+    obstáculos são vértices isolados. Vizinhos e custos são calculados sob demanda,
+    e adj_list/arestas têm a mesma interface de Grafo, então dijkstra e as demais
+    buscas aceitam o grid diretamente.
+    """
+
+    def __init__(self, celulas: bytearray, linhas: int, colunas: int,
+                 pos_inicial: Tuple[int, int] = None, pos_objetivo: Tuple[int, int] = None):
+        self.celulas = celulas
+        self.linhas = linhas
+        self.colunas = colunas
+        self.pos_inicial = pos_inicial
+        self.pos_objetivo = pos_objetivo
+        self.num_vertices = linhas * colunas
+        self.direcionado = True
+        self.tabela = tabela_custos()
+        # Limite dos pesos para a fila de baldes de dijkstra (limite_pesos_inteiros)
+        self._limite_pesos = max(self.tabela)
+        # Menor custo de célula transitável presente no grid (heurística do A*),
+        # calculado uma vez: percorre o buffer inteiro
+        self.custo_min = min((self.tabela[c] for c in set(celulas) if self.tabela[c] > 0), default=1)
+        self.adj_list = _AdjacenciaGrid(self)
+        self.arestas = _ArestasGrid(self)
+
+    @classmethod
+    def de_arquivo(cls, nome_arquivo: str) -> 'GridImplicito':
+        """Lê o arquivo do grid direto para o buffer compacto"""
+        celulas, linhas, colunas, pos_inicial, pos_objetivo = ler_grid_compacto(nome_arquivo)
+        return cls(celulas, linhas, colunas, pos_inicial, pos_objetivo)
+
+    @classmethod
+    def de_grid(cls, grid: List[List[str]]) -> 'GridImplicito':
+        """Converte o grid em lista de listas retornado por ler_grid_arquivo"""
+        celulas = bytearray(''.join(''.join(linha) for linha in grid), 'latin-1')
+        colunas = len(grid[0])
+        inicio, objetivo = celulas.find(b'S'), celulas.find(b'G')
+        return cls(celulas, len(grid), colunas,
+                   divmod(inicio, colunas) if inicio != -1 else None,
+                   divmod(objetivo, colunas) if objetivo != -1 else None)
+
+    def indice(self, pos: Tuple[int, int]) -> int:
+        """ID do vértice da posição (linha, coluna)"""
+        return pos[0] * self.colunas + pos[1]
+
+    def contem(self, pos: Tuple[int, int]) -> bool:
+        """Se pos é uma posição (linha, coluna) dentro do grid"""
+        return 0 <= pos[0] < self.linhas and 0 <= pos[1] < self.colunas
+
+    def posicao(self, u: int) -> Tuple[int, int]:
+        """Posição (linha, coluna) do vértice u"""
+        return divmod(u, self.colunas)
+
+    def custo(self, u: int) -> int:
+        """Custo de entrar na célula u (0 se for obstáculo)"""
+        return self.tabela[self.celulas[u]]
+
+    def vizinhos(self, u: int):
+        """Gera (v, custo) para os vizinhos transitáveis de u em N, S, L, O"""
+        celulas, tabela, colunas = self.celulas, self.tabela, self.colunas
+        if not tabela[celulas[u]]:
+            return
+        i, j = divmod(u, colunas)
+        if i > 0:
+            custo = tabela[celulas[u - colunas]]
+            if custo:
+                yield u - colunas, custo
+        if i < self.linhas - 1:
+            custo = tabela[celulas[u + colunas]]
+            if custo:
+                yield u + colunas, custo
+        if j < colunas - 1:
+            custo = tabela[celulas[u + 1]]
+            if custo:
+                yield u + 1, custo
+        if j > 0:
+            custo = tabela[celulas[u - 1]]
+            if custo:
+                yield u - 1, custo
+
+def a_estrela_grid(grid: Union[List[List[str]], GridImplicito], pos_inicial: Tuple[int, int],
+                   pos_objetivo: Tuple[int, int]) -> Tuple[float, List[Tuple[int, int]], int]:
+    """
+    A* no grid com heurística de Manhattan
+
+    h(c) = manhattan(c, G) * custo_min, onde custo_min é o menor custo de célula
+    presente no grid (GridImplicito.custo_min). Cada movimento custa pelo menos custo_min
+    e altera a distância de Manhattan em exatamente 1, então h é admissível e
+    consistente: o custo retornado é o mesmo do Dijkstra.
+    Aceita o grid de ler_grid_arquivo ou um GridImplicito já carregado.
+
+    Retorna: (custo, caminho em posições (linha, coluna), número de células assentadas)
+    """
+    INF = float('inf')
+    if not isinstance(grid, GridImplicito):
+        grid = GridImplicito.de_grid(grid)
+    linhas, colunas = grid.linhas, grid.colunas
+    celulas, tabela = grid.celulas, grid.tabela
+
+    custo_min = grid.custo_min
+    gi, gj = pos_objetivo
+    origem = pos_inicial[0] * colunas + pos_inicial[1]
+    objetivo = gi * colunas + gj
+
+    if not tabela[celulas[origem]] or not tabela[celulas[objetivo]]:
+        return INF, [], 0
+
+    g = {origem: 0}
+    anterior = {origem: -1}
+    h0 = (abs(pos_inicial[0] - gi) + abs(pos_inicial[1] - gj)) * custo_min
+    # Entradas (f, h, célula): em empates de f prefere a célula mais próxima do objetivo
+    heap = [(h0, h0, origem)]
+    visitados = set()
+
+    while heap:
+        _, _, u = heapq.heappop(heap)
+
+        if u in visitados:
+            continue
+        visitados.add(u)
+
+        if u == objetivo:
+            caminho = []
+            while u != -1:
+                caminho.append(divmod(u, colunas))
+                u = anterior[u]
+            caminho.reverse()
+            return g[objetivo], caminho, len(visitados)
+
+        i, j = divmod(u, colunas)
+        g_u = g[u]
+        for di, dj in DIRECOES:
+            ni, nj = i + di, j + dj
+            if 0 <= ni < linhas and 0 <= nj < colunas:
+                v = ni * colunas + nj
+                custo = tabela[celulas[v]]
+                if custo and g_u + custo < g.get(v, INF):
+                    g[v] = g_u + custo
+                    anterior[v] = u
+                    h = (abs(ni - gi) + abs(nj - gj)) * custo_min
+                    heapq.heappush(heap, (g_u + custo + h, h, v))
+
+    return INF, [], len(visitados)
+
+class CampoCustos:
+    """
+    Custo de cada célula até o objetivo, calculado de uma vez para vários robôs
+
+    campo[u] é o custo do caminho mínimo da célula u até o objetivo (soma dos
+    custos das células em que se entra, como em a_estrela_grid), ou -1 se o
+    objetivo for inalcançável a partir de u (ou u for obstáculo).
+
+    A propagação parte do objetivo em frentes de onda (fila de baldes de Dial):
+    todas as células com campo d são assentadas juntas, e cada vizinha transitável
+    c de uma célula n da frente recebe d + custo(n), já que ir de c para n custa
+    custo(n). Com NumPy cada frente é processada com operações vetorizadas sobre o
+    buffer de células do GridImplicito (sem cópia); sem NumPy o mesmo algoritmo
+    roda célula a célula.
+
+    O caminho de qualquer robô sai por descida de gradiente (caminho), sem nova busca.
+    """
+
+    def __init__(self, grid: Union[List[List[str]], GridImplicito], pos_objetivo: Tuple[int, int] = None,
+                 modo: str = 'auto'):
+        if not isinstance(grid, GridImplicito):
+            grid = GridImplicito.de_grid(grid)
+        if pos_objetivo is None:
+            pos_objetivo = grid.pos_objetivo
+        if modo == 'auto':
+            modo = 'numpy' if np is not None else 'python'
+        if modo not in ('numpy', 'python'):
+            raise ValueError(f"Modo desconhecido para CampoCustos: {modo}")
+
+        self.grid = grid
+        self.pos_objetivo = pos_objetivo
+        objetivo = grid.indice(pos_objetivo)
+        if modo == 'numpy':
+            self.campo = self._propagar_numpy(objetivo)
+        else:
+            self.campo = self._propagar_python(objetivo)
+
+    def custo(self, pos: Tuple[int, int]) -> float:
+        """Custo da posição até o objetivo (inf se inalcançável)"""
+        valor = int(self.campo[self.grid.indice(pos)])
+        return valor if valor >= 0 else float('inf')
+
+    def caminho(self, pos_inicial: Tuple[int, int]) -> Tuple[float, List[Tuple[int, int]]]:
+        """
+        Caminho mínimo de pos_inicial ao objetivo por descida de gradiente: a cada
+        passo vai para a primeira vizinha (na ordem de DIRECOES) com
+        custo(vizinha) + campo[vizinha] == campo[atual]
+
+        Retorna: (custo, caminho em posições (linha, coluna)), ou (inf, []) se inalcançável
+        """
+        grid, campo = self.grid, self.campo
+        celulas, tabela, colunas, linhas = grid.celulas, grid.tabela, grid.colunas, grid.linhas
+        u = grid.indice(pos_inicial)
+        restante = int(campo[u])
+        if restante < 0:
+            return float('inf'), []
+
+        custo_total = restante
+        caminho = [grid.posicao(u)]
+        while restante:
+            i, j = divmod(u, colunas)
+            for di, dj in DIRECOES:
+                ni, nj = i + di, j + dj
+                if 0 <= ni < linhas and 0 <= nj < colunas:
+                    v = ni * colunas + nj
+                    custo = tabela[celulas[v]]
+                    if custo and int(campo[v]) == restante - custo:
+                        break
+            u, restante = v, restante - custo
+            caminho.append((ni, nj))
+        return custo_total, caminho
+
+    def _propagar_numpy(self, objetivo: int):
+        grid = self.grid
+        n, colunas = grid.num_vertices, grid.colunas
+        custos = np.frombuffer(grid.tabela, dtype=np.uint8)[np.frombuffer(grid.celulas, dtype=np.uint8)]
+        peso_max = int(custos.max(initial=0))
+        tipo = np.int32 if peso_max * n < 2 ** 31 - 1 else np.int64
+        sentinela = np.iinfo(tipo).max
+        campo = np.full(n, sentinela, dtype=tipo)
+        if n == 0 or not custos[objetivo]:
+            campo[:] = -1
+            return campo
+
+        valores_custo = [int(c) for c in np.unique(custos) if c]
+        tamanho = peso_max + 1
+        baldes = [[] for _ in range(tamanho)]
+        campo[objetivo] = 0
+        baldes[0].append(np.array([objetivo], dtype=np.int64))
+        pendentes = 1
+        d = 0
+        while pendentes:
+            balde = baldes[d % tamanho]
+            if not balde:
+                d += 1
+                continue
+            baldes[d % tamanho] = []
+            pendentes -= len(balde)
+            frente = np.unique(np.concatenate(balde)) if len(balde) > 1 else balde[0]
+            frente = frente[campo[frente] == d]
+
+            custos_frente = custos[frente]
+            for custo in valores_custo:
+                celulas = frente[custos_frente == custo] if len(valores_custo) > 1 else frente
+                if not len(celulas):
+                    continue
+                coluna = celulas % colunas
+                vizinhas = np.concatenate((
+                    celulas[celulas >= colunas] - colunas,
+                    celulas[celulas < n - colunas] + colunas,
+                    celulas[coluna < colunas - 1] + 1,
+                    celulas[coluna > 0] - 1,
+                ))
+                nova = d + custo
+                # Uma célula vizinha de duas da frente apareceria duas vezes; sem
+                # deduplicar, as repetições crescem com o número de caminhos mínimos
+                vizinhas = np.unique(vizinhas[(custos[vizinhas] != 0) & (campo[vizinhas] > nova)])
+                if len(vizinhas):
+                    campo[vizinhas] = nova
+                    baldes[nova % tamanho].append(vizinhas)
+                    pendentes += 1
+            d += 1
+
+        campo[campo == sentinela] = -1
+        return campo
+
+    def _propagar_python(self, objetivo: int):
+        grid = self.grid
+        n, colunas = grid.num_vertices, grid.colunas
+        celulas, tabela = grid.celulas, grid.tabela
+        campo = array('q', [-1]) * n
+        if n == 0 or not tabela[celulas[objetivo]]:
+            return campo
+
+        tamanho = max(tabela) + 1
+        baldes = [[] for _ in range(tamanho)]
+        campo[objetivo] = 0
+        baldes[0].append(objetivo)
+        pendentes = 1
+        d = 0
+        while pendentes:
+            balde = baldes[d % tamanho]
+            if not balde:
+                d += 1
+                continue
+            baldes[d % tamanho] = []
+            pendentes -= len(balde)
+            for u in balde:
+                if campo[u] != d:
+                    continue
+                nova = d + tabela[celulas[u]]
+                coluna = u % colunas
+                for c in (u - colunas if u >= colunas else -1,
+                          u + colunas if u < n - colunas else -1,
+                          u + 1 if coluna < colunas - 1 else -1,
+                          u - 1 if coluna > 0 else -1):
+                    if c != -1 and tabela[celulas[c]] and (campo[c] == -1 or nova < campo[c]):
+                        campo[c] = nova
+                        baldes[nova % tamanho].append(c)
+                        pendentes += 1
+            d += 1
+        return campo
+
+def rotear_robos(grid: Union[List[List[str]], GridImplicito],
+                 robos: List[Tuple[Tuple[int, int], Tuple[int, int]]],
+                 processos: int = 1, modo: str = 'auto') -> List[Tuple[float, List[Tuple[int, int]]]]:
+    """
+    Caminhos de vários robôs no mesmo grid, cada um com (posição_inicial, posição_objetivo)
+
+    O grid é convertido uma vez e os robôs são agrupados por objetivo: cada grupo
+    de pelo menos MIN_ROBOS_CAMPO robôs custa uma única propagação reversa
+    (CampoCustos) a partir do objetivo, da qual todos os caminhos saem por descida
+    de gradiente; robôs sozinhos em seu objetivo usam a_estrela_grid.
+    Com processos > 1 (None usa os.cpu_count()) os grupos são distribuídos
+    entre processos, que recebem o buffer do grid uma vez ao iniciar.
+
+    Retorna: [(custo, caminho em posições (linha, coluna)), ...] na ordem de robos,
+    com (inf, []) para robôs sem caminho (inclusive início ou objetivo fora do grid).
+    """
+    if not isinstance(grid, GridImplicito):
+        grid = GridImplicito.de_grid(grid)
+    # Robôs com início ou objetivo fora do grid ficam sem caminho e fora dos grupos
+    grupos = {}
+    for i, (pos_inicial, pos_objetivo) in enumerate(robos):
+        if grid.contem(pos_inicial) and grid.contem(pos_objetivo):
+            grupos.setdefault(tuple(pos_objetivo), []).append(i)
+    tarefas = [(pos_objetivo, [tuple(robos[i][0]) for i in indices], modo)
+               for pos_objetivo, indices in grupos.items()]
+
+    processos = processos or os.cpu_count() or 1
+    if processos == 1 or len(tarefas) <= 1:
+        resultados_grupos = [_rotear_grupo(grid, *tarefa) for tarefa in tarefas]
+    else:
+        with Pool(min(processos, len(tarefas)), initializer=_iniciar_trabalhador_grid,
+                  initargs=(grid.celulas, grid.linhas, grid.colunas)) as pool:
+            resultados_grupos = pool.map(_rotear_grupo_trabalhador, tarefas, chunksize=1)
+
+    resultados = [(float('inf'), [])] * len(robos)
+    for indices, resultados_grupo in zip(grupos.values(), resultados_grupos):
+        for i, resultado in zip(indices, resultados_grupo):
+            resultados[i] = resultado
+    return resultados
+
+def _rotear_grupo(grid: GridImplicito, pos_objetivo: Tuple[int, int], posicoes_iniciais: List[Tuple[int, int]],
+                  modo: str) -> List[Tuple[float, List[Tuple[int, int]]]]:
+    if len(posicoes_iniciais) < MIN_ROBOS_CAMPO:
+        return [a_estrela_grid(grid, pos_inicial, pos_objetivo)[:2] for pos_inicial in posicoes_iniciais]
+    campo = CampoCustos(grid, pos_objetivo, modo)
+    return [campo.caminho(pos_inicial) for pos_inicial in posicoes_iniciais]
+
+def _iniciar_trabalhador_grid(celulas: bytearray, linhas: int, colunas: int):
+    global _grid_trabalhador
+    _grid_trabalhador = GridImplicito(celulas, linhas, colunas)
+
+def _rotear_grupo_trabalhador(tarefa: tuple) -> List[Tuple[float, List[Tuple[int, int]]]]:
+    return _rotear_grupo(_grid_trabalhador, *tarefa)
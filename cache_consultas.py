@@ -0,0 +1,138 @@
+"""
+Cache de árvores de caminho mínimo por (grafo, versão, algoritmo, origem)
+
+Em um serviço de rotas as mesmas origens (depósitos, carregadores) são consultadas
+repetidamente; o cache guarda o resultado de dijkstra/bellman_ford de cada origem
+e o devolve sem refazer a busca enquanto o grafo não mudar.
+"""
+
+import weakref
+from collections import OrderedDict
+
+from algoritmos import dijkstra, bellman_ford
+
+class CacheConsultas:
+    """
+    Cache LRU de resultados de buscas de origem única
+
+    A memória é limitada por capacidade_vertices: a soma de len(dist) de todas as
+    árvores guardadas. Ao passar do limite, as árvores usadas há mais tempo são
+    descartadas. Cada entrada registra a versão do grafo (Grafo.versao, incrementada
+    por adicionar_aresta); se o grafo mudou, todas as entradas dele são invalidadas
+    na próxima consulta. Grafos sem atributo versao (GrafoCSR, GridImplicito) são
+    imutáveis e tratados como versão 0.
+
+    Os resultados devolvidos são os próprios objetos guardados: não devem ser alterados.
+    """
+
+    def __init__(self, capacidade_vertices: int = 10_000_000):
+        self.capacidade_vertices = capacidade_vertices
+        self.vertices_guardados = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+        self.invalidacoes = 0
+        # (id(grafo), algoritmo, origem) -> (resultado, tamanho)
+        self._entradas = OrderedDict()
+        # id(grafo) -> (referência fraca ao grafo, versão das entradas guardadas)
+        self._grafos = {}
+
+    def dijkstra(self, grafo, origem: int):
+        """Mesmo retorno de algoritmos.dijkstra, reaproveitando resultados anteriores"""
+        return self.consultar(grafo, 'dijkstra', origem, dijkstra)
+
+    def bellman_ford(self, grafo, origem: int):
+        """Mesmo retorno de algoritmos.bellman_ford, reaproveitando resultados anteriores"""
+        return self.consultar(grafo, 'bellman_ford', origem, bellman_ford)
+
+    def consultar(self, grafo, algoritmo: str, origem: int, funcao):
+        """Retorna funcao(grafo, origem), usando o cache quando possível"""
+        resultado = self.obter(grafo, algoritmo, origem)
+        if resultado is None:
+            resultado = funcao(grafo, origem)
+            self.guardar(grafo, algoritmo, origem, resultado)
+        return resultado
+
+    def obter(self, grafo, algoritmo: str, origem: int):
+        """Resultado guardado para (grafo, algoritmo, origem), ou None (conta acerto ou falha)"""
+        self._validar_grafo(grafo)
+
+        chave = (id(grafo), algoritmo, origem)
+        entrada = self._entradas.get(chave)
+        if entrada is not None:
+            self.acertos += 1
+            self._entradas.move_to_end(chave)
+            return entrada[0]
+        self.falhas += 1
+        return None
+
+    def guardar(self, grafo, algoritmo: str, origem: int, resultado):
+        """
+        Guarda um resultado calculado fora do cache (por exemplo, em outra thread)
+        Se o grafo mudou desde a consulta, o resultado ainda é da versão antiga e é descartado.
+        """
+        registro = self._grafos.get(id(grafo))
+        if registro is None or registro[1] != getattr(grafo, 'versao', 0):
+            return
+        tamanho = grafo.num_vertices
+        if tamanho <= self.capacidade_vertices:
+            chave = (id(grafo), algoritmo, origem)
+            antiga = self._entradas.pop(chave, None)
+            if antiga is not None:
+                self.vertices_guardados -= antiga[1]
+            self._entradas[chave] = (resultado, tamanho)
+            self.vertices_guardados += tamanho
+            self._liberar_espaco()
+
+    def limpar(self):
+        """Descarta todas as entradas (os contadores são mantidos)"""
+        self._entradas.clear()
+        self._grafos.clear()
+        self.vertices_guardados = 0
+
+    def estatisticas(self) -> dict:
+        """Contadores para dimensionar o cache"""
+        consultas = self.acertos + self.falhas
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+            'descartes': self.descartes,
+            'invalidacoes': self.invalidacoes,
+            'entradas': len(self._entradas),
+            'vertices_guardados': self.vertices_guardados,
+            'capacidade_vertices': self.capacidade_vertices,
+        }
+
+    def _validar_grafo(self, grafo):
+        """Remove as entradas do grafo se ele mudou (ou se o id foi reaproveitado)"""
+        chave_grafo = id(grafo)
+        versao = getattr(grafo, 'versao', 0)
+        registro = self._grafos.get(chave_grafo)
+        if registro is not None:
+            referencia, versao_guardada = registro
+            if referencia() is grafo and versao_guardada == versao:
+                return
+            self._remover_grafo(chave_grafo, invalidacao=True)
+        # Quando o grafo for coletado, suas entradas saem do cache junto
+        referencia = weakref.ref(grafo, lambda r, c=chave_grafo: self._ao_coletar(c, r))
+        self._grafos[chave_grafo] = (referencia, versao)
+
+    def _ao_coletar(self, chave_grafo: int, referencia):
+        registro = self._grafos.get(chave_grafo)
+        if registro is not None and registro[0] is referencia:
+            self._remover_grafo(chave_grafo, invalidacao=False)
+
+    def _remover_grafo(self, chave_grafo: int, invalidacao: bool):
+        for chave in [c for c in self._entradas if c[0] == chave_grafo]:
+            _, tamanho = self._entradas.pop(chave)
+            self.vertices_guardados -= tamanho
+            if invalidacao:
+                self.invalidacoes += 1
+        del self._grafos[chave_grafo]
+
+    def _liberar_espaco(self):
+        while self.vertices_guardados > self.capacidade_vertices:
+            _, (_, tamanho) = self._entradas.popitem(last=False)
+            self.vertices_guardados -= tamanho
+            self.descartes += 1
@@ -4,61 +4,145 @@ Cenário 1: Determinando a estação central
 Algoritmo utilizado: Floyd-Warshall
 Precisamos calcular as distâncias de todos os vértices para todos os outros
 para determinar qual vértice minimiza a soma das distâncias para todos os demais.
+Acima de LIMITE_MATRIZ vértices a matriz não é montada nem impressa: a escolha
+passa a centralidade.estacao_central (buscas com poda e memória O(n)).
+
+calcular_estacao_central só calcula e devolve um ResultadoEstacaoCentral;
+imprimir_estacao_central produz o relatório em texto.
 """
 
-from algoritmos import floyd_warshall
+from algoritmos import floyd_warshall, dijkstra
+import centralidade
 from utils import ler_grafo_arquivo, imprimir_matriz, imprimir_vetor
+from instrumentacao import Estatisticas, medir_fase
+
+# Maior grafo para o qual a matriz n x n é calculada e impressa
+LIMITE_MATRIZ = 500
 
-def encontrar_estacao_central(arquivo_grafo: str):
+class ResultadoEstacaoCentral:
     """
-    Encontra a estação central de um grafo de metrô
+    Resultado do Cenário 1 (vértices internos, numerados a partir de 0)
+
+    matriz_distancias é a matriz de floyd_warshall, ou None acima de LIMITE_MATRIZ;
+    linhas_matriz() dá as linhas mesmo nesse caso, calculadas uma a uma.
     """
-    print("=== Cenário 1: Determinando a estação central ===")
-    print(f"Lendo grafo do arquivo: {arquivo_grafo}")
-    
-    # Ler o grafo (não-direcionado)
-    grafo = ler_grafo_arquivo(arquivo_grafo, direcionado=False)
-    print(f"Grafo carregado: {grafo.num_vertices} vértices")
-    
-    # Aplicar Floyd-Warshall para obter todas as distâncias
-    print("\nAplicando algoritmo Floyd-Warshall...")
-    matriz_distancias = floyd_warshall(grafo)
-    
-    # Imprimir matriz de distâncias
-    imprimir_matriz(matriz_distancias, "Matriz de Distâncias (Floyd-Warshall)")
-    
-    # Calcular somas das distâncias para cada vértice
-    somas_distancias = []
-    for i in range(grafo.num_vertices):
-        soma = sum(matriz_distancias[i])
-        somas_distancias.append(soma)
-    
-    # Encontrar a estação central (menor soma)
-    estacao_central = somas_distancias.index(min(somas_distancias))
-    
-    # Distâncias da estação central para todos os outros vértices
-    distancias_central = matriz_distancias[estacao_central]
-    
+
+    def __init__(self, arquivo_grafo: str, grafo, estacao_central: int, soma_central: float,
+                 distancias_central: list, vertice_mais_distante: int, max_dist: float,
+                 matriz_distancias: list = None):
+        self.arquivo_grafo = arquivo_grafo
+        self.grafo = grafo
+        self.num_vertices = grafo.num_vertices
+        self.estacao_central = estacao_central
+        self.soma_central = soma_central
+        self.distancias_central = distancias_central
+        self.vertice_mais_distante = vertice_mais_distante
+        self.max_dist = max_dist
+        self.matriz_distancias = matriz_distancias
+
+    def linhas_matriz(self):
+        """Linhas da matriz de distâncias; sem matriz guardada, um dijkstra por linha"""
+        if self.matriz_distancias is not None:
+            return iter(self.matriz_distancias)
+        return (dijkstra(self.grafo, origem)[0] for origem in range(self.num_vertices))
+
+    def como_dict(self, incluir_matriz: bool = True) -> dict:
+        """Para utils.escrever_json; vértices na numeração do arquivo (a partir de 1)"""
+        dados = {
+            'cenario': 1,
+            'arquivo': self.arquivo_grafo,
+            'num_vertices': self.num_vertices,
+            'estacao_central': self.estacao_central + 1,
+            'soma_distancias': self.soma_central,
+            'vertice_mais_distante': self.vertice_mais_distante + 1,
+            'distancia_maxima': self.max_dist,
+            'distancias_central': self.distancias_central,
+        }
+        if incluir_matriz:
+            dados['matriz_distancias'] = self.linhas_matriz()
+        return dados
+
+def calcular_estacao_central(arquivo_grafo: str, estatisticas: Estatisticas = None) -> ResultadoEstacaoCentral:
+    """
+    Lê o grafo de metrô e escolhe a estação central, sem imprimir nada
+    Com estatisticas, registra os tempos de carga e busca e os contadores do Floyd-Warshall.
+    """
+    # Ler o grafo (não-direcionado, vértices numerados a partir de 1)
+    with medir_fase(estatisticas, 'carga'):
+        grafo = ler_grafo_arquivo(arquivo_grafo, direcionado=False, index_base=1)
+
+    if grafo.num_vertices > LIMITE_MATRIZ:
+        with medir_fase(estatisticas, 'busca'):
+            candidatos, distancias_central = centralidade.estacao_central(grafo, estatisticas=estatisticas)
+        estacao_central, soma_central, max_dist = candidatos[0]
+        matriz_distancias = None
+    else:
+        # Aplicar Floyd-Warshall para obter todas as distâncias
+        with medir_fase(estatisticas, 'busca'):
+            matriz_distancias = floyd_warshall(grafo, estatisticas=estatisticas)
+
+        # Calcular somas das distâncias para cada vértice
+        somas_distancias = []
+        for i in range(grafo.num_vertices):
+            soma = sum(matriz_distancias[i])
+            somas_distancias.append(soma)
+
+        # Encontrar a estação central (menor soma)
+        estacao_central = somas_distancias.index(min(somas_distancias))
+        soma_central = somas_distancias[estacao_central]
+
+        # Distâncias da estação central para todos os outros vértices
+        distancias_central = matriz_distancias[estacao_central]
+        max_dist = max(dist for dist in distancias_central if dist != float('inf'))
+
     # Encontrar o vértice mais distante da estação central
-    max_dist = max(dist for dist in distancias_central if dist != float('inf'))
     vertice_mais_distante = distancias_central.index(max_dist)
-    
+
+    return ResultadoEstacaoCentral(arquivo_grafo, grafo, estacao_central, soma_central, distancias_central,
+                                   vertice_mais_distante, max_dist, matriz_distancias)
+
+def imprimir_estacao_central(resultado: ResultadoEstacaoCentral):
+    """Relatório em texto do Cenário 1"""
+    estacao_central = resultado.estacao_central
+    matriz_distancias = resultado.matriz_distancias
+
+    print("=== Cenário 1: Determinando a estação central ===")
+    print(f"Lendo grafo do arquivo: {resultado.arquivo_grafo}")
+    print(f"Grafo carregado: {resultado.num_vertices} vértices")
+
+    if matriz_distancias is None:
+        print("\nGrafo grande: somas de distâncias por buscas com poda (sem matriz)...")
+    else:
+        print("\nAplicando algoritmo Floyd-Warshall...")
+        # Imprimir matriz de distâncias
+        imprimir_matriz(matriz_distancias, "Matriz de Distâncias (Floyd-Warshall)")
+
     print(f"Estação central escolhida: Vértice {estacao_central + 1}")  # +1 para numeração original
-    print(f"Soma das distâncias da estação central: {somas_distancias[estacao_central]}")
-    
+    print(f"Soma das distâncias da estação central: {resultado.soma_central}")
+
     print(f"\nDistâncias da estação central (vértice {estacao_central + 1}) para todos os outros:")
-    for i, dist in enumerate(distancias_central):
+    for i, dist in enumerate(resultado.distancias_central):
         if i != estacao_central:
             print(f"  Para vértice {i + 1}: {dist}")
-    
+
     print(f"\nVértice mais distante da estação central:")
-    print(f"  Vértice {vertice_mais_distante + 1} com distância {max_dist}")
-    
-    print(f"\nMatriz completa de distâncias entre todos os vértices:")
-    print("(Linha i, Coluna j = distância do vértice i+1 para o vértice j+1)")
-    imprimir_matriz(matriz_distancias, "Matriz Completa")
-    
-    return estacao_central, distancias_central, vertice_mais_distante, matriz_distancias
+    print(f"  Vértice {resultado.vertice_mais_distante + 1} com distância {resultado.max_dist}")
+
+    if matriz_distancias is not None:
+        print(f"\nMatriz completa de distâncias entre todos os vértices:")
+        print("(Linha i, Coluna j = distância do vértice i+1 para o vértice j+1)")
+        imprimir_matriz(matriz_distancias, "Matriz Completa")
+
+def encontrar_estacao_central(arquivo_grafo: str, estatisticas: Estatisticas = None, quieto: bool = False):
+    """
+    Encontra a estação central de um grafo de metrô
+    Com quieto=True nada é impresso (ver calcular_estacao_central para o resultado completo).
+    """
+    resultado = calcular_estacao_central(arquivo_grafo, estatisticas)
+    if not quieto:
+        imprimir_estacao_central(resultado)
+    return (resultado.estacao_central, resultado.distancias_central,
+            resultado.vertice_mais_distante, resultado.matriz_distancias)
 
 if __name__ == "__main__":
-    encontrar_estacao_central("graph1.txt")
\ No newline at end of file
+    encontrar_estacao_central("graph1.txt")
@@ -7,49 +7,112 @@ o que torna impossível o uso do algoritmo de Dijkstra. Bellman-Ford é capaz
 de lidar com pesos negativos e detectar ciclos negativos.
 """
 
-from algoritmos import bellman_ford, reconstruir_caminho
+from algoritmos import bellman_ford_fila, Caminho
 from utils import ler_grafo_arquivo
+from instrumentacao import Estatisticas, medir_fase
 
-def otimizar_caminho_carro(arquivo_grafo: str, origem: int = 0, destino: int = 6):
+class ResultadoCarro:
     """
-    Encontra o caminho de menor custo energético para um carro elétrico
+    Resultado do Cenário 2
+
+    vertices_validos=False indica origem ou destino fora do grafo (nada foi
+    calculado); ciclo_negativo é a lista de bellman_ford_fila ([] se não houver).
+    caminho é um Caminho (None sem caminho) e trechos a lista (u, v, peso).
+    """
+
+    def __init__(self, arquivo_grafo: str, num_vertices: int, origem: int, destino: int,
+                 vertices_validos: bool = True, distancias: list = None, ciclo_negativo: list = None,
+                 caminho: Caminho = None, trechos: list = None):
+        self.arquivo_grafo = arquivo_grafo
+        self.num_vertices = num_vertices
+        self.origem = origem
+        self.destino = destino
+        self.vertices_validos = vertices_validos
+        self.distancias = distancias
+        self.ciclo_negativo = ciclo_negativo or []
+        self.caminho = caminho
+        self.trechos = trechos or []
+
+    @property
+    def custo_total(self) -> float:
+        return self.caminho.custo if self.caminho is not None else float('inf')
+
+    def como_dict(self) -> dict:
+        """Para utils.escrever_json"""
+        return {
+            'cenario': 2,
+            'arquivo': self.arquivo_grafo,
+            'num_vertices': self.num_vertices,
+            'origem': self.origem,
+            'destino': self.destino,
+            'vertices_validos': self.vertices_validos,
+            'ciclo_negativo': self.ciclo_negativo,
+            'custo_total': self.custo_total,
+            'caminho': self.caminho.lista() if self.caminho is not None else [],
+            'trechos': [list(trecho) for trecho in self.trechos],
+            'distancias': self.distancias or [],
+        }
+
+def calcular_caminho_carro(arquivo_grafo: str, origem: int = 0, destino: int = 6,
+                           estatisticas: Estatisticas = None) -> ResultadoCarro:
+    """
+    Lê o grafo e calcula o caminho de menor custo energético, sem imprimir nada
+    Com estatisticas, registra os tempos de carga, busca e reconstrução e os contadores da busca.
     """
-    print("=== Cenário 2: Otimizando caminho com regeneração ===")
-    print(f"Lendo grafo do arquivo: {arquivo_grafo}")
-    
     # Ler o grafo (direcionado, pois a regeneração não é simétrica)
-    grafo = ler_grafo_arquivo(arquivo_grafo, direcionado=True)
-    print(f"Grafo carregado: {grafo.num_vertices} vértices (direcionado)")
-    
+    with medir_fase(estatisticas, 'carga'):
+        grafo = ler_grafo_arquivo(arquivo_grafo, direcionado=True)
+
     # Verificar se origem e destino são válidos
     if origem >= grafo.num_vertices or destino >= grafo.num_vertices:
+        return ResultadoCarro(arquivo_grafo, grafo.num_vertices, origem, destino, vertices_validos=False)
+
+    # Aplicar Bellman-Ford
+    with medir_fase(estatisticas, 'busca'):
+        distancias, anterior, ciclo_negativo = bellman_ford_fila(grafo, origem, estatisticas)
+
+    resultado = ResultadoCarro(arquivo_grafo, grafo.num_vertices, origem, destino,
+                               distancias=distancias, ciclo_negativo=ciclo_negativo)
+    if ciclo_negativo or distancias[destino] == float('inf'):
+        return resultado
+
+    # Reconstruir o caminho e calcular custo total
+    with medir_fase(estatisticas, 'reconstrucao'):
+        resultado.caminho = Caminho(anterior, origem, destino, grafo, distancias)
+        resultado.trechos = list(resultado.caminho.arestas())
+    return resultado
+
+def imprimir_caminho_carro(resultado: ResultadoCarro):
+    """Relatório em texto do Cenário 2"""
+    origem, destino = resultado.origem, resultado.destino
+
+    print("=== Cenário 2: Otimizando caminho com regeneração ===")
+    print(f"Lendo grafo do arquivo: {resultado.arquivo_grafo}")
+    print(f"Grafo carregado: {resultado.num_vertices} vértices (direcionado)")
+
+    if not resultado.vertices_validos:
         print(f"Erro: Vértices de origem ({origem}) ou destino ({destino}) inválidos")
         return
-    
+
     print(f"Calculando caminho de menor custo do vértice {origem} ao vértice {destino}")
-    
-    # Aplicar Bellman-Ford
     print("\nAplicando algoritmo Bellman-Ford...")
-    distancias, anterior, sem_ciclo_negativo = bellman_ford(grafo, origem)
-    
-    if not sem_ciclo_negativo:
+
+    if resultado.ciclo_negativo:
         print("Ciclo negativo detectado no grafo!") # Isso significa que existe um ciclo onde se ganha energia infinita.
+        print(" -> ".join(str(v) for v in resultado.ciclo_negativo))
         return
-    
+
     # Verificar se há caminho para o destino
-    if distancias[destino] == float('inf'):
+    if resultado.caminho is None:
         print(f"Não há caminho do vértice")
         return
-    
-    # Reconstruir o caminho e calcular custo total
 
-    caminho = reconstruir_caminho(anterior, origem, destino)
-    custo_total = distancias[destino]
-    
+    custo_total = resultado.custo_total
+
     # Resultados
     print(f"Caminho mínimo do vértice {origem} ao vértice {destino}:")
-    print(" -> ".join(str(v) for v in caminho))
-    
+    print(" -> ".join(str(v) for v in resultado.caminho))
+
     print(f"\nCusto total do caminho: {custo_total} Wh")
     if custo_total < 0:
         print("(Valor negativo indica que o carro chega com mais energia do que saiu!)")
@@ -57,26 +120,32 @@ def otimizar_caminho_carro(arquivo_grafo: str, origem: int = 0, destino: int = 6
         print("(Energia líquida consumida)")
     else:
         print("(Energia balanceada)")
-    
+
     # Mostrar custos de cada trecho
     print(f"\nDetalhamento dos custos por trecho:")
-    for i in range(len(caminho) - 1):
-        u, v = caminho[i], caminho[i + 1]
-        # Encontrar o custo da aresta
-        for aresta_u, aresta_v, peso in grafo.arestas:
-            if aresta_u == u and aresta_v == v:
-                print(f"  {u} -> {v}: {peso} Wh")
-                break
-    
+    for u, v, peso in resultado.trechos:
+        print(f"  {u} -> {v}: {peso} Wh")
+
     # Mostrar todas as distâncias calculadas
     print(f"\nDistâncias mínimas do vértice {origem} para todos os outros:")
-    for i, dist in enumerate(distancias):
+    for i, dist in enumerate(resultado.distancias):
         if dist != float('inf'):
             print(f"  Para vértice {i}: {dist} Wh")
         else:
             print(f"  Para vértice {i}: Inalcançável")
-    
-    return caminho, custo_total
+
+def otimizar_caminho_carro(arquivo_grafo: str, origem: int = 0, destino: int = 6,
+                           estatisticas: Estatisticas = None, quieto: bool = False):
+    """
+    Encontra o caminho de menor custo energético para um carro elétrico
+    Com quieto=True nada é impresso (ver calcular_caminho_carro para o resultado completo).
+    """
+    resultado = calcular_caminho_carro(arquivo_grafo, origem, destino, estatisticas)
+    if not quieto:
+        imprimir_caminho_carro(resultado)
+    if resultado.caminho is None:
+        return None
+    return resultado.caminho.lista(), resultado.custo_total
 
 if __name__ == "__main__":
-    otimizar_caminho_carro("graph2.txt", 0, 6)
\ No newline at end of file
+    otimizar_caminho_carro("graph2.txt", 0, 6)
@@ -7,61 +7,127 @@ piso difícil custa 3), permitindo o uso eficiente do Dijkstra para
 encontrar o caminho ótimo de um único ponto de origem (S) ao destino (G).
 """
 
-from algoritmos import dijkstra, reconstruir_caminho
+from algoritmos import dijkstra_ponto_a_ponto
+from busca_grid import GridImplicito, rotear_robos
 from utils import ler_grid_arquivo, grid_para_grafo, imprimir_caminho_grid
+from instrumentacao import Estatisticas, medir_fase
 
-def encontrar_caminho_robo(arquivo_grid: str):
+class ResultadoRobo:
     """
-    Encontra o caminho de menor custo para um robô navegar em um armazém
+    Resultado do Cenário 3
+
+    grafo_construido=False indica grid sem S ou G (nada foi calculado). Sem
+    caminho, custo_total é inf e caminho_ids/caminho_posicoes ficam vazios.
+    """
+
+    def __init__(self, arquivo_grid: str, grid: list, pos_inicial: tuple, pos_objetivo: tuple,
+                 grafo_construido: bool = False, num_vertices: int = 0, id_origem: int = -1,
+                 id_destino: int = -1, assentados: int = 0, custo_total: float = float('inf'),
+                 caminho_ids: list = None, caminho_posicoes: list = None, id_para_pos: dict = None):
+        self.arquivo_grid = arquivo_grid
+        self.grid = grid
+        self.pos_inicial = pos_inicial
+        self.pos_objetivo = pos_objetivo
+        self.grafo_construido = grafo_construido
+        self.num_vertices = num_vertices
+        self.id_origem = id_origem
+        self.id_destino = id_destino
+        self.assentados = assentados
+        self.custo_total = custo_total
+        self.caminho_ids = caminho_ids or []
+        self.caminho_posicoes = caminho_posicoes or []
+        self.id_para_pos = id_para_pos or {}
+
+    def como_dict(self) -> dict:
+        """Para utils.escrever_json"""
+        return {
+            'cenario': 3,
+            'arquivo': self.arquivo_grid,
+            'dimensoes': [len(self.grid), len(self.grid[0]) if self.grid else 0],
+            'pos_inicial': self.pos_inicial,
+            'pos_objetivo': self.pos_objetivo,
+            'vertices_assentados': self.assentados,
+            'custo_total': self.custo_total,
+            'caminho': self.caminho_posicoes,
+        }
+
+def calcular_caminho_robo(arquivo_grid: str, estatisticas: Estatisticas = None) -> ResultadoRobo:
+    """
+    Lê o grid e calcula o caminho de menor custo de S a G, sem imprimir nada
+    Com estatisticas, registra os tempos de carga, construção do grafo, busca e
+    reconstrução e os contadores da busca.
     """
-    print("=== Cenário 3: Robô de armazém com obstáculos ===")
-    print(f"Lendo grid do arquivo: {arquivo_grid}")
-    
     # Ler o grid
-    grid, pos_inicial, pos_objetivo = ler_grid_arquivo(arquivo_grid)
-    
+    with medir_fase(estatisticas, 'carga'):
+        grid, pos_inicial, pos_objetivo = ler_grid_arquivo(arquivo_grid)
+
+    resultado = ResultadoRobo(arquivo_grid, grid, pos_inicial, pos_objetivo)
     if pos_inicial is None or pos_objetivo is None:
+        return resultado
+
+    # Converter grid para grafo
+    with medir_fase(estatisticas, 'construcao'):
+        grafo, pos_para_id, id_para_pos = grid_para_grafo(grid)
+    resultado.grafo_construido = True
+    resultado.num_vertices = grafo.num_vertices
+    resultado.id_para_pos = id_para_pos
+
+    # Obter IDs dos vértices de origem e destino
+    resultado.id_origem = pos_para_id[pos_inicial]
+    resultado.id_destino = pos_para_id[pos_objetivo]
+
+    # Aplicar Dijkstra (para assim que G é assentado)
+    with medir_fase(estatisticas, 'busca'):
+        custo_total, caminho_ids, assentados = dijkstra_ponto_a_ponto(grafo, resultado.id_origem,
+                                                                      resultado.id_destino, estatisticas)
+    resultado.assentados = assentados
+    resultado.custo_total = custo_total
+    if custo_total == float('inf'):
+        return resultado
+
+    # Converter IDs de volta para posições
+    with medir_fase(estatisticas, 'reconstrucao'):
+        resultado.caminho_ids = caminho_ids
+        resultado.caminho_posicoes = [id_para_pos[id_v] for id_v in caminho_ids]
+    return resultado
+
+def imprimir_caminho_robo(resultado: ResultadoRobo):
+    """Relatório em texto do Cenário 3"""
+    grid, pos_inicial, pos_objetivo = resultado.grid, resultado.pos_inicial, resultado.pos_objetivo
+
+    print("=== Cenário 3: Robô de armazém com obstáculos ===")
+    print(f"Lendo grid do arquivo: {resultado.arquivo_grid}")
+
+    if not resultado.grafo_construido:
         print("Erro")
         return
-    
+
     print(f"Grid carregado: {len(grid)}x{len(grid[0])}")
     print(f"Posição inicial (S): {pos_inicial}")
     print(f"Posição objetivo (G): {pos_objetivo}")
-    
+
     # Imprimir grid original
     print(f"\nGrid original:")
     for linha in grid:
         print(''.join(linha))
-    
-    # Converter grid para grafo
+
     print(f"\nConvertendo grid para grafo...")
-    grafo, pos_para_id, id_para_pos = grid_para_grafo(grid)
-    print(f"Grafo criado com {grafo.num_vertices} vértices válidos")
-    
-    # Obter IDs dos vértices de origem e destino
-    id_origem = pos_para_id[pos_inicial]
-    id_destino = pos_para_id[pos_objetivo]
-    
-    print(f"ID do vértice origem: {id_origem}")
-    print(f"ID do vértice destino: {id_destino}")
-    
-    # Aplicar Dijkstra
+    print(f"Grafo criado com {resultado.num_vertices} vértices válidos")
+
+    print(f"ID do vértice origem: {resultado.id_origem}")
+    print(f"ID do vértice destino: {resultado.id_destino}")
+
     print(f"\nAplicando algoritmo Dijkstra...")
-    distancias, anterior = dijkstra(grafo, id_origem)
-    
+    print(f"Vértices assentados: {resultado.assentados} de {resultado.num_vertices}")
+
     # Verificar se há caminho
-    if distancias[id_destino] == float('inf'):
+    custo_total = resultado.custo_total
+    if custo_total == float('inf'):
         print("Não há caminho possível de S para G!")
         return
-    
-    # Reconstruir o caminho e converter IDs de volta para posições
 
-    caminho_ids = reconstruir_caminho(anterior, id_origem, id_destino)
-    caminho_posicoes = [id_para_pos[id_v] for id_v in caminho_ids]
-    
-    # Custo total
-    custo_total = distancias[id_destino]
-    
+    caminho_posicoes = resultado.caminho_posicoes
+
     # Resultados
     print(f"Caminho encontrado de S para G:")
     print(f"Sequência de posições (linha, coluna):")
@@ -72,45 +138,55 @@ def encontrar_caminho_robo(arquivo_grid: str):
             print(f"  {i+1}. {pos} (G - objetivo)")
         else:
             print(f"  {i+1}. {pos}")
-    
+
     print(f"\nCusto total do caminho: {custo_total}")
     print(f"Número de passos: {len(caminho_posicoes) - 1}")
-    
+
     # Mostrar custos detalhados
     print(f"\nDetalhamento dos custos por movimento:")
     custo_acumulado = 0
     for i in range(len(caminho_posicoes) - 1):
         pos_atual = caminho_posicoes[i]
         pos_proxima = caminho_posicoes[i + 1]
-        
+
         # Custo é baseado na célula de destino
         celula_destino = grid[pos_proxima[0]][pos_proxima[1]]
         custo_movimento = 1 if celula_destino in ['.', 'S', 'G'] else 3
         custo_acumulado += custo_movimento
-        
+
         direcao = obter_direcao(pos_atual, pos_proxima)
         print(f"  {i+1}. {pos_atual} -> {pos_proxima} ({direcao}): +{custo_movimento} = {custo_acumulado}")
-    
+
     # Visualizar caminho no grid
-    imprimir_caminho_grid(grid, caminho_ids, id_para_pos, pos_inicial, pos_objetivo)
-    
+    imprimir_caminho_grid(grid, resultado.caminho_ids, resultado.id_para_pos, pos_inicial, pos_objetivo)
+
     # Estatísticas dos tipos de célula no caminho
     tipos_celula = {}
     for pos in caminho_posicoes:
         celula = grid[pos[0]][pos[1]]
         tipos_celula[celula] = tipos_celula.get(celula, 0) + 1
-    
+
     print(f"\nEstatísticas do caminho:")
     for tipo, quantidade in tipos_celula.items():
         descricao = {
             'S': 'Início',
-            'G': 'Objetivo', 
+            'G': 'Objetivo',
             '.': 'Células livres',
             '~': 'Piso difícil'
         }.get(tipo, 'Desconhecido')
         print(f"  {descricao}: {quantidade}")
-    
-    return caminho_posicoes, custo_total
+
+def encontrar_caminho_robo(arquivo_grid: str, estatisticas: Estatisticas = None, quieto: bool = False):
+    """
+    Encontra o caminho de menor custo para um robô navegar em um armazém
+    Com quieto=True nada é impresso (ver calcular_caminho_robo para o resultado completo).
+    """
+    resultado = calcular_caminho_robo(arquivo_grid, estatisticas)
+    if not quieto:
+        imprimir_caminho_robo(resultado)
+    if resultado.custo_total == float('inf'):
+        return None
+    return resultado.caminho_posicoes, resultado.custo_total
 
 def obter_direcao(pos1, pos2):
     """Retorna a direção do movimento entre duas posições"""
@@ -128,5 +204,28 @@ def obter_direcao(pos1, pos2):
     else:
         return "?"
 
+def encontrar_caminhos_robos(arquivo_grid: str, robos, processos: int = 1,
+                             estatisticas: Estatisticas = None, quieto: bool = False):
+    """
+    Rotas de vários robôs no mesmo armazém, cada um com (posição_inicial, posição_objetivo)
+
+    O arquivo é lido uma única vez para o buffer compacto de GridImplicito e os
+    robôs são roteados em lote por busca_grid.rotear_robos (uma propagação por
+    objetivo compartilhado). Retorna a lista de (custo, caminho) na ordem de robos.
+    Com quieto=True nada é impresso.
+    """
+    with medir_fase(estatisticas, 'carga'):
+        grid = GridImplicito.de_arquivo(arquivo_grid)
+    with medir_fase(estatisticas, 'busca'):
+        resultados = rotear_robos(grid, robos, processos)
+
+    if not quieto:
+        objetivos = len({tuple(pos_objetivo) for _, pos_objetivo in robos})
+        sem_caminho = sum(1 for custo, _ in resultados if custo == float('inf'))
+        print("=== Cenário 3: Rotas de vários robôs no armazém ===")
+        print(f"Grid carregado: {grid.linhas}x{grid.colunas}")
+        print(f"{len(robos)} robôs roteados ({objetivos} objetivos distintos), {sem_caminho} sem caminho")
+    return resultados
+
 if __name__ == "__main__":
     encontrar_caminho_robo("grid_example.txt")
\ No newline at end of file
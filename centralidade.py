@@ -0,0 +1,214 @@
+"""
+Escolha da estação central sem a matriz n x n de todos os pares
+
+O Cenário 1 só precisa, para cada vértice, da soma das distâncias aos demais
+(closeness) e, para o escolhido, da linha de distâncias e da excentricidade.
+Aqui cada origem é uma busca de Dijkstra independente sobre buffers de tamanho n
+reaproveitados, então a memória é O(n + E) e o grafo pode ter centenas de
+milhares de estações.
+
+Poda: os vértices são assentados em ordem crescente de distância, então quando
+a busca de s assenta um vértice à distância d, todos os que faltam estão a pelo
+menos d. soma_parcial + d * faltantes é um limite inferior da soma de s; se ele
+já passa da k-ésima melhor soma encontrada, a busca de s é abandonada. Antes
+disso, as buscas completas de alguns pivôs (vértices de grau alto) dão por
+desigualdade triangular um limite inferior para cada origem, que define a ordem
+das demais buscas e descarta sem busca as que não podem mais vencer.
+
+Pesos negativos (sem ciclo negativo) são tratados com os potenciais de Johnson:
+d(s, v) = d'(s, v) - h[s] + h[v], logo soma(s) = soma'(s) - n * h[s] + soma(h).
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import List, Tuple
+
+from algoritmos import (Grafo, LIMITE_BALDES, dijkstra, bellman_ford, limite_pesos_inteiros,
+                        potenciais_johnson, reponderar, _assentar_baldes, _assentar_heap)
+from instrumentacao import Estatisticas
+
+def somas_distancias(grafo: Grafo, k: int = 1, podar: bool = True, pivos: int = 4,
+                     estatisticas: Estatisticas = None) -> List[Tuple[int, float]]:
+    """
+    Os k vértices de menor soma de distâncias, como [(vértice, soma), ...] em
+    ordem crescente de soma (empates pelo menor vértice). A soma é inf quando
+    algum vértice é inalcançável, como em sum() de uma linha de floyd_warshall.
+
+    Com podar=True:
+    - as buscas completas dos pivos primeiros vértices (maior grau) dão, pela
+      desigualdade triangular, um limite inferior para a soma de toda origem s:
+      d(s, v) >= |d(p, v) - d(p, s)| (não-direcionado) ou >= d(p, v) - d(p, s);
+    - as demais origens são visitadas em ordem crescente desse limite, e assim
+      que ele passa da k-ésima melhor soma todas as restantes são descartadas
+      sem busca;
+    - cada busca ainda é abandonada pelo limite de nível (ver o módulo).
+    Com podar=False todas as origens são calculadas até o fim.
+    """
+    n = grafo.num_vertices
+    if n == 0:
+        return []
+    INF = float('inf')
+
+    # Pesos negativos: buscas no grafo reponderado, somas convertidas com h
+    h = None
+    if limite_pesos_inteiros(grafo) < 0 and any(peso < 0 for _, _, peso in grafo.arestas):
+        h, sem_ciclo_negativo = potenciais_johnson(grafo)
+        if not sem_ciclo_negativo:
+            raise ValueError("Grafo com ciclo negativo: somas de distâncias indefinidas")
+        grafo = reponderar(grafo, h)
+    soma_h = sum(h) if h is not None else 0
+
+    def escala_real(origem: int, valor: float) -> float:
+        """Soma no grafo reponderado -> soma real (identidade sem potenciais)"""
+        if h is None or valor == INF:
+            return valor
+        return valor - n * h[origem] + soma_h
+
+    peso_max = limite_pesos_inteiros(grafo)
+    usar_baldes = 0 <= peso_max <= LIMITE_BALDES
+    adj_list = grafo.adj_list
+
+    # Buffers reaproveitados: após cada busca só as entradas tocadas voltam a INF
+    dist = [INF] * n
+    anterior = [-1] * n
+
+    def buscar(origem: int, limite: float, distancias: list = None) -> float:
+        """Soma das distâncias (reponderadas) de origem; None se a poda abandonou a busca"""
+        if usar_baldes:
+            busca = _assentar_baldes(adj_list, origem, peso_max, dist, anterior)
+        else:
+            busca = _assentar_heap(adj_list, origem, dist, anterior)
+        soma = 0
+        assentados = []
+        podada = False
+        for u, d in busca:
+            assentados.append(u)
+            soma += d
+            if soma + d * (n - len(assentados)) > limite:
+                podada = len(assentados) < n
+                break
+        if distancias is not None:
+            for u in assentados:
+                distancias[u] = dist[u]
+        for u in assentados:
+            dist[u] = INF
+            for v, _ in adj_list[u]:
+                dist[v] = INF
+        if podada:
+            return None
+        return soma if len(assentados) == n else INF
+
+    # Heap de máximo (valores negados) com as k melhores: (-soma, -vértice)
+    melhores = []
+
+    def registrar(origem: int, soma: float):
+        item = (-soma, -origem)
+        if len(melhores) < k:
+            heapq.heappush(melhores, item)
+        elif item > melhores[0]:
+            heapq.heapreplace(melhores, item)
+
+    def k_esima() -> float:
+        return -melhores[0][0] if len(melhores) == k else INF
+
+    ordem = sorted(range(n), key=lambda u: -_grau(grafo, u))
+    if not podar:
+        pivos = 0
+    # Limite trivial: soma' >= 0 no grafo (reponderado) de pesos não-negativos
+    limites = [escala_real(s, 0) for s in range(n)]
+    buscas_podadas = 0
+
+    # Fase 1: pivôs, com busca completa e limites triangulares para as demais origens
+    for pivo in ordem[:pivos]:
+        distancias = [INF] * n
+        soma = escala_real(pivo, buscar(pivo, INF, distancias))
+        registrar(pivo, soma)
+        if soma == INF and not grafo.direcionado:
+            # Não-direcionado e desconexo: toda soma é inf, ganham os menores vértices
+            return [(v, INF) for v in range(min(k, n))]
+        _atualizar_limites(limites, distancias, grafo.direcionado, h, n, soma_h)
+
+    # Fase 2: demais origens em ordem crescente de limite inferior
+    restantes = sorted(ordem[pivos:], key=limites.__getitem__)
+    descartadas = 0
+    for i, origem in enumerate(restantes):
+        melhor_k = k_esima()
+        if podar and limites[origem] > melhor_k:
+            descartadas = len(restantes) - i
+            break
+        # Limite de nível na escala da busca (reponderada)
+        limite = melhor_k if h is None or melhor_k == INF else melhor_k + n * h[origem] - soma_h
+        soma = buscar(origem, limite if podar else INF)
+        if soma is None:
+            buscas_podadas += 1
+            continue
+        registrar(origem, escala_real(origem, soma))
+
+    if estatisticas is not None:
+        estatisticas.somar('origens', n)
+        estatisticas.somar('origens_descartadas_sem_busca', descartadas)
+        estatisticas.somar('buscas_abandonadas', buscas_podadas)
+
+    return sorted(((-u, -soma) for soma, u in melhores), key=lambda par: (par[1], par[0]))
+
+def _atualizar_limites(limites: List[float], distancias: List[float], direcionado: bool,
+                       h: List[int], n: int, soma_h: float):
+    """
+    limites[s] = max(limites[s], limite inferior da soma de s dado pela linha
+    distancias do pivô p), com prefixos da linha ordenada para calcular em O(log n)
+    sum_v |d(p, v) - x| ou sum_v max(0, d(p, v) - x), x = d(p, s)
+    """
+    INF = float('inf')
+    finitas = sorted(d for d in distancias if d != INF)
+    m = len(finitas)
+    prefixo = [0] * (m + 1)
+    for i, d in enumerate(finitas):
+        prefixo[i + 1] = prefixo[i] + d
+    total = prefixo[m]
+
+    for s, x in enumerate(distancias):
+        if x == INF:
+            continue
+        if m < n:
+            # p alcança s mas não alcança algum v: s também não alcança v
+            limite = INF
+        elif direcionado:
+            i = bisect_right(finitas, x)
+            limite = (total - prefixo[i]) - x * (m - i)
+        else:
+            i = bisect_left(finitas, x)
+            limite = x * i - prefixo[i] + (total - prefixo[i]) - x * (m - i)
+        if h is not None and limite != INF:
+            limite = limite - n * h[s] + soma_h
+        if limite > limites[s]:
+            limites[s] = limite
+
+def estacao_central(grafo: Grafo, k: int = 1, podar: bool = True, pivos: int = 4,
+                    estatisticas: Estatisticas = None) -> Tuple[List[Tuple[int, float, float]], List[float]]:
+    """
+    Estação central e os k melhores candidatos
+
+    Retorna: (candidatos, distancias_central), com candidatos = [(vértice, soma,
+    excentricidade), ...] em ordem crescente de soma e distancias_central a
+    linha de distâncias do primeiro candidato. A excentricidade é a maior
+    distância finita, como no Cenário 1. Só os k candidatos recebem uma busca
+    completa; as demais linhas nunca são guardadas.
+    """
+    candidatos = []
+    distancias_central = []
+    negativo = any(peso < 0 for _, _, peso in grafo.arestas) if limite_pesos_inteiros(grafo) < 0 else False
+    for i, (vertice, soma) in enumerate(somas_distancias(grafo, k, podar, pivos, estatisticas)):
+        if negativo:
+            dist, _, _ = bellman_ford(grafo, vertice)
+        else:
+            dist, _ = dijkstra(grafo, vertice)
+        excentricidade = max((d for d in dist if d != float('inf')), default=0)
+        candidatos.append((vertice, soma, excentricidade))
+        if i == 0:
+            distancias_central = dist
+    return candidatos, distancias_central
+
+def _grau(grafo: Grafo, u: int) -> int:
+    if hasattr(grafo, 'grau'):
+        return grafo.grau(u)
+    return len(grafo.adj_list[u])
@@ -0,0 +1,279 @@
+"""
+Contraction Hierarchies para consultas ponto a ponto repetidas em grafo estático
+
+Pré-processamento: os vértices são contraídos um a um, em ordem de "importância";
+ao contrair v, cada caminho u -> v -> x que não tem alternativa tão curta
+(testemunha) evitando v vira um atalho u -> x que lembra o vértice do meio.
+Consulta: Dijkstra bidirecional que só sobe na hierarquia (para vértices
+contraídos depois), explorando poucas centenas de vértices mesmo em grafos grandes.
+Os caminhos são desempacotados de volta para arestas originais.
+
+Grafos com arestas negativas (e sem ciclos negativos), como os do Cenário 2,
+são reponderados com os potenciais de Johnson antes da contração; as distâncias
+das consultas são convertidas de volta para os pesos originais.
+"""
+
+import heapq
+import time
+from array import array
+from typing import List, Tuple
+
+from algoritmos import Grafo, potenciais_johnson, reponderar
+
+class HierarquiaContracao:
+    """
+    Hierarquia de contração construída a partir de um Grafo
+
+    Atributos de relatório: tempo_preprocessamento (s), num_atalhos e ultima_consulta_assentados
+    """
+
+    def __init__(self, grafo: Grafo, max_assentados_testemunha: int = 100):
+        inicio = time.perf_counter()
+        self.potenciais = None
+        if any(peso < 0 for _, _, peso in grafo.arestas):
+            h, sem_ciclo_negativo = potenciais_johnson(grafo)
+            if not sem_ciclo_negativo:
+                raise ValueError("Grafo com ciclo negativo não admite hierarquia de contração")
+            grafo = reponderar(grafo, h)
+            self.potenciais = h
+
+        self.num_vertices = grafo.num_vertices
+        self.max_assentados_testemunha = max_assentados_testemunha
+        self.num_atalhos = 0
+        self.ultima_consulta_assentados = 0
+
+        n = grafo.num_vertices
+        # Grafo de trabalho: saida[u][v] = peso e entrada[v][u] = peso (menor entre paralelas)
+        self._saida = [{} for _ in range(n)]
+        self._entrada = [{} for _ in range(n)]
+        for u in range(n):
+            for v, peso in grafo.adj_list[u]:
+                if u != v and peso < self._saida[u].get(v, float('inf')):
+                    self._saida[u][v] = peso
+                    self._entrada[v][u] = peso
+
+        # (u, x) -> vértice do meio do atalho u -> x
+        self.meio = {}
+        self.nivel = [0] * n
+        # Arestas para cima: subida[u] para a busca direta, descida[v] para a reversa
+        self.subida = [[] for _ in range(n)]
+        self.descida = [[] for _ in range(n)]
+
+        self._contrair_todos()
+        del self._saida, self._entrada
+        self.tempo_preprocessamento = time.perf_counter() - inicio
+
+    def _contrair_todos(self):
+        n = self.num_vertices
+        contraidos = bytearray(n)
+        vizinhos_contraidos = [0] * n
+        heap = [(self._prioridade(v, vizinhos_contraidos), v) for v in range(n)]
+        heapq.heapify(heap)
+
+        nivel = 0
+        while heap:
+            _, v = heapq.heappop(heap)
+            if contraidos[v]:
+                continue
+            # Atualização preguiçosa: recalcula e só contrai se continuar sendo o menor
+            prioridade = self._prioridade(v, vizinhos_contraidos)
+            if heap and prioridade > heap[0][0]:
+                heapq.heappush(heap, (prioridade, v))
+                continue
+
+            for vizinho in set(self._saida[v]) | set(self._entrada[v]):
+                vizinhos_contraidos[vizinho] += 1
+            self._contrair(v)
+            contraidos[v] = 1
+            self.nivel[v] = nivel
+            nivel += 1
+
+    def _prioridade(self, v: int, vizinhos_contraidos: List[int]) -> int:
+        """Diferença de arestas (atalhos criados - arestas removidas) + vizinhos já contraídos"""
+        atalhos = len(self._atalhos_necessarios(v))
+        return atalhos - len(self._saida[v]) - len(self._entrada[v]) + vizinhos_contraidos[v]
+
+    def _atalhos_necessarios(self, v: int) -> List[Tuple[int, int, int]]:
+        """Atalhos (u, x, peso) exigidos pela contração de v"""
+        saida, entrada = self._saida[v], self._entrada[v]
+        if not saida or not entrada:
+            return []
+        maior_saida = max(saida.values())
+        atalhos = []
+        for u, peso_u in entrada.items():
+            alvos = {x: peso_u + peso_x for x, peso_x in saida.items() if x != u}
+            if not alvos:
+                continue
+            testemunhas = self._busca_testemunha(u, v, peso_u + maior_saida, alvos)
+            for x, peso in alvos.items():
+                if testemunhas.get(x, float('inf')) > peso:
+                    atalhos.append((u, x, peso))
+        return atalhos
+
+    def _busca_testemunha(self, u: int, evitado: int, limite: int, alvos: dict) -> dict:
+        """Dijkstra local a partir de u ignorando evitado, limitado em distância e em assentados"""
+        dist = {u: 0}
+        heap = [(0, u)]
+        assentados = 0
+        restantes = len(alvos)
+        visitados = set()
+        while heap and assentados < self.max_assentados_testemunha and restantes:
+            d, x = heapq.heappop(heap)
+            if x in visitados:
+                continue
+            if d > limite:
+                break
+            visitados.add(x)
+            assentados += 1
+            if x in alvos:
+                restantes -= 1
+            for y, peso in self._saida[x].items():
+                if y != evitado and d + peso < dist.get(y, float('inf')):
+                    dist[y] = d + peso
+                    heapq.heappush(heap, (d + peso, y))
+        return dist
+
+    def _contrair(self, v: int):
+        for u, x, peso in self._atalhos_necessarios(v):
+            if peso < self._saida[u].get(x, float('inf')):
+                self._saida[u][x] = peso
+                self._entrada[x][u] = peso
+                self.meio[(u, x)] = v
+                self.num_atalhos += 1
+
+        # As arestas restantes de v ligam-no a vértices contraídos depois (mais altos)
+        for x, peso in self._saida[v].items():
+            self.subida[v].append((x, peso))
+            del self._entrada[x][v]
+        for u, peso in self._entrada[v].items():
+            self.descida[v].append((u, peso))
+            del self._saida[u][v]
+        self._saida[v] = {}
+        self._entrada[v] = {}
+
+    def consultar(self, origem: int, destino: int) -> Tuple[float, List[int]]:
+        """
+        Distância e caminho (lista de vértices originais, como reconstruir_caminho;
+        [] se não houver caminho) de origem a destino
+        """
+        INF = float('inf')
+        if origem == destino:
+            self.ultima_consulta_assentados = 1
+            return 0, [origem]
+
+        adjacencias = (self.subida, self.descida)
+        dist = ({origem: 0}, {destino: 0})
+        anterior = ({origem: -1}, {destino: -1})
+        heaps = ([(0, origem)], [(0, destino)])
+        visitados = (set(), set())
+        melhor = INF
+        encontro = -1
+
+        # Cada lado avança até que seu menor rótulo não possa mais melhorar a resposta
+        while (heaps[0] and heaps[0][0][0] < melhor) or (heaps[1] and heaps[1][0][0] < melhor):
+            if heaps[0] and heaps[0][0][0] < melhor and \
+                    (not heaps[1] or heaps[1][0][0] >= melhor or heaps[0][0][0] <= heaps[1][0][0]):
+                lado = 0
+            else:
+                lado = 1
+            d, x = heapq.heappop(heaps[lado])
+            if x in visitados[lado]:
+                continue
+            visitados[lado].add(x)
+
+            outro = dist[1 - lado].get(x)
+            if outro is not None and d + outro < melhor:
+                melhor = d + outro
+                encontro = x
+
+            dist_lado = dist[lado]
+            for y, peso in adjacencias[lado][x]:
+                if d + peso < dist_lado.get(y, INF):
+                    dist_lado[y] = d + peso
+                    anterior[lado][y] = x
+                    heapq.heappush(heaps[lado], (d + peso, y))
+
+        self.ultima_consulta_assentados = len(visitados[0]) + len(visitados[1])
+        if encontro == -1:
+            return INF, []
+
+        # Caminho na hierarquia: origem ~> encontro (para frente) e encontro ~> destino (para trás)
+        ida = []
+        x = encontro
+        while x != -1:
+            ida.append(x)
+            x = anterior[0][x]
+        ida.reverse()
+        x = anterior[1][encontro]
+        while x != -1:
+            ida.append(x)
+            x = anterior[1][x]
+
+        if self.potenciais is not None:
+            melhor += self.potenciais[destino] - self.potenciais[origem]
+        return melhor, self._desempacotar(ida)
+
+    def tabela_distancias(self, origens: List[int], destinos: List[int]) -> array:
+        """
+        Tabela muitos-para-muitos no formato de algoritmos.tabela_distancias
+
+        Algoritmo de baldes: uma busca para cima (reversa) a partir de cada destino
+        deixa em cada vértice alcançado v um balde com os pares (j, d(v, destino j)).
+        Depois, cada busca para cima a partir de uma origem só precisa varrer os
+        baldes dos vértices que alcança. O trabalho das T buscas reversas é
+        compartilhado por todas as S origens: são S + T buscas pequenas em vez de S x T.
+        """
+        INF = float('inf')
+        num_destinos = len(destinos)
+        tabela = array('d', [INF]) * (len(origens) * num_destinos)
+
+        baldes = {}
+        for j, destino in enumerate(destinos):
+            for v, d in self._busca_para_cima(destino, self.descida).items():
+                baldes.setdefault(v, []).append((j, d))
+
+        for i, origem in enumerate(origens):
+            base = i * num_destinos
+            for v, d in self._busca_para_cima(origem, self.subida).items():
+                for j, d_destino in baldes.get(v, ()):
+                    if d + d_destino < tabela[base + j]:
+                        tabela[base + j] = d + d_destino
+
+        if self.potenciais is not None:
+            h = self.potenciais
+            for i, origem in enumerate(origens):
+                for j, destino in enumerate(destinos):
+                    tabela[i * num_destinos + j] += h[destino] - h[origem]
+        return tabela
+
+    def _busca_para_cima(self, inicio: int, adjacencia: List[list]) -> dict:
+        """Dijkstra completo no grafo para cima (subida ou descida) a partir de inicio"""
+        dist = {inicio: 0}
+        heap = [(0, inicio)]
+        visitados = set()
+        while heap:
+            d, x = heapq.heappop(heap)
+            if x in visitados:
+                continue
+            visitados.add(x)
+            for y, peso in adjacencia[x]:
+                if d + peso < dist.get(y, float('inf')):
+                    dist[y] = d + peso
+                    heapq.heappush(heap, (d + peso, y))
+        return {x: dist[x] for x in visitados}
+
+    def _desempacotar(self, caminho: List[int]) -> List[int]:
+        """Substitui cada atalho pelo par de arestas que ele representa, recursivamente"""
+        resultado = [caminho[0]]
+        for a, b in zip(caminho, caminho[1:]):
+            pilha = [(a, b)]
+            while pilha:
+                u, x = pilha.pop()
+                m = self.meio.get((u, x))
+                if m is None:
+                    resultado.append(x)
+                else:
+                    # (m, x) é empilhado primeiro para (u, m) sair antes
+                    pilha.append((m, x))
+                    pilha.append((u, m))
+        return resultado
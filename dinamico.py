@@ -0,0 +1,221 @@
+"""
+Atualização incremental de caminhos mínimos após mudanças em arestas
+
+Em vez de refazer dijkstra ou floyd_warshall quando poucas arestas mudam,
+as estruturas abaixo corrigem apenas a região afetada pela mudança.
+Todas assumem pesos não-negativos (mesma hipótese do Dijkstra).
+"""
+
+import heapq
+from typing import List
+
+from algoritmos import Grafo, dijkstra, adjacencia_reversa
+
+class ArvoreCaminhos:
+    """
+    Árvore de caminhos mínimos de uma origem, mantida sob alterações do grafo
+
+    Parte de dist/anterior de dijkstra (calculados no construtor se não forem
+    dados) e mantém a lista de filhos de cada vértice na árvore, além da
+    adjacência reversa. As alterações devem passar por inserir_aresta e
+    alterar_peso, que modificam o Grafo e reparam dist/anterior no lugar.
+
+    - Inserção ou diminuição de peso: propagação estilo Dijkstra a partir do
+      vértice que melhorou, tocando só os vértices cuja distância diminui.
+    - Aumento de peso de uma aresta da árvore: os descendentes que não têm outro
+      predecessor com a mesma distância formam o conjunto afetado, que é
+      recalculado a partir das arestas vindas de fora dele.
+    Aumentos em arestas fora da árvore não mudam nenhuma distância.
+    """
+
+    def __init__(self, grafo: Grafo, origem: int, dist: List[int] = None, anterior: List[int] = None):
+        if dist is None or anterior is None:
+            dist, anterior = dijkstra(grafo, origem)
+        self.grafo = grafo
+        self.origem = origem
+        self.dist = dist
+        self.anterior = anterior
+        # Grafo não-direcionado: a adjacência reversa é a própria adj_list
+        if grafo.direcionado:
+            self._reversa = adjacencia_reversa(grafo)
+        else:
+            self._reversa = grafo.adj_list
+        self._filhos = {}
+        for v, pai in enumerate(anterior):
+            if pai != -1:
+                self._filhos.setdefault(pai, set()).add(v)
+
+    def inserir_aresta(self, u: int, v: int, peso: int) -> int:
+        """Insere a aresta no grafo e repara a árvore; retorna quantas distâncias mudaram"""
+        self.grafo.adicionar_aresta(u, v, peso)
+        if self.grafo.direcionado:
+            self._reversa[v].append((u, peso))
+        return self._diminuir(u, v, peso)
+
+    def alterar_peso(self, u: int, v: int, peso: int) -> int:
+        """Altera o peso da aresta no grafo e repara a árvore; retorna quantas distâncias mudaram"""
+        peso_antigo = self.grafo.alterar_peso(u, v, peso)
+        if self.grafo.direcionado:
+            vizinhos = self._reversa[v]
+            vizinhos[vizinhos.index((u, peso_antigo))] = (u, peso)
+
+        if peso < peso_antigo:
+            return self._diminuir(u, v, peso)
+        if peso > peso_antigo:
+            mudaram = self._aumentar(u, v)
+            if not self.grafo.direcionado:
+                mudaram += self._aumentar(v, u)
+            return mudaram
+        return 0
+
+    def _diminuir(self, u: int, v: int, peso: int) -> int:
+        dist = self.dist
+        heap = []
+        for a, b in ((u, v), (v, u)) if not self.grafo.direcionado else ((u, v),):
+            if dist[a] + peso < dist[b]:
+                dist[b] = dist[a] + peso
+                self._reparentar(b, a)
+                heapq.heappush(heap, (dist[b], b))
+
+        mudaram = set()
+        while heap:
+            d, x = heapq.heappop(heap)
+            if d > dist[x]:
+                continue
+            mudaram.add(x)
+            for y, w in self.grafo.adj_list[x]:
+                if d + w < dist[y]:
+                    dist[y] = d + w
+                    self._reparentar(y, x)
+                    heapq.heappush(heap, (dist[y], y))
+        return len(mudaram)
+
+    def _aumentar(self, u: int, v: int) -> int:
+        INF = float('inf')
+        dist, anterior = self.dist, self.anterior
+        if anterior[v] != u:
+            return 0
+
+        # Fase 1: identificar os afetados, em ordem de distância, na subárvore de v.
+        # Um vértice não é afetado se tiver predecessor fora dos afetados que o
+        # alcança com a mesma distância; nesse caso só troca de pai na árvore.
+        afetados = set()
+        pendentes = {v}
+        heap = [(dist[v], v)]
+        while heap:
+            _, x = heapq.heappop(heap)
+            pendentes.discard(x)
+            apoio = self._apoio(x, afetados, pendentes)
+            if apoio != -1:
+                self._reparentar(x, apoio)
+                continue
+            afetados.add(x)
+            for filho in self._filhos.get(x, ()):
+                if filho not in pendentes:
+                    pendentes.add(filho)
+                    heapq.heappush(heap, (dist[filho], filho))
+
+        # Fase 2: recalcular os afetados a partir das arestas que vêm de fora deles
+        antigas = {x: dist[x] for x in afetados}
+        for x in afetados:
+            self._reparentar(x, -1)
+            dist[x] = INF
+        heap = []
+        for x in afetados:
+            for y, w in self._reversa[x]:
+                if y not in afetados and dist[y] + w < dist[x]:
+                    dist[x] = dist[y] + w
+                    self._reparentar(x, y)
+            if dist[x] != INF:
+                heap.append((dist[x], x))
+        heapq.heapify(heap)
+
+        while heap:
+            d, x = heapq.heappop(heap)
+            if d > dist[x]:
+                continue
+            for y, w in self.grafo.adj_list[x]:
+                if y in afetados and d + w < dist[y]:
+                    dist[y] = d + w
+                    self._reparentar(y, x)
+                    heapq.heappush(heap, (dist[y], y))
+
+        return sum(1 for x, d in antigas.items() if dist[x] != d)
+
+    def _apoio(self, x: int, afetados: set, pendentes: set) -> int:
+        """Predecessor não afetado que mantém dist[x], ou -1"""
+        dist = self.dist
+        for y, w in self._reversa[x]:
+            if y in afetados or y in pendentes or dist[y] + w != dist[x]:
+                continue
+            # Com peso 0, y pode ser descendente de x com a mesma distância
+            if w == 0 and self._descende_de(y, x):
+                continue
+            return y
+        return -1
+
+    def _descende_de(self, y: int, x: int) -> bool:
+        """Se y está na subárvore de x (só sobe enquanto a distância for igual à de x)"""
+        dist, anterior = self.dist, self.anterior
+        while y != -1 and dist[y] == dist[x]:
+            if y == x:
+                return True
+            y = anterior[y]
+        return False
+
+    def _reparentar(self, x: int, pai: int):
+        antigo = self.anterior[x]
+        if antigo != -1:
+            self._filhos[antigo].discard(x)
+        self.anterior[x] = pai
+        if pai != -1:
+            self._filhos.setdefault(pai, set()).add(x)
+
+def diminuir_aresta_matriz(matriz: List[List[int]], u: int, v: int, peso: int,
+                           direcionado: bool = True) -> int:
+    """
+    Atualiza no lugar a matriz de floyd_warshall após inserir a aresta (u, v)
+    ou diminuir seu peso para peso.
+
+    Um par (i, j) só melhora se d(i, u) + peso + d(v, j) < d(i, j); basta então
+    percorrer as linhas i em que d(i, u) + peso < d(i, v) e, nelas, as colunas j
+    em que peso + d(v, j) < d(u, j). Retorna quantas células mudaram.
+    """
+    INF = float('inf')
+    n = len(matriz)
+    mudaram = 0
+    for a, b in ((u, v),) if direcionado else ((u, v), (v, u)):
+        linha_b = matriz[b]
+        linhas = [i for i in range(n) if matriz[i][a] + peso < matriz[i][b]]
+        colunas = [j for j in range(n) if peso + linha_b[j] < matriz[a][j]]
+        # Copia a linha de b: ela própria pode mudar durante a atualização
+        linha_b = linha_b[:]
+        for i in linhas:
+            linha_i = matriz[i]
+            base = linha_i[a] + peso
+            if base == INF:
+                continue
+            for j in colunas:
+                if base + linha_b[j] < linha_i[j]:
+                    linha_i[j] = base + linha_b[j]
+                    mudaram += 1
+    return mudaram
+
+def aumentar_aresta_matriz(matriz: List[List[int]], grafo: Grafo, u: int, v: int, peso_antigo: int) -> int:
+    """
+    Atualiza no lugar a matriz de floyd_warshall após o aumento de peso da aresta (u, v),
+    já aplicado em grafo (por Grafo.alterar_peso).
+
+    Só podem piorar as linhas i em que a aresta era usada: d(i, u) + peso_antigo = d(i, v).
+    Essas linhas são refeitas com dijkstra a partir de i. Retorna quantas células mudaram.
+    """
+    INF = float('inf')
+    pares = ((u, v),) if grafo.direcionado else ((u, v), (v, u))
+    linhas = [i for i in range(len(matriz))
+              if any(matriz[i][a] != INF and matriz[i][a] + peso_antigo == matriz[i][b] for a, b in pares)]
+    mudaram = 0
+    for i in linhas:
+        dist, _ = dijkstra(grafo, i)
+        mudaram += sum(1 for antigo, novo in zip(matriz[i], dist) if antigo != novo)
+        matriz[i] = dist
+    return mudaram
@@ -0,0 +1,102 @@
+"""
+Geradores de entradas sintéticas (com semente) para testes de desempenho
+
+Todos os geradores são determinísticos para a mesma semente, de forma que
+resultados de benchmarks feitos em momentos diferentes sejam comparáveis.
+"""
+
+import random
+from typing import List, Tuple
+
+from algoritmos import Grafo
+
+def gerar_grafo_esparso(num_vertices: int, arestas_por_vertice: int = 3, direcionado: bool = True,
+                        peso_max: int = 30, semente: int = 0) -> Grafo:
+    """Grafo aleatório com arestas_por_vertice arestas saindo de cada vértice, pesos em [1, peso_max]"""
+    rng = random.Random(semente)
+    grafo = Grafo(num_vertices, direcionado)
+    for u in range(num_vertices):
+        for v in _vizinhos_distintos(rng, num_vertices, u, arestas_por_vertice):
+            grafo.adicionar_aresta(u, v, rng.randint(1, peso_max))
+    return grafo
+
+def gerar_grafo_denso(num_vertices: int, densidade: float = 0.5, direcionado: bool = True,
+                      peso_max: int = 30, semente: int = 0) -> Grafo:
+    """Grafo em que cada par ordenado (u, v), u != v, vira aresta com probabilidade densidade"""
+    rng = random.Random(semente)
+    grafo = Grafo(num_vertices, direcionado)
+    for u in range(num_vertices):
+        # Em grafos não-direcionados cada par é sorteado uma vez só
+        for v in range(0 if direcionado else u + 1, num_vertices):
+            if u != v and rng.random() < densidade:
+                grafo.adicionar_aresta(u, v, rng.randint(1, peso_max))
+    return grafo
+
+def gerar_grafo_negativo(num_vertices: int, arestas_por_vertice: int = 3, peso_max: int = 20,
+                         amplitude_potencial: int = 40, semente: int = 0) -> Grafo:
+    """
+    Grafo direcionado com arestas negativas e sem ciclos negativos
+
+    Cada vértice recebe um potencial p(v) e as arestas têm peso base + p(u) - p(v),
+    com base em [1, peso_max]. Ao longo de um ciclo os potenciais se cancelam, então
+    todo ciclo custa a soma das bases (> 0), mas muitas arestas ficam negativas.
+    Não gera laços nem arestas paralelas.
+    """
+    rng = random.Random(semente)
+    potencial = [rng.randint(0, amplitude_potencial) for _ in range(num_vertices)]
+    grafo = Grafo(num_vertices, direcionado=True)
+    for u in range(num_vertices):
+        for v in _vizinhos_distintos(rng, num_vertices, u, arestas_por_vertice):
+            grafo.adicionar_aresta(u, v, rng.randint(1, peso_max) + potencial[u] - potencial[v])
+    return grafo
+
+def gerar_grid(linhas: int, colunas: int, prob_obstaculo: float = 0.2, prob_dificil: float = 0.15,
+               semente: int = 0) -> Tuple[List[List[str]], Tuple[int, int], Tuple[int, int]]:
+    """
+    Grid de armazém com obstáculos '#', piso difícil '~' e células livres '.'
+    S fica no canto superior esquerdo e G no inferior direito (sempre livres).
+    Retorna: (grid, posição_inicial, posição_objetivo), como ler_grid_arquivo
+    """
+    rng = random.Random(semente)
+    grid = []
+    for _ in range(linhas):
+        linha = []
+        for _ in range(colunas):
+            sorteio = rng.random()
+            if sorteio < prob_obstaculo:
+                linha.append('#')
+            elif sorteio < prob_obstaculo + prob_dificil:
+                linha.append('~')
+            else:
+                linha.append('.')
+        grid.append(linha)
+
+    pos_inicial = (0, 0)
+    pos_objetivo = (linhas - 1, colunas - 1)
+    grid[pos_inicial[0]][pos_inicial[1]] = 'S'
+    grid[pos_objetivo[0]][pos_objetivo[1]] = 'G'
+    return grid, pos_inicial, pos_objetivo
+
+def escrever_grafo_arquivo(grafo: Grafo, nome_arquivo: str, index_base: int = 0):
+    """Grava o grafo no formato lido por ler_grafo_arquivo"""
+    with open(nome_arquivo, 'w') as arquivo:
+        arquivo.write(f"{grafo.num_vertices} {len(grafo.arestas)}\n")
+        for u, v, peso in grafo.arestas:
+            arquivo.write(f"{u + index_base} {v + index_base} {peso}\n")
+
+def escrever_grid_arquivo(grid: List[List[str]], nome_arquivo: str):
+    """Grava o grid no formato lido por ler_grid_arquivo"""
+    with open(nome_arquivo, 'w') as arquivo:
+        arquivo.write(f"{len(grid)} {len(grid[0])}\n")
+        for linha in grid:
+            arquivo.write(''.join(linha) + "\n")
+
+def _vizinhos_distintos(rng: random.Random, num_vertices: int, u: int, quantidade: int) -> List[int]:
+    """Sorteia até quantidade vértices distintos e diferentes de u"""
+    quantidade = min(quantidade, num_vertices - 1)
+    vizinhos = set()
+    while len(vizinhos) < quantidade:
+        v = rng.randrange(num_vertices)
+        if v != u:
+            vizinhos.add(v)
+    return sorted(vizinhos)
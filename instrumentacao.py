@@ -0,0 +1,56 @@
+"""
+Instrumentação opcional dos algoritmos e cenários
+
+As funções de busca aceitam estatisticas=None; com um objeto Estatisticas elas
+somam contadores (inserções e remoções da fila, remoções obsoletas, relaxamentos,
+passes, vértices assentados). Os contadores são derivados de poucos inteiros
+locais atualizados fora do laço de arestas, então desligada (None) a
+instrumentação custa praticamente nada. Os cenários medem o tempo de cada fase
+(carga, construção do grafo, busca, reconstrução) com medir_fase.
+"""
+
+import json
+import time
+from contextlib import contextmanager, nullcontext
+
+class Estatisticas:
+    """Contadores e tempos por fase de uma execução"""
+
+    def __init__(self, nome: str = ''):
+        self.nome = nome
+        self.contadores = {}
+        # fase -> segundos (somados se a fase se repetir)
+        self.tempos = {}
+
+    def somar(self, contador: str, valor: int = 1):
+        self.contadores[contador] = self.contadores.get(contador, 0) + valor
+
+    @contextmanager
+    def fase(self, nome: str):
+        """Cronometra o bloco e soma o tempo em tempos[nome]"""
+        inicio = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.tempos[nome] = self.tempos.get(nome, 0.0) + time.perf_counter() - inicio
+
+    def como_dict(self) -> dict:
+        return {'nome': self.nome, 'tempos_s': dict(self.tempos), 'contadores': dict(self.contadores)}
+
+    def como_json(self) -> str:
+        return json.dumps(self.como_dict(), indent=2, ensure_ascii=False)
+
+    def resumo(self) -> str:
+        """Texto com uma linha por fase e por contador"""
+        linhas = [f"Estatísticas{' - ' + self.nome if self.nome else ''}:"]
+        for fase, segundos in self.tempos.items():
+            linhas.append(f"  tempo {fase}: {segundos * 1000:.3f} ms")
+        for contador, valor in self.contadores.items():
+            linhas.append(f"  {contador}: {valor}")
+        return "\n".join(linhas)
+
+def medir_fase(estatisticas: Estatisticas, nome: str):
+    """estatisticas.fase(nome), ou um contexto vazio se estatisticas for None"""
+    if estatisticas is None:
+        return nullcontext()
+    return estatisticas.fase(nome)
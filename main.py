@@ -2,77 +2,168 @@
 Script principal
 """
 
+import json
 import sys
 import os
 
+from instrumentacao import Estatisticas
+from utils import escrever_json, escrever_matriz_binaria
+
+# Estatísticas coletadas nesta execução (preenchida só com --estatisticas/--estatisticas-json)
+coletadas = []
+# Resultados dos cenários executados, para --saida-json e --matriz-binaria
+resultados = []
+opcoes = {'imprimir': False, 'json': None, 'quieto': False, 'saida_json': None, 'matriz_binaria': None}
+
+def nova_estatistica(nome: str):
+    """Estatisticas para um cenário, ou None se a instrumentação estiver desligada"""
+    if not opcoes['imprimir'] and opcoes['json'] is None:
+        return None
+    estatisticas = Estatisticas(nome)
+    coletadas.append(estatisticas)
+    return estatisticas
+
+def relatar(estatisticas):
+    if estatisticas is not None and opcoes['imprimir']:
+        print("\n" + estatisticas.resumo())
+
+def anunciar(*linhas: str):
+    """print das mensagens do script principal, suprimido por --quieto"""
+    if not opcoes['quieto']:
+        for linha in linhas:
+            print(linha)
+
+def separar_opcoes(argumentos):
+    """
+    Remove as opções (--estatisticas, --quieto, --saida-json ARQUIVO, ...) de argumentos, preenchendo opcoes
+    ValueError se uma opção que exige arquivo vier sem ele.
+    """
+    com_arquivo = {"--estatisticas-json": 'json', "--saida-json": 'saida_json', "--matriz-binaria": 'matriz_binaria'}
+    restantes = []
+    i = 0
+    while i < len(argumentos):
+        if argumentos[i] == "--estatisticas":
+            opcoes['imprimir'] = True
+        elif argumentos[i] == "--quieto":
+            opcoes['quieto'] = True
+        elif argumentos[i] in com_arquivo:
+            if i + 1 == len(argumentos) or argumentos[i + 1].startswith("--"):
+                raise ValueError(f"{argumentos[i]} exige o nome de um arquivo")
+            opcoes[com_arquivo[argumentos[i]]] = argumentos[i + 1]
+            i += 1
+        else:
+            restantes.append(argumentos[i])
+        i += 1
+    return restantes
+
+def gravar_estatisticas():
+    if opcoes['json'] is not None:
+        with open(opcoes['json'], 'w') as arquivo:
+            json.dump([e.como_dict() for e in coletadas], arquivo, indent=2, ensure_ascii=False)
+        anunciar(f"\nEstatísticas gravadas em {opcoes['json']}")
+
+def gravar_resultados():
+    """Grava os resultados em JSON e/ou a matriz do Cenário 1 em binário, linha a linha"""
+    if opcoes['saida_json'] is not None:
+        with open(opcoes['saida_json'], 'w') as arquivo:
+            escrever_json([r.como_dict() for r in resultados], arquivo)
+        anunciar(f"\nResultados gravados em {opcoes['saida_json']}")
+    if opcoes['matriz_binaria'] is not None:
+        for resultado in resultados:
+            if hasattr(resultado, 'linhas_matriz'):
+                escrever_matriz_binaria(resultado.linhas_matriz(), opcoes['matriz_binaria'], resultado.num_vertices)
+                anunciar(f"\nMatriz de distâncias gravada em {opcoes['matriz_binaria']}")
+
+def executar_cenario(numero: str):
+    """Calcula o cenário, imprime o relatório (salvo com --quieto) e guarda o resultado"""
+    estatisticas = nova_estatistica(f"cenario{numero}")
+    if numero == "1":
+        from cenario1 import calcular_estacao_central, imprimir_estacao_central
+        resultado = calcular_estacao_central("graph1.txt", estatisticas)
+        imprimir = imprimir_estacao_central
+    elif numero == "2":
+        from cenario2 import calcular_caminho_carro, imprimir_caminho_carro
+        resultado = calcular_caminho_carro("graph2.txt", 0, 6, estatisticas)
+        imprimir = imprimir_caminho_carro
+    else:
+        from cenario3 import calcular_caminho_robo, imprimir_caminho_robo
+        resultado = calcular_caminho_robo("grid_example.txt", estatisticas)
+        imprimir = imprimir_caminho_robo
+    resultados.append(resultado)
+    if not opcoes['quieto']:
+        imprimir(resultado)
+    relatar(estatisticas)
+
 def executar_cenarios():
     """Executa todos os três cenários"""
     
-    print("=" * 80)
-    print("ALGORITMOS DE CAMINHO MÍNIMO")
-    print("=" * 80)
+    anunciar("=" * 80, "ALGORITMOS DE CAMINHO MÍNIMO", "=" * 80)
     
     # Importar os módulos dos cenários
     try:
-        from cenario1 import encontrar_estacao_central
-        from cenario2 import otimizar_caminho_carro
-        from cenario3 import encontrar_caminho_robo
+        import cenario1, cenario2, cenario3
     except ImportError as e:
         print(f"Erro ao importar módulos: {e}")
         return
     
-    print("\n" + "=" * 80)
-    print("EXECUTANDO TODOS OS CENÁRIOS")
-    print("=" * 80)
+    anunciar("\n" + "=" * 80, "EXECUTANDO TODOS OS CENÁRIOS", "=" * 80)
     
     # Cenário 1
     try:
-        print("\n")
-        encontrar_estacao_central("graph1.txt")
+        anunciar("\n")
+        executar_cenario("1")
     except Exception as e:
         print(f"Erro no Cenário 1: {e}")
     
     # Cenário 2  
     try:
-        print("\n" + "=" * 80)
-        otimizar_caminho_carro("graph2.txt", 0, 6)
+        anunciar("\n" + "=" * 80)
+        executar_cenario("2")
     except Exception as e:
         print(f"Erro no Cenário 2: {e}")
     
     # Cenário 3
     try:
-        print("\n" + "=" * 80)
-        encontrar_caminho_robo("grid_example.txt")
+        anunciar("\n" + "=" * 80)
+        executar_cenario("3")
     except Exception as e:
         print(f"Erro no Cenário 3: {e}")
     
-    print("\n" + "=" * 80)
-    print("EXECUÇÃO COMPLETA!")
-    print("=" * 80)
+    anunciar("\n" + "=" * 80, "EXECUÇÃO COMPLETA!", "=" * 80)
+
+def imprimir_uso():
+    print("Uso: python main.py [1|2|3|todos] [--quieto] [--saida-json ARQUIVO] [--matriz-binaria ARQUIVO]")
+    print("                    [--estatisticas] [--estatisticas-json ARQUIVO]")
+    print("  1 - Cenário 1: Estação Central")
+    print("  2 - Cenário 2: Carro Elétrico") 
+    print("  3 - Cenário 3: Robô de Armazém")
+    print("  todos - Executar todos os cenários")
+    print("  --estatisticas - imprimir tempos por fase e contadores de cada cenário")
+    print("  --estatisticas-json ARQUIVO - gravar as estatísticas em JSON")
+    print("  --quieto - não imprimir os relatórios dos cenários")
+    print("  --saida-json ARQUIVO - gravar os resultados dos cenários em JSON")
+    print("  --matriz-binaria ARQUIVO - gravar a matriz do Cenário 1 em binário (float64)")
 
 def main():
-    if len(sys.argv) > 1:
-        cenario = sys.argv[1]
+    try:
+        argumentos = separar_opcoes(sys.argv[1:])
+    except ValueError as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        imprimir_uso()
+        sys.exit(2)
+    if argumentos:
+        cenario = argumentos[0]
         
-        if cenario == "1":
-            from cenario1 import encontrar_estacao_central
-            encontrar_estacao_central("graph1.txt")
-        elif cenario == "2":
-            from cenario2 import otimizar_caminho_carro
-            otimizar_caminho_carro("graph2.txt", 0, 6)
-        elif cenario == "3":
-            from cenario3 import encontrar_caminho_robo
-            encontrar_caminho_robo("grid_example.txt")
+        if cenario in ("1", "2", "3"):
+            executar_cenario(cenario)
         elif cenario == "todos" or cenario == "all":
             executar_cenarios()
         else:
-            print("Uso: python main.py [1|2|3|todos]")
-            print("  1 - Cenário 1: Estação Central")
-            print("  2 - Cenário 2: Carro Elétrico") 
-            print("  3 - Cenário 3: Robô de Armazém")
-            print("  todos - Executar todos os cenários")
+            imprimir_uso()
     else:
         executar_cenarios()
+    gravar_resultados()
+    gravar_estatisticas()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,253 @@
+"""
+Matriz de distâncias de todos os pares gravada em disco (fora da memória)
+
+floyd_warshall guarda a matriz como listas de listas (um ponteiro e um float
+por célula), então n = 20.000 já não cabe na memória. Aqui cada célula ocupa
+4 bytes (int32) em um arquivo, com SENTINELA marcando "inalcançável", e a
+matriz nunca é carregada inteira:
+
+- construção por buscas ('dijkstra'): uma linha por origem, gravada assim que
+  calculada (biblioteca padrão; pesos negativos via potenciais de Johnson);
+- construção por Floyd-Warshall em tiles ('blocos', exige NumPy): as três fases
+  do algoritmo em blocos, lendo e gravando tiles de tamanho_bloco x tamanho_bloco
+  com os.pread/os.pwrite; a memória usada é O(n * tamanho_bloco);
+- leitura preguiçosa: linha(i) lê só os 4n bytes da linha i, e a matriz se
+  comporta como uma sequência de linhas (len, [i], iteração), como a de
+  floyd_warshall, para consumidores no estilo do Cenário 1.
+
+Os pesos precisam ser inteiros e as distâncias finitas devem caber em int32.
+"""
+
+import os
+import struct
+import sys
+from array import array
+from typing import Iterator, List
+
+from algoritmos import Grafo, dijkstra, potenciais_johnson, reponderar
+
+# NumPy é opcional: só a construção 'blocos' depende dele
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Valor gravado nas células inalcançáveis (maior int32)
+SENTINELA = 2 ** 31 - 1
+
+# Cabeçalho: assinatura, versão, little-endian, número de vértices; as linhas
+# vêm em seguida, 4 * n bytes cada, em ordem
+_CABECALHO = struct.Struct('<4sBB2xq')
+_ASSINATURA = b'MDIS'
+_VERSAO = 1
+
+class MatrizDistanciasDisco:
+    """
+    Matriz n x n de distâncias em um arquivo, lida linha a linha sob demanda
+
+    Abre um arquivo gravado por construir. Deve ser fechada (fechar ou with).
+    """
+
+    def __init__(self, nome_arquivo: str):
+        self.nome_arquivo = nome_arquivo
+        self._fd = os.open(nome_arquivo, os.O_RDONLY)
+        assinatura, versao, little_endian, n = _CABECALHO.unpack(os.pread(self._fd, _CABECALHO.size, 0))
+        if assinatura != _ASSINATURA or versao != _VERSAO:
+            os.close(self._fd)
+            raise ValueError(f"{nome_arquivo} não é uma matriz de distâncias reconhecida")
+        if little_endian != (sys.byteorder == 'little'):
+            os.close(self._fd)
+            raise ValueError(f"{nome_arquivo} foi gravado com outra ordem de bytes")
+        self.num_vertices = n
+
+    @classmethod
+    def construir(cls, grafo: Grafo, nome_arquivo: str, metodo: str = 'auto',
+                  tamanho_bloco: int = 512) -> 'MatrizDistanciasDisco':
+        """
+        Calcula todas as distâncias de grafo direto para nome_arquivo e abre o resultado
+
+        metodo: 'dijkstra', 'blocos' ou 'auto' ('blocos' se houver NumPy e o grafo
+        tiver mais de 10% das arestas possíveis, senão 'dijkstra').
+        ValueError para pesos não inteiros ou ciclo negativo; OverflowError se
+        alguma distância não couber em int32.
+        """
+        n = grafo.num_vertices
+        if any(not isinstance(peso, int) for _, _, peso in grafo.arestas):
+            raise ValueError("MatrizDistanciasDisco exige pesos inteiros")
+        if metodo == 'auto':
+            num_entradas = sum(1 for _ in grafo.arestas) * (1 if grafo.direcionado else 2)
+            metodo = 'blocos' if np is not None and num_entradas > 0.1 * n * n else 'dijkstra'
+        if metodo == 'blocos' and np is None:
+            raise ImportError("O método 'blocos' de MatrizDistanciasDisco exige NumPy")
+        if metodo not in ('dijkstra', 'blocos'):
+            raise ValueError(f"Método desconhecido para MatrizDistanciasDisco: {metodo}")
+
+        fd = os.open(nome_arquivo, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.pwrite(fd, _CABECALHO.pack(_ASSINATURA, _VERSAO, sys.byteorder == 'little', n), 0)
+            os.ftruncate(fd, _CABECALHO.size + 4 * n * n)
+            if metodo == 'dijkstra':
+                _preencher_por_buscas(fd, grafo)
+            else:
+                _preencher_por_blocos(fd, grafo, tamanho_bloco)
+        finally:
+            os.close(fd)
+        return cls(nome_arquivo)
+
+    def linha_compacta(self, i: int) -> array:
+        """Linha i como array('i'), com SENTINELA nas células inalcançáveis"""
+        if not 0 <= i < self.num_vertices:
+            raise IndexError(f"Linha {i} fora da matriz")
+        linha = array('i')
+        linha.frombytes(os.pread(self._fd, 4 * self.num_vertices, _posicao(self.num_vertices, i, 0)))
+        if sys.byteorder != 'little':
+            linha.byteswap()
+        return linha
+
+    def linha(self, i: int) -> List[float]:
+        """Linha i como em floyd_warshall: inteiros, e inf nas células inalcançáveis"""
+        INF = float('inf')
+        return [d if d != SENTINELA else INF for d in self.linha_compacta(i)]
+
+    def distancia(self, i: int, j: int) -> float:
+        d = struct.unpack('<i', os.pread(self._fd, 4, _posicao(self.num_vertices, i, j)))[0]
+        return d if d != SENTINELA else float('inf')
+
+    def somas(self) -> List[float]:
+        """Soma de cada linha (inf se houver célula inalcançável), lendo uma linha por vez"""
+        resultado = []
+        for i in range(self.num_vertices):
+            linha = self.linha_compacta(i)
+            resultado.append(float('inf') if SENTINELA in linha else sum(linha))
+        return resultado
+
+    def __len__(self) -> int:
+        return self.num_vertices
+
+    def __getitem__(self, i: int) -> List[float]:
+        return self.linha(i)
+
+    def __iter__(self) -> Iterator[List[float]]:
+        for i in range(self.num_vertices):
+            yield self.linha(i)
+
+    def fechar(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+def _posicao(n: int, i: int, j: int) -> int:
+    return _CABECALHO.size + 4 * (i * n + j)
+
+def _para_int32(valores, n: int) -> bytes:
+    """Distâncias (com inf) -> bytes int32 little-endian com SENTINELA"""
+    INF = float('inf')
+    linha = array('i', [0]) * n
+    for j, d in enumerate(valores):
+        if d == INF:
+            linha[j] = SENTINELA
+        elif not -SENTINELA < d < SENTINELA:
+            raise OverflowError(f"Distância {d} não cabe em int32")
+        else:
+            linha[j] = d
+    if sys.byteorder != 'little':
+        linha.byteswap()
+    return linha.tobytes()
+
+def _preencher_por_buscas(fd: int, grafo: Grafo):
+    """Uma busca por origem; pesos negativos são reponderados com os potenciais de Johnson"""
+    n = grafo.num_vertices
+    h = None
+    if any(peso < 0 for _, _, peso in grafo.arestas):
+        h, sem_ciclo_negativo = potenciais_johnson(grafo)
+        if not sem_ciclo_negativo:
+            raise ValueError("Grafo com ciclo negativo: distâncias indefinidas")
+        grafo = reponderar(grafo, h)
+
+    INF = float('inf')
+    for origem in range(n):
+        dist, _ = dijkstra(grafo, origem)
+        if h is not None:
+            # d(u, v) = d'(u, v) - h[u] + h[v]
+            dist = [d - h[origem] + h[v] if d != INF else INF for v, d in enumerate(dist)]
+        os.pwrite(fd, _para_int32(dist, n), _posicao(n, origem, 0))
+
+def _preencher_por_blocos(fd: int, grafo: Grafo, b: int):
+    """
+    Floyd-Warshall em blocos (mesmas três fases de algoritmos._floyd_warshall_blocos)
+    com os tiles lidos e gravados no arquivo. Em memória ficam só o tile diagonal,
+    a faixa de linhas do bloco K e um tile por vez, em int64 com INFINITO no lugar de
+    SENTINELA (a soma de dois INFINITO ainda não estoura int64).
+    """
+    n = grafo.num_vertices
+    INFINITO = 2 ** 60
+    blocos = [(ini, min(ini + b, n)) for ini in range(0, n, b)]
+
+    def ler(i0: int, i1: int, j0: int, j1: int):
+        tile = np.empty((i1 - i0, j1 - j0), dtype='<i4')
+        for r in range(i0, i1):
+            tile[r - i0] = np.frombuffer(os.pread(fd, 4 * (j1 - j0), _posicao(n, r, j0)), dtype='<i4')
+        valores = tile.astype(np.int64)
+        valores[tile == SENTINELA] = INFINITO
+        return valores
+
+    def gravar(valores, i0: int, j0: int):
+        inalcancavel = valores >= INFINITO // 2
+        if (valores[~inalcancavel] >= SENTINELA).any() or (valores <= -SENTINELA).any():
+            raise OverflowError("Distância não cabe em int32")
+        tile = np.where(inalcancavel, SENTINELA, valores).astype('<i4')
+        for r in range(tile.shape[0]):
+            os.pwrite(fd, tile[r].tobytes(), _posicao(n, i0 + r, j0))
+
+    def fechar(destino, coluna_k, linha_k):
+        for k in range(coluna_k.shape[1]):
+            np.minimum(destino, coluna_k[:, k, None] + linha_k[None, k, :], out=destino)
+
+    # D⁽⁰⁾ ← W, uma faixa de linhas por vez (menor peso entre arestas paralelas)
+    for i0, i1 in blocos:
+        faixa = np.full((i1 - i0, n), INFINITO, dtype=np.int64)
+        for u in range(i0, i1):
+            for v, peso in grafo.adj_list[u]:
+                if peso < faixa[u - i0, v]:
+                    faixa[u - i0, v] = peso
+        faixa[np.arange(i1 - i0), np.arange(i0, i1)] = np.minimum(faixa[np.arange(i1 - i0), np.arange(i0, i1)], 0)
+        gravar(faixa, i0, 0)
+
+    for k0, k1 in blocos:
+        # Fase 1: bloco diagonal
+        kk = ler(k0, k1, k0, k1)
+        fechar(kk, kk, kk)
+        gravar(kk, k0, k0)
+
+        # Fase 2: faixa de linhas do bloco K (mantida para a fase 3) e coluna K
+        faixa_k = ler(k0, k1, 0, n)
+        for i0, i1 in blocos:
+            if i0 == k0:
+                continue
+            fechar(faixa_k[:, i0:i1], kk, faixa_k[:, i0:i1])
+        gravar(faixa_k, k0, 0)
+
+        # Fase 3: cada faixa de linhas I usa sua coluna K (fechada primeiro) e a faixa K
+        for i0, i1 in blocos:
+            if i0 == k0:
+                continue
+            coluna_k = ler(i0, i1, k0, k1)
+            fechar(coluna_k, coluna_k, kk)
+            gravar(coluna_k, i0, k0)
+            for j0, j1 in blocos:
+                if j0 == k0:
+                    continue
+                tile = ler(i0, i1, j0, j1)
+                fechar(tile, coluna_k, faixa_k[:, j0:j1])
+                gravar(tile, i0, j0)
+
+    # Ciclo negativo: alguma distância de um vértice a si mesmo ficou negativa
+    for i in range(n):
+        if struct.unpack('<i', os.pread(fd, 4, _posicao(n, i, i)))[0] < 0:
+            raise ValueError("Grafo com ciclo negativo: distâncias indefinidas")
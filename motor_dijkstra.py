@@ -0,0 +1,192 @@
+"""
+Dijkstra com heap indexado (decrease-key) e área de trabalho reutilizável
+
+Para muitas buscas seguidas no mesmo grafo (várias origens, serviço de rotas),
+MotorDijkstra aloca uma única vez os buffers de distância, predecessor, marcação
+de assentados e posição no heap. Entre uma busca e outra só as entradas tocadas
+são restauradas, então o custo de preparação é proporcional aos vértices
+alcançados, e não a V.
+"""
+
+import heapq
+from array import array
+from typing import List, Tuple
+
+from algoritmos import Grafo
+
+class HeapIndexado:
+    """
+    Heap binário de mínimo sobre os vértices 0..n-1, com chaves em uma lista externa
+
+    Cada vértice aparece no máximo uma vez (posicao[v] é o índice dele em heap,
+    ou -1), então o heap nunca passa de n elementos e diminuir uma chave é um
+    sift-up em vez de uma nova inserção. Empates são desfeitos pelo número do
+    vértice, a mesma ordem do heap de tuplas (dist, vértice) de dijkstra.
+    """
+
+    def __init__(self, chave: List[float]):
+        self.chave = chave
+        self.heap = []
+        self.posicao = array('i', [-1]) * len(chave)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def inserir_ou_diminuir(self, v: int):
+        """Insere v ou reposiciona-o após chave[v] diminuir"""
+        i = self.posicao[v]
+        if i == -1:
+            i = len(self.heap)
+            self.heap.append(v)
+        self._subir(i, v)
+
+    def extrair_min(self) -> int:
+        heap, posicao = self.heap, self.posicao
+        menor = heap[0]
+        posicao[menor] = -1
+        ultimo = heap.pop()
+        if heap:
+            self._descer(0, ultimo)
+        return menor
+
+    def limpar(self):
+        for v in self.heap:
+            self.posicao[v] = -1
+        self.heap.clear()
+
+    def _subir(self, i: int, v: int):
+        heap, posicao, chave = self.heap, self.posicao, self.chave
+        chave_v = chave[v]
+        while i:
+            pai = (i - 1) >> 1
+            p = heap[pai]
+            chave_p = chave[p]
+            if chave_p < chave_v or (chave_p == chave_v and p < v):
+                break
+            heap[i] = p
+            posicao[p] = i
+            i = pai
+        heap[i] = v
+        posicao[v] = i
+
+    def _descer(self, i: int, v: int):
+        heap, posicao, chave = self.heap, self.posicao, self.chave
+        chave_v = chave[v]
+        tamanho = len(heap)
+        while True:
+            filho = 2 * i + 1
+            if filho >= tamanho:
+                break
+            f = heap[filho]
+            chave_f = chave[f]
+            if filho + 1 < tamanho:
+                g = heap[filho + 1]
+                chave_g = chave[g]
+                if chave_g < chave_f or (chave_g == chave_f and g < f):
+                    filho, f, chave_f = filho + 1, g, chave_g
+            if chave_v < chave_f or (chave_v == chave_f and v < f):
+                break
+            heap[i] = f
+            posicao[f] = i
+            i = filho
+        heap[i] = v
+        posicao[v] = i
+
+class MotorDijkstra:
+    """
+    Buscas de Dijkstra repetidas sobre o mesmo grafo sem realocar buffers
+
+    caminhos(origem) devolve (dist, anterior) idênticos aos de dijkstra. Por padrão
+    são cópias; com copiar=False são os próprios buffers do motor, válidos só até
+    a próxima busca (útil quando o resultado é consumido na hora, como em somas
+    de distâncias ou extração de um caminho).
+
+    fila: 'heap' usa heapq com remoção preguiçosa (mais rápido em CPython, mas o
+    heap pode chegar a E entradas de tuplas); 'indexado' usa HeapIndexado, com no
+    máximo V inteiros no heap, para quando a memória de pico é o que importa.
+    """
+
+    def __init__(self, grafo: Grafo, fila: str = 'heap'):
+        if fila not in ('heap', 'indexado'):
+            raise ValueError(f"Fila desconhecida para MotorDijkstra: {fila}")
+        n = grafo.num_vertices
+        self.grafo = grafo
+        self.fila = fila
+        self.dist = [float('inf')] * n
+        self.anterior = [-1] * n
+        self.assentados = bytearray(n)
+        self._heap_indexado = HeapIndexado(self.dist) if fila == 'indexado' else None
+        self._heap = []
+        # Vértices com dist finita na última busca, restaurados na próxima
+        self._tocados = []
+
+    def caminhos(self, origem: int, copiar: bool = True) -> Tuple[List[int], List[int]]:
+        self._restaurar()
+        self.dist[origem] = 0
+        self._tocados.append(origem)
+        if self._heap_indexado is None:
+            self._buscar_heap(origem)
+        else:
+            self._buscar_indexado(origem)
+        if copiar:
+            return self.dist[:], self.anterior[:]
+        return self.dist, self.anterior
+
+    def _buscar_heap(self, origem: int):
+        INF = float('inf')
+        dist, anterior, assentados = self.dist, self.anterior, self.assentados
+        adj_list, tocados = self.grafo.adj_list, self._tocados
+        heap = self._heap
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        heap.append((0, origem))
+        while heap:
+            dist_u, u = heappop(heap)
+            if assentados[u]:
+                continue
+            assentados[u] = 1
+            for v, peso in adj_list[u]:
+                nova = dist_u + peso
+                antiga = dist[v]
+                if nova < antiga:
+                    if antiga == INF:
+                        tocados.append(v)
+                    dist[v] = nova
+                    anterior[v] = u
+                    heappush(heap, (nova, v))
+
+    def _buscar_indexado(self, origem: int):
+        INF = float('inf')
+        dist, anterior, assentados = self.dist, self.anterior, self.assentados
+        adj_list, tocados = self.grafo.adj_list, self._tocados
+        heap = self._heap_indexado
+        inserir_ou_diminuir, extrair_min = heap.inserir_ou_diminuir, heap.extrair_min
+
+        inserir_ou_diminuir(origem)
+        while heap.heap:
+            u = extrair_min()
+            assentados[u] = 1
+            dist_u = dist[u]
+            for v, peso in adj_list[u]:
+                if assentados[v]:
+                    continue
+                nova = dist_u + peso
+                antiga = dist[v]
+                if nova < antiga:
+                    if antiga == INF:
+                        tocados.append(v)
+                    dist[v] = nova
+                    anterior[v] = u
+                    inserir_ou_diminuir(v)
+
+    def _restaurar(self):
+        INF = float('inf')
+        dist, anterior, assentados = self.dist, self.anterior, self.assentados
+        for v in self._tocados:
+            dist[v] = INF
+            anterior[v] = -1
+            assentados[v] = 0
+        self._tocados.clear()
+        self._heap.clear()
+        if self._heap_indexado is not None:
+            self._heap_indexado.limpar()
@@ -0,0 +1,263 @@
+"""
+Execução de buscas de caminho mínimo em paralelo com um pool de processos
+
+O grafo é convertido uma única vez para GrafoCSR e seus buffers são copiados
+para blocos de memória compartilhada (multiprocessing.shared_memory). Cada
+processo do pool apenas se anexa a esses blocos ao iniciar, então nenhuma
+tarefa precisa serializar o grafo: as tarefas carregam só a lista de origens.
+
+delta_stepping paraleliza uma única busca: os vértices de cada balde de
+distâncias são repartidos entre os processos, que leem o vetor dist em
+memória compartilhada e devolvem só os pedidos de relaxamento que melhoram.
+"""
+
+import heapq
+import os
+from array import array
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterator, List, Tuple
+
+from algoritmos import Grafo, GrafoCSR, dijkstra
+
+# Grafo anexado à memória compartilhada dentro de cada processo do pool
+_grafo_trabalhador = None
+_blocos_trabalhador = []
+# Vetor dist compartilhado de delta_stepping (somente leitura nos processos)
+_dist_trabalhador = None
+
+# Menor fronteira de delta_stepping repartida entre processos; abaixo disso o
+# custo de enviar as tarefas supera o de relaxar as arestas no processo principal
+MIN_FRONTEIRA_PARALELA = 2048
+
+class GrafoCompartilhado:
+    """
+    Buffers CSR de um grafo publicados em memória compartilhada
+
+    Deve ser usado como gerenciador de contexto: ao sair, os blocos são liberados.
+    descritor() retorna o que um processo precisa para se anexar (nomes e formatos).
+    """
+
+    def __init__(self, grafo):
+        csr = grafo if isinstance(grafo, GrafoCSR) else GrafoCSR.from_grafo(grafo)
+        self.num_vertices = csr.num_vertices
+        self.direcionado = csr.direcionado
+        self.num_arestas = csr.num_arestas
+        self._blocos = []
+        self._buffers = []
+        sentido = (csr.sentido,) if csr.sentido is not None else ()
+        for buffer in (csr.offsets, csr.alvos, csr.pesos) + sentido:
+            # array.array ou memoryview (grafo de carregar_grafo_binario/ler_grafo_csr)
+            visao = memoryview(buffer)
+            dados = visao.tobytes()
+            # SharedMemory não aceita tamanho 0
+            bloco = SharedMemory(create=True, size=max(len(dados), 1))
+            bloco.buf[:len(dados)] = dados
+            self._blocos.append(bloco)
+            self._buffers.append((bloco.name, visao.format, len(visao)))
+
+    def descritor(self) -> tuple:
+        return (self.num_vertices, self.direcionado, self.num_arestas, self._buffers)
+
+    def fechar(self):
+        for bloco in self._blocos:
+            bloco.close()
+            bloco.unlink()
+        self._blocos = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+def anexar_grafo(descritor: tuple) -> Tuple[GrafoCSR, List[SharedMemory]]:
+    """Reconstrói um GrafoCSR sobre os blocos compartilhados, sem copiar os dados"""
+    num_vertices, direcionado, num_arestas, buffers = descritor
+    blocos = []
+    visoes = []
+    for nome, tipo, tamanho in buffers:
+        bloco = SharedMemory(name=nome)
+        blocos.append(bloco)
+        visoes.append(bloco.buf.cast(tipo)[:tamanho])
+    # O quarto buffer, se houver, é o sentido das entradas de um grafo não-direcionado
+    offsets, alvos, pesos, *sentido = visoes
+    return GrafoCSR(num_vertices, direcionado, offsets, alvos, pesos, num_arestas,
+                    sentido[0] if sentido else None), blocos
+
+def _iniciar_trabalhador(descritor: tuple):
+    global _grafo_trabalhador, _blocos_trabalhador
+    _grafo_trabalhador, _blocos_trabalhador = anexar_grafo(descritor)
+
+def _resultado_origem(grafo, origem: int, agregado: bool):
+    """Linha de distâncias da origem ou, se agregado, (soma, excentricidade)"""
+    dist, _ = dijkstra(grafo, origem)
+    if not agregado:
+        return origem, dist
+    INF = float('inf')
+    # Mesmo critério do Cenário 1: soma de todas as distâncias, maior distância finita
+    return origem, sum(dist), max((d for d in dist if d != INF), default=0)
+
+def _processar_lote(tarefa: Tuple[List[int], bool]) -> list:
+    origens, agregado = tarefa
+    return [_resultado_origem(_grafo_trabalhador, origem, agregado) for origem in origens]
+
+def dijkstra_multiplas_origens(grafo: Grafo, origens: List[int] = None, processos: int = None,
+                               agregado: bool = False, tamanho_lote: int = 16) -> Iterator[tuple]:
+    """
+    Executa dijkstra a partir de várias origens em um pool de processos
+
+    Os resultados são produzidos em fluxo (gerador), na ordem das origens:
+      agregado=False -> (origem, dist)
+      agregado=True  -> (origem, soma_das_distâncias, excentricidade)
+    Com agregado=True só três números por origem voltam ao processo principal,
+    então a memória fica O(n) mesmo calculando todas as origens.
+
+    origens=None usa todos os vértices; processos=None usa os.cpu_count().
+    """
+    if origens is None:
+        origens = range(grafo.num_vertices)
+    origens = list(origens)
+    processos = processos or os.cpu_count() or 1
+
+    if processos == 1:
+        for origem in origens:
+            yield _resultado_origem(grafo, origem, agregado)
+        return
+
+    lotes = [(origens[i:i + tamanho_lote], agregado) for i in range(0, len(origens), tamanho_lote)]
+    with GrafoCompartilhado(grafo) as compartilhado:
+        with Pool(processos, initializer=_iniciar_trabalhador,
+                  initargs=(compartilhado.descritor(),)) as pool:
+            for resultados in pool.imap(_processar_lote, lotes):
+                yield from resultados
+
+def delta_stepping(grafo: Grafo, origem: int, delta: float = None,
+                   processos: int = 1) -> Tuple[List[float], List[int]]:
+    """
+    Caminhos mínimos de origem única por delta-stepping (Meyer e Sanders)
+
+    Os vértices ficam em baldes de largura delta pela distância provisória. O
+    menor balde não vazio é esvaziado em rodadas: cada rodada relaxa as arestas
+    leves (peso <= delta) dos vértices retirados, o que pode devolver vértices ao
+    mesmo balde; quando ele fica vazio, as arestas pesadas de todos os vértices
+    retirados são relaxadas uma única vez. Todos os vértices de uma rodada são
+    independentes entre si, e é isso que se reparte entre os processos.
+
+    Com processos > 1 (None usa os.cpu_count()), o grafo vai para memória
+    compartilhada (GrafoCompartilhado) junto com dist; cada processo examina
+    sua parte da fronteira e devolve os pedidos (v, nova distância, u) que
+    melhoram dist, e o processo principal os aplica. Fronteiras menores que
+    MIN_FRONTEIRA_PARALELA são processadas no próprio processo principal.
+
+    delta=None usa peso máximo / grau médio. Pesos devem ser não-negativos.
+    Retorna (dist, anterior) como dijkstra; em empates de distância o
+    predecessor escolhido pode ser outro.
+    """
+    csr = grafo if isinstance(grafo, GrafoCSR) else GrafoCSR.from_grafo(grafo)
+    n = csr.num_vertices
+    if len(csr.pesos) and min(csr.pesos) < 0:
+        raise ValueError("delta_stepping exige pesos não-negativos")
+    if delta is None:
+        # Escolha de Meyer e Sanders: peso máximo / grau médio
+        delta = max(csr.pesos) / max(len(csr.alvos) / max(n, 1), 1) if len(csr.pesos) else 1
+    delta = delta or 1
+    processos = processos or os.cpu_count() or 1
+
+    if processos == 1:
+        dist = [float('inf')] * n
+        anterior = [-1] * n
+        _delta_stepping(csr, origem, delta, dist, anterior, None)
+        return dist, anterior
+
+    bloco_dist = SharedMemory(create=True, size=max(8 * n, 1))
+    dist = bloco_dist.buf.cast('d')[:n]
+    try:
+        dist[:] = array('d', [float('inf')]) * n
+        anterior = [-1] * n
+        with GrafoCompartilhado(csr) as compartilhado:
+            with Pool(processos, initializer=_iniciar_trabalhador_delta,
+                      initargs=(compartilhado.descritor(), bloco_dist.name, n)) as pool:
+                _delta_stepping(csr, origem, delta, dist, anterior, (pool, processos))
+        distancias = dist.tolist()
+        # dist compartilhado é float64: com pesos inteiros, devolve inteiros como
+        # dijkstra e o caminho com processos=1 (exatos abaixo de 2⁵³)
+        if memoryview(csr.pesos).format not in 'fd':
+            INF = float('inf')
+            distancias = [int(d) if d != INF else INF for d in distancias]
+        return distancias, anterior
+    finally:
+        dist.release()
+        bloco_dist.close()
+        bloco_dist.unlink()
+
+def _delta_stepping(csr: GrafoCSR, origem: int, delta: float, dist, anterior: List[int], paralelo):
+    """Laço de baldes de delta_stepping; paralelo = (pool, processos) ou None"""
+    baldes = {}
+    indices = []
+
+    def relaxar(pedidos):
+        for v, nova, u in pedidos:
+            atual = dist[v]
+            if nova < atual:
+                if atual != float('inf'):
+                    baldes[int(atual // delta)].discard(v)
+                indice = int(nova // delta)
+                if indice not in baldes:
+                    baldes[indice] = set()
+                    heapq.heappush(indices, indice)
+                baldes[indice].add(v)
+                dist[v] = nova
+                anterior[v] = u
+
+    def pedidos_de(fronteira: List[int], leves: bool) -> list:
+        if paralelo is None or len(fronteira) < MIN_FRONTEIRA_PARALELA:
+            return _pedidos(csr.offsets, csr.alvos, csr.pesos, dist, fronteira, delta, leves)
+        pool, processos = paralelo
+        tamanho = -(-len(fronteira) // processos)
+        tarefas = [(fronteira[i:i + tamanho], delta, leves) for i in range(0, len(fronteira), tamanho)]
+        pedidos = []
+        for parte in pool.map(_pedidos_trabalhador, tarefas):
+            pedidos.extend(parte)
+        return pedidos
+
+    relaxar([(origem, 0, -1)])
+    while indices:
+        indice = heapq.heappop(indices)
+        retirados = []
+        # Rodadas de arestas leves até o balde ficar vazio
+        while baldes.get(indice):
+            fronteira = list(baldes[indice])
+            baldes[indice] = set()
+            retirados.extend(fronteira)
+            relaxar(pedidos_de(fronteira, True))
+        baldes.pop(indice, None)
+        # Arestas pesadas dos vértices retirados: levam sempre a baldes posteriores
+        relaxar(pedidos_de(retirados, False))
+
+def _pedidos(offsets, alvos, pesos, dist, fronteira: List[int], delta: float, leves: bool) -> list:
+    """Pedidos (v, nova, u) das arestas leves (ou pesadas) da fronteira que melhoram dist"""
+    melhores = {}
+    for u in fronteira:
+        du = dist[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            peso = pesos[i]
+            if (peso <= delta) != leves:
+                continue
+            v = alvos[i]
+            nova = du + peso
+            if nova < dist[v] and nova < melhores.get(v, (float('inf'),))[0]:
+                melhores[v] = (nova, u)
+    return [(v, nova, u) for v, (nova, u) in melhores.items()]
+
+def _iniciar_trabalhador_delta(descritor: tuple, nome_dist: str, n: int):
+    global _dist_trabalhador
+    _iniciar_trabalhador(descritor)
+    bloco = SharedMemory(name=nome_dist)
+    _blocos_trabalhador.append(bloco)
+    _dist_trabalhador = bloco.buf.cast('d')[:n]
+
+def _pedidos_trabalhador(tarefa: tuple) -> list:
+    fronteira, delta, leves = tarefa
+    g = _grafo_trabalhador
+    return _pedidos(g.offsets, g.alvos, g.pesos, _dist_trabalhador, fronteira, delta, leves)
@@ -0,0 +1,237 @@
+"""
+Servidor local de rotas (asyncio, só biblioteca padrão)
+
+Mantém grafos e grids carregados em memória e responde consultas de caminho
+mínimo por TCP, uma mensagem JSON por linha. Um cliente pode enviar várias
+consultas sem esperar as respostas; cada resposta leva o id da consulta e elas
+podem chegar fora de ordem.
+
+Consulta:  {"id": 1, "grafo": "metro", "algoritmo": "dijkstra", "origem": 0, "destino": 5}
+Resposta:  {"id": 1, "distancia": 12, "caminho": [0, 3, 5]}
+           (distancia null e caminho [] se o destino for inalcançável)
+Erro:      {"id": 1, "erro": "mensagem"}
+Contadores: {"id": 2, "comando": "estatisticas"}
+
+Algoritmos: 'dijkstra' e 'bellman_ford' (Bellman-Ford com fila, como no Cenário 2)
+sobre grafos registrados, com vértices numerados a partir de 0; 'grid' sobre grids
+registrados, com origem e destino como [linha, coluna].
+
+Consultas simultâneas com o mesmo (grafo, algoritmo, origem) são agrupadas:
+a primeira dispara a busca de origem única no executor e as demais aguardam o
+mesmo resultado, do qual cada uma extrai o caminho para o seu destino. Com um
+CacheConsultas, as árvores já calculadas também atendem consultas posteriores
+da mesma origem enquanto o grafo não mudar. As buscas rodam fora do laço de
+eventos (por padrão em um ThreadPoolExecutor), que continua aceitando conexões
+e consultas enquanto elas executam.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import List, Tuple
+
+from algoritmos import Caminho, dijkstra, bellman_ford_fila
+from busca_grid import GridImplicito
+from cache_consultas import CacheConsultas
+from utils import ler_grafo_arquivo
+
+class ServicoRotas:
+    """
+    Grafos registrados por nome e a execução agrupada das buscas
+
+    Com coalescer=False cada consulta faz sua própria busca (para comparação).
+    O cache é opcional e só é acessado a partir do laço de eventos.
+    Contadores: consultas, buscas (executadas de fato), agrupadas (consultas
+    atendidas pela busca de outra), acertos_cache e erros.
+    """
+
+    def __init__(self, executor: Executor = None, coalescer: bool = True, cache: CacheConsultas = None):
+        self.executor = executor if executor is not None else ThreadPoolExecutor(os.cpu_count())
+        self.coalescer = coalescer
+        self.cache = cache
+        self.grafos = {}
+        self.grids = {}
+        self.consultas = 0
+        self.buscas = 0
+        self.agrupadas = 0
+        self.erros = 0
+        # (nome, algoritmo, origem) -> asyncio.Future da busca em andamento
+        self._em_andamento = {}
+
+    def registrar_grafo(self, nome: str, grafo):
+        """Grafo, GrafoCSR ou qualquer objeto com a mesma interface"""
+        self.grafos[nome] = grafo
+
+    def registrar_grid(self, nome: str, grid: GridImplicito):
+        self.grids[nome] = grid
+
+    async def consultar(self, nome: str, algoritmo: str, origem, destino) -> Tuple[float, List]:
+        """
+        Distância e caminho de origem a destino; (inf, []) se não houver caminho.
+        ValueError para consulta inválida ou ciclo negativo alcançável.
+        """
+        self.consultas += 1
+        grafo, origem, destino = self._validar(nome, algoritmo, origem, destino)
+
+        resultado = self.cache.obter(grafo, algoritmo, origem) if self.cache is not None else None
+        if resultado is None:
+            # shield: o cancelamento de uma consulta não cancela a busca das demais
+            resultado = await asyncio.shield(self._busca(grafo, nome, algoritmo, origem))
+        dist, anterior, ciclo = resultado
+
+        if ciclo:
+            raise ValueError("Ciclo negativo alcançável a partir da origem")
+        if dist[destino] == float('inf'):
+            return dist[destino], []
+        caminho = Caminho(anterior, origem, destino).lista()
+        if algoritmo == 'grid':
+            caminho = [list(grafo.posicao(u)) for u in caminho]
+        return dist[destino], caminho
+
+    def _busca(self, grafo, nome: str, algoritmo: str, origem: int) -> asyncio.Future:
+        """Busca em andamento para a origem, ou uma nova disparada no executor"""
+        chave = (nome, algoritmo, origem)
+        futuro = self._em_andamento.get(chave) if self.coalescer else None
+        if futuro is not None:
+            self.agrupadas += 1
+            return futuro
+
+        futuro = asyncio.get_running_loop().run_in_executor(self.executor, _buscar, grafo, algoritmo, origem)
+        self.buscas += 1
+        if self.coalescer:
+            self._em_andamento[chave] = futuro
+            futuro.add_done_callback(lambda _, c=chave: self._em_andamento.pop(c, None))
+        if self.cache is not None:
+            futuro.add_done_callback(lambda f: self._guardar(grafo, algoritmo, origem, f))
+        return futuro
+
+    def _guardar(self, grafo, algoritmo: str, origem: int, futuro: asyncio.Future):
+        if not futuro.cancelled() and futuro.exception() is None:
+            self.cache.guardar(grafo, algoritmo, origem, futuro.result())
+
+    def _validar(self, nome: str, algoritmo: str, origem, destino):
+        """Grafo da consulta e origem/destino convertidos em IDs de vértice"""
+        if not isinstance(nome, str):
+            raise ValueError(f"Nome de grafo inválido: {nome!r}")
+        if algoritmo == 'grid':
+            grafo = self.grids.get(nome)
+            if grafo is None:
+                raise ValueError(f"Grid desconhecido: {nome}")
+            posicoes = []
+            for pos in (origem, destino):
+                if not isinstance(pos, (list, tuple)) or len(pos) != 2 or \
+                        not all(_inteiro(x) for x in pos) or \
+                        not (0 <= pos[0] < grafo.linhas and 0 <= pos[1] < grafo.colunas):
+                    raise ValueError(f"Posição inválida: {pos}")
+                posicoes.append(grafo.indice(pos))
+            return grafo, posicoes[0], posicoes[1]
+
+        if algoritmo not in ('dijkstra', 'bellman_ford'):
+            raise ValueError(f"Algoritmo desconhecido: {algoritmo}")
+        grafo = self.grafos.get(nome)
+        if grafo is None:
+            raise ValueError(f"Grafo desconhecido: {nome}")
+        for vertice in (origem, destino):
+            if not _inteiro(vertice) or not 0 <= vertice < grafo.num_vertices:
+                raise ValueError(f"Vértice inválido: {vertice}")
+        return grafo, origem, destino
+
+    def estatisticas(self) -> dict:
+        return {
+            'consultas': self.consultas,
+            'buscas': self.buscas,
+            'agrupadas': self.agrupadas,
+            'acertos_cache': self.cache.acertos if self.cache is not None else 0,
+            'erros': self.erros,
+            'em_andamento': len(self._em_andamento),
+        }
+
+    async def atender(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """Conexão de um cliente: cada linha vira uma tarefa; as respostas saem quando prontas"""
+        tarefas = set()
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                tarefa = asyncio.create_task(self._responder(linha, escritor))
+                tarefas.add(tarefa)
+                tarefa.add_done_callback(tarefas.discard)
+            if tarefas:
+                await asyncio.gather(*tarefas)
+        except ConnectionError:
+            pass
+        finally:
+            for tarefa in tarefas:
+                tarefa.cancel()
+            escritor.close()
+
+    async def _responder(self, linha: bytes, escritor: asyncio.StreamWriter):
+        resposta = await self.processar(linha)
+        escritor.write(json.dumps(resposta).encode() + b'\n')
+        await escritor.drain()
+
+    async def processar(self, linha: bytes) -> dict:
+        """Resposta (dicionário) para uma linha de consulta"""
+        id_consulta = None
+        try:
+            consulta = json.loads(linha)
+            if not isinstance(consulta, dict):
+                raise ValueError("A consulta deve ser um objeto JSON")
+            id_consulta = consulta.get('id')
+            if consulta.get('comando') == 'estatisticas':
+                return {'id': id_consulta, **self.estatisticas()}
+            distancia, caminho = await self.consultar(consulta.get('grafo'), consulta.get('algoritmo'),
+                                                      consulta.get('origem'), consulta.get('destino'))
+        except ValueError as e:
+            self.erros += 1
+            return {'id': id_consulta, 'erro': str(e)}
+        except Exception as e:
+            # Qualquer outra falha (inclusive no executor) responde só esta consulta,
+            # sem derrubar as demais tarefas da conexão
+            self.erros += 1
+            return {'id': id_consulta, 'erro': f"Erro interno: {type(e).__name__}: {e}"}
+        # JSON não tem infinito: destino inalcançável vira null
+        if distancia == float('inf'):
+            distancia = None
+        return {'id': id_consulta, 'distancia': distancia, 'caminho': caminho}
+
+    async def iniciar(self, host: str = '127.0.0.1', porta: int = 8765) -> asyncio.Server:
+        """Servidor escutando em host:porta (porta 0 escolhe uma porta livre)"""
+        return await asyncio.start_server(self.atender, host, porta)
+
+def _inteiro(valor) -> bool:
+    # bool é subclasse de int, mas true/false não são vértices
+    return isinstance(valor, int) and not isinstance(valor, bool)
+
+def _buscar(grafo, algoritmo: str, origem: int) -> Tuple[List[float], List[int], List[int]]:
+    """Busca de origem única executada no executor: (dist, anterior, ciclo negativo ou [])"""
+    if algoritmo == 'bellman_ford':
+        return bellman_ford_fila(grafo, origem)
+    dist, anterior = dijkstra(grafo, origem)
+    return dist, anterior, []
+
+def servico_exemplos() -> ServicoRotas:
+    """Serviço com as entradas dos três cenários: 'metro', 'carro' e o grid 'armazem'"""
+    servico = ServicoRotas(cache=CacheConsultas())
+    servico.registrar_grafo('metro', ler_grafo_arquivo("graph1.txt", direcionado=False, index_base=1))
+    servico.registrar_grafo('carro', ler_grafo_arquivo("graph2.txt", direcionado=True))
+    servico.registrar_grid('armazem', GridImplicito.de_arquivo("grid_example.txt"))
+    return servico
+
+async def _executar(porta: int):
+    servico = servico_exemplos()
+    servidor = await servico.iniciar(porta=porta)
+    endereco = servidor.sockets[0].getsockname()
+    print(f"Servidor de rotas em {endereco[0]}:{endereco[1]} "
+          f"(grafos: {', '.join(servico.grafos)}; grids: {', '.join(servico.grids)})")
+    async with servidor:
+        await servidor.serve_forever()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(_executar(int(sys.argv[1]) if len(sys.argv) > 1 else 8765))
+    except KeyboardInterrupt:
+        pass
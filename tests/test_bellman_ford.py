@@ -0,0 +1,73 @@
+"""
+bellman_ford sobre outras representações de grafo: GridImplicito (arestas
+sem len()) e GrafoCSR
+"""
+
+import gc
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import Grafo, GrafoCSR, bellman_ford, dijkstra
+from busca_grid import GridImplicito
+from instrumentacao import Estatisticas
+from paralelo import GrafoCompartilhado, anexar_grafo
+from utils import carregar_grafo_binario, salvar_grafo_binario
+
+class TestBellmanFordGrid(unittest.TestCase):
+    def test_estatisticas_em_grid_implicito(self):
+        grid = GridImplicito.de_grid([list("..~"), list(".#."), list("~..")])
+        estatisticas = Estatisticas('grid')
+        dist, _, sem_ciclo = bellman_ford(grid, 0, estatisticas)
+        self.assertTrue(sem_ciclo)
+        self.assertEqual(dist, dijkstra(grid, 0)[0])
+        contadores = estatisticas.como_dict()['contadores']
+        self.assertEqual(contadores['arestas_examinadas'],
+                         contadores['passes'] * sum(1 for _ in grid.arestas))
+
+class TestBellmanFordCSR(unittest.TestCase):
+    """GrafoCSR não-direcionado produz cada aresta no sentido em que foi dada, como Grafo"""
+
+    def verificar(self, representacao, grafo: Grafo, esperado: list):
+        self.assertEqual(sorted(representacao.arestas), sorted(grafo.arestas))
+        self.assertEqual([bellman_ford(representacao, s)[0] for s in range(5)], esperado)
+
+    def test_sentido_das_arestas_preservado(self):
+        grafo = Grafo(3)
+        grafo.adicionar_aresta(1, 0, 2)
+        grafo.adicionar_aresta(2, 1, 3)
+        csr = GrafoCSR.from_grafo(grafo)
+        self.assertEqual(sorted(csr.arestas), sorted(grafo.arestas))
+        self.assertEqual(bellman_ford(csr, 0)[0], bellman_ford(grafo, 0)[0])
+
+    def test_representacoes_equivalentes(self):
+        rng = random.Random(0)
+        grafo = Grafo(30)
+        for _ in range(60):
+            u, v = rng.randrange(30), rng.randrange(30)
+            grafo.adicionar_aresta(u, v, rng.randint(1, 9))
+        csr = GrafoCSR.from_grafo(grafo)
+        esperado = [bellman_ford(grafo, s)[0] for s in range(5)]
+
+        with tempfile.TemporaryDirectory() as pasta:
+            arquivo = os.path.join(pasta, "grafo.csr")
+            salvar_grafo_binario(csr, arquivo)
+            carregado = carregar_grafo_binario(arquivo, usar_mmap=False)
+            with GrafoCompartilhado(carregado) as compartilhado:
+                anexado, blocos = anexar_grafo(compartilhado.descritor())
+                try:
+                    for representacao in (csr, carregado, anexado):
+                        self.verificar(representacao, grafo, esperado)
+                    del representacao
+                finally:
+                    del anexado
+                    gc.collect()
+                    for bloco in blocos:
+                        bloco.close()
+
+if __name__ == "__main__":
+    unittest.main()
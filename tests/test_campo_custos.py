@@ -0,0 +1,54 @@
+"""
+CampoCustos em grids de custo uniforme (só '.' e '#'): a frente de cada balde
+não pode acumular células repetidas, e os custos batem com dijkstra
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import dijkstra
+from busca_grid import CampoCustos, GridImplicito, rotear_robos
+
+def grid_uniforme(lado: int, prob_obstaculo: float = 0.2, semente: int = 0) -> GridImplicito:
+    rng = random.Random(semente)
+    grid = [['#' if rng.random() < prob_obstaculo else '.' for _ in range(lado)] for _ in range(lado)]
+    grid[0][0] = '.'
+    return GridImplicito.de_grid(grid)
+
+class TestCampoCustosUniforme(unittest.TestCase):
+    def test_custos_iguais_ao_dijkstra(self):
+        grid = grid_uniforme(20)
+        objetivo = (0, 0)
+        for modo in ('numpy', 'python'):
+            campo = CampoCustos(grid, objetivo, modo)
+            for i in range(grid.linhas):
+                for j in range(grid.colunas):
+                    dist, _ = dijkstra(grid, grid.indice((i, j)))
+                    esperado = dist[grid.indice(objetivo)] if grid.custo(grid.indice((i, j))) else float('inf')
+                    self.assertEqual(campo.custo((i, j)), esperado, (modo, i, j))
+
+    def test_grid_sem_obstaculos_nao_explode(self):
+        # Antes da deduplicação, 40x40 só com '.' esgotava a memória
+        lado = 200
+        grid = grid_uniforme(lado, prob_obstaculo=0.0)
+        campo = CampoCustos(grid, (0, 0), 'numpy')
+        self.assertEqual(campo.custo((lado - 1, lado - 1)), 2 * (lado - 1))
+
+class TestRotearRobosUniforme(unittest.TestCase):
+    def test_objetivo_compartilhado_em_grid_uniforme(self):
+        # Dois robôs no mesmo objetivo passam por CampoCustos
+        grid = grid_uniforme(60, prob_obstaculo=0.0)
+        objetivo = (59, 59)
+        robos = [((0, 0), objetivo), ((10, 30), objetivo), ((59, 0), (0, 59))]
+        for (pos_inicial, pos_objetivo), (custo, caminho) in zip(robos, rotear_robos(grid, robos)):
+            dist, _ = dijkstra(grid, grid.indice(pos_inicial))
+            self.assertEqual(custo, dist[grid.indice(pos_objetivo)])
+            self.assertEqual((caminho[0], caminho[-1]), (pos_inicial, pos_objetivo))
+            self.assertEqual(sum(grid.custo(grid.indice(pos)) for pos in caminho[1:]), custo)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+dijkstra sobre GrafoCSR cujos buffers são memoryviews: o cache .csr de
+ler_grafo_csr (mmap) e o grafo anexado à memória compartilhada de paralelo
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import dijkstra
+from geradores import gerar_grafo_esparso, escrever_grafo_arquivo
+from paralelo import GrafoCompartilhado, anexar_grafo, dijkstra_multiplas_origens
+from utils import ler_grafo_csr
+
+class TestCSRMemoryview(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.arquivo = os.path.join(self.pasta.name, "grafo.txt")
+        escrever_grafo_arquivo(gerar_grafo_esparso(50, 3, semente=1), self.arquivo)
+
+    def tearDown(self):
+        self.pasta.cleanup()
+
+    def test_dijkstra_no_cache_csr(self):
+        esperado = [dijkstra(ler_grafo_csr(self.arquivo, usar_cache=False), s)[0] for s in range(5)]
+        ler_grafo_csr(self.arquivo)
+        grafo = ler_grafo_csr(self.arquivo)
+        self.assertIsInstance(grafo.pesos, memoryview)
+        self.assertEqual([dijkstra(grafo, s)[0] for s in range(5)], esperado)
+
+    def test_dijkstra_em_memoria_compartilhada(self):
+        ler_grafo_csr(self.arquivo)
+        grafo = ler_grafo_csr(self.arquivo)
+        esperado = [dijkstra(ler_grafo_csr(self.arquivo, usar_cache=False), s)[0] for s in range(5)]
+        with GrafoCompartilhado(grafo) as compartilhado:
+            anexado, blocos = anexar_grafo(compartilhado.descritor())
+            try:
+                self.assertEqual([dijkstra(anexado, s)[0] for s in range(5)], esperado)
+            finally:
+                # As visões sobre os blocos precisam sumir antes de fechá-los
+                del anexado
+                gc.collect()
+                for bloco in blocos:
+                    bloco.close()
+
+    def test_multiplas_origens_com_processos(self):
+        grafo = ler_grafo_csr(self.arquivo)
+        esperado = [dijkstra(grafo, s)[0] for s in range(10)]
+        resultado = dijkstra_multiplas_origens(grafo, range(10), processos=2)
+        self.assertEqual([dist for _, dist in resultado], esperado)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+"""
+delta_stepping com vários processos devolve o mesmo dist de dijkstra,
+inclusive o tipo (inteiros para pesos inteiros)
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import paralelo
+from algoritmos import dijkstra
+from geradores import gerar_grafo_esparso
+
+class TestDeltaStepping(unittest.TestCase):
+    def test_distancias_inteiras_com_processos(self):
+        grafo = gerar_grafo_esparso(300, 4, semente=2)
+        esperado, _ = dijkstra(grafo, 0)
+        minimo = paralelo.MIN_FRONTEIRA_PARALELA
+        # Fronteira mínima 1: toda rodada passa pelos processos
+        paralelo.MIN_FRONTEIRA_PARALELA = 1
+        try:
+            for processos in (1, 2):
+                dist, _ = paralelo.delta_stepping(grafo, 0, processos=processos)
+                self.assertEqual(dist, esperado)
+                self.assertEqual([type(d) for d in dist], [type(d) for d in esperado])
+        finally:
+            paralelo.MIN_FRONTEIRA_PARALELA = minimo
+
+if __name__ == "__main__":
+    unittest.main()
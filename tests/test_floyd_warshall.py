@@ -0,0 +1,31 @@
+"""
+Predecessores do Floyd-Warshall em grafos com laços: π_ii fica NIL e todo
+caminho pode ser recuperado com Caminho
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algoritmos import Caminho, Grafo, floyd_warshall
+
+class TestPredecessoresComLaco(unittest.TestCase):
+    def grafo_com_laco(self) -> Grafo:
+        grafo = Grafo(3, direcionado=True)
+        for u, v, peso in ((0, 0, 5), (0, 1, 1), (1, 0, 1), (1, 2, 2), (2, 2, 1)):
+            grafo.adicionar_aresta(u, v, peso)
+        return grafo
+
+    def test_diagonal_nil_e_caminhos(self):
+        for modo in ('python', 'numpy'):
+            dist, pred = floyd_warshall(self.grafo_com_laco(), modo, predecessores=True)
+            self.assertEqual([pred[i][i] for i in range(3)], [-1, -1, -1], modo)
+            self.assertEqual(Caminho(pred[0], 0, 1).lista(), [0, 1], modo)
+            self.assertEqual(Caminho(pred[0], 0, 2).lista(), [0, 1, 2], modo)
+            self.assertEqual(Caminho(pred[1], 1, 0).lista(), [1, 0], modo)
+            self.assertEqual(Caminho(pred[2], 2, 2).lista(), [2], modo)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,36 +2,170 @@
 Funções utilitárias para leitura de arquivos e formatação de saída
 """
 
-from typing import List, Tuple
-from algoritmos import Grafo
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterable, List, Tuple, TextIO
+from algoritmos import Grafo, GrafoCSR
 
-def ler_grafo_arquivo(nome_arquivo: str, direcionado: bool = False) -> Grafo:
+# NumPy é opcional: quando disponível, acelera a conversão de texto para números
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def ler_grafo_arquivo(nome_arquivo: str, direcionado: bool = False, index_base: int = 0) -> Grafo:
     """
     Lê um grafo de um arquivo de texto
     Formato: primeira linha contém num_vertices e num_arestas
     Linhas seguintes contêm: vertice_origem vertice_destino peso
+    index_base: numeração do primeiro vértice no arquivo (graph1.txt usa 1, graph2.txt usa 0)
     """
-    with open(nome_arquivo, 'r') as arquivo:
-        linha = arquivo.readline().strip().split()
-        num_vertices = int(linha[0])
-        num_arestas = int(linha[1])
-        
-        grafo = Grafo(num_vertices, direcionado)
-        
-        for _ in range(num_arestas):
-            linha = arquivo.readline().strip().split()
-            u = int(linha[0])
-            v = int(linha[1]) 
-            peso = int(linha[2])
-            
-            # Para graph1.txt, ajustar para indexação base 0
-            # Para graph2.txt, já está em base 0
-            if nome_arquivo == "graph1.txt" and u > 0:
-                u -= 1
-                v -= 1
-                
-            grafo.adicionar_aresta(u, v, peso)
-    
+    num_vertices, origens, destinos, pesos = ler_arestas_arquivo(nome_arquivo, index_base)
+
+    grafo = Grafo(num_vertices, direcionado)
+    for u, v, peso in zip(origens, destinos, pesos):
+        grafo.adicionar_aresta(u, v, peso)
+
+    return grafo
+
+def ler_arestas_arquivo(nome_arquivo: str, index_base: int = 0,
+                        tamanho_bloco: int = 1 << 24) -> Tuple[int, array, array, array]:
+    """
+    Lê o arquivo de arestas em blocos, convertendo todos os números de cada bloco
+    de uma vez (sem readline/split por linha)
+    Retorna: (num_vertices, origens, destinos, pesos) com as arestas em arrays
+    """
+    valores = array('q')
+    with open(nome_arquivo, 'rb') as arquivo:
+        cabecalho = arquivo.readline().split()
+        num_vertices = int(cabecalho[0])
+        num_arestas = int(cabecalho[1])
+
+        resto = b''
+        while True:
+            bloco = arquivo.read(tamanho_bloco)
+            if not bloco:
+                break
+            bloco = resto + bloco
+            # O último token pode ter sido cortado no meio: fica para o próximo bloco
+            corte = max(bloco.rfind(b' '), bloco.rfind(b'\n'), bloco.rfind(b'\t'))
+            resto = bloco[corte + 1:]
+            _converter_inteiros(bloco[:corte + 1], valores)
+        _converter_inteiros(resto, valores)
+
+    del valores[3 * num_arestas:]
+    if len(valores) < 3 * num_arestas:
+        raise ValueError(f"Arquivo incompleto: esperadas {num_arestas} arestas, lidas {len(valores) // 3}")
+
+    origens, destinos, pesos = valores[0::3], valores[1::3], valores[2::3]
+    if index_base:
+        origens = array('q', (u - index_base for u in origens))
+        destinos = array('q', (v - index_base for v in destinos))
+
+    return num_vertices, origens, destinos, pesos
+
+def _converter_inteiros(texto: bytes, destino: array):
+    """Converte todos os inteiros de um bloco de texto e os acrescenta em destino"""
+    if np is not None:
+        destino.frombytes(np.fromstring(texto.decode('ascii'), dtype=np.int64, sep=' ').tobytes())
+    else:
+        destino.extend(map(int, texto.split()))
+
+# Cabeçalho do formato binário: assinatura, versão, ordem de bytes, direcionado,
+# tem_sentido, index_base, num_vertices, num_arestas, typecodes de offsets/alvos/pesos.
+# Versão 2: com tem_sentido, o buffer sentido ('B') de grafos não-direcionados vem
+# depois de pesos (na versão 1 o byte era preenchimento zerado, então ela ainda é lida)
+_CABECALHO_BINARIO = struct.Struct('<4sBB??qqq3s5x')
+_ASSINATURA_BINARIO = b'GCSR'
+_VERSAO_BINARIO = 2
+
+# Matriz binária: assinatura, versão, little-endian, linhas, colunas; depois as
+# linhas em float64 (inf para inalcançável), uma após a outra
+_CABECALHO_MATRIZ = struct.Struct('<4sBB6xqq')
+_ASSINATURA_MATRIZ = b'MATD'
+_VERSAO_MATRIZ = 1
+
+def salvar_grafo_binario(grafo: GrafoCSR, nome_arquivo: str, index_base: int = 0):
+    """
+    Salva um GrafoCSR em formato binário: cabeçalho fixo seguido dos buffers
+    offsets, alvos e pesos (e sentido, se houver), cada um alinhado em 8 bytes
+    para poder ser mapeado diretamente com mmap por carregar_grafo_binario
+    """
+    buffers = (grafo.offsets, grafo.alvos, grafo.pesos)
+    tipos = ''.join(memoryview(buf).format for buf in buffers).encode('ascii')
+    tem_sentido = grafo.sentido is not None
+    with open(nome_arquivo, 'wb') as arquivo:
+        arquivo.write(_CABECALHO_BINARIO.pack(
+            _ASSINATURA_BINARIO, _VERSAO_BINARIO, sys.byteorder == 'little', grafo.direcionado,
+            tem_sentido, index_base, grafo.num_vertices, grafo.num_arestas, tipos))
+        for buf in buffers + ((grafo.sentido,) if tem_sentido else ()):
+            # memoryview evita copiar o buffer (offsets/alvos/pesos podem ser memoryviews)
+            dados = memoryview(buf).cast('B')
+            arquivo.write(dados)
+            arquivo.write(bytes(-len(dados) % 8))
+
+def carregar_grafo_binario(nome_arquivo: str, usar_mmap: bool = True) -> GrafoCSR:
+    """
+    Carrega um grafo salvo por salvar_grafo_binario
+    Com usar_mmap=True os buffers são visões do arquivo mapeado em memória:
+    nada é copiado e o sistema operacional carrega as páginas sob demanda
+    """
+    with open(nome_arquivo, 'rb') as arquivo:
+        if usar_mmap:
+            dados = memoryview(mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            dados = memoryview(arquivo.read())
+
+    (assinatura, versao, little_endian, direcionado, tem_sentido, _, num_vertices,
+     num_arestas, tipos) = _CABECALHO_BINARIO.unpack_from(dados)
+    if assinatura != _ASSINATURA_BINARIO or versao not in (1, _VERSAO_BINARIO):
+        raise ValueError(f"{nome_arquivo} não é um grafo binário reconhecido")
+    if little_endian != (sys.byteorder == 'little'):
+        raise ValueError(f"{nome_arquivo} foi gravado com outra ordem de bytes")
+
+    def ler_buffer(posicao: int, tipo: str, quantidade: int):
+        tamanho = array(tipo).itemsize * quantidade
+        # Cada buffer começa alinhado em 8 bytes
+        return dados[posicao:posicao + tamanho].cast(tipo), posicao + tamanho + (-tamanho % 8)
+
+    tipo_offsets, tipo_alvos, tipo_pesos = tipos.decode('ascii')
+    offsets, posicao = ler_buffer(_CABECALHO_BINARIO.size, tipo_offsets, num_vertices + 1)
+    # Número de entradas no CSR: offsets[num_vertices]
+    total = offsets[num_vertices]
+    alvos, posicao = ler_buffer(posicao, tipo_alvos, total)
+    pesos, posicao = ler_buffer(posicao, tipo_pesos, total)
+    sentido = ler_buffer(posicao, 'B', total)[0] if tem_sentido else None
+
+    return GrafoCSR(num_vertices, direcionado, offsets, alvos, pesos, num_arestas, sentido)
+
+def ler_grafo_csr(nome_arquivo: str, direcionado: bool = False, index_base: int = 0,
+                  usar_cache: bool = True) -> GrafoCSR:
+    """
+    Lê um arquivo de arestas direto para GrafoCSR
+
+    Com usar_cache=True o grafo é salvo em nome_arquivo + '.csr' na primeira leitura;
+    nas seguintes, se o cache for mais novo que o texto e tiver sido gerado com os
+    mesmos direcionado/index_base, ele é mapeado em memória e o texto nem é lido.
+    """
+    caminho_cache = nome_arquivo + '.csr'
+    if usar_cache and os.path.exists(caminho_cache) and \
+            os.path.getmtime(caminho_cache) >= os.path.getmtime(nome_arquivo):
+        with open(caminho_cache, 'rb') as arquivo:
+            cabecalho = arquivo.read(_CABECALHO_BINARIO.size)
+        if len(cabecalho) == _CABECALHO_BINARIO.size:
+            campos = _CABECALHO_BINARIO.unpack(cabecalho)
+            if campos[0] == _ASSINATURA_BINARIO and campos[1] == _VERSAO_BINARIO and \
+                    campos[3] == direcionado and campos[5] == index_base:
+                return carregar_grafo_binario(caminho_cache)
+
+    num_vertices, origens, destinos, pesos = ler_arestas_arquivo(nome_arquivo, index_base)
+    grafo = GrafoCSR.from_arrays(num_vertices, origens, destinos, pesos, direcionado)
+    if usar_cache:
+        salvar_grafo_binario(grafo, caminho_cache, index_base)
     return grafo
 
 def ler_grid_arquivo(nome_arquivo: str) -> Tuple[List[List[str]], Tuple[int, int], Tuple[int, int]]:
@@ -60,6 +194,28 @@ def ler_grid_arquivo(nome_arquivo: str) -> Tuple[List[List[str]], Tuple[int, int
     
     return grid, pos_inicial, pos_objetivo
 
+def ler_grid_compacto(nome_arquivo: str) -> Tuple[bytearray, int, int, Tuple[int, int], Tuple[int, int]]:
+    """
+    Lê um grid de um arquivo em um único buffer de bytes (1 byte por célula, em ordem de linha)
+    Retorna: (celulas, linhas, colunas, posição_inicial, posição_objetivo)
+    """
+    with open(nome_arquivo, 'rb') as arquivo:
+        linha = arquivo.readline().split()
+        linhas = int(linha[0])
+        colunas = int(linha[1])
+        # Remove quebras de linha e espaços de uma vez
+        celulas = bytearray(b''.join(arquivo.read().split()))
+
+    if len(celulas) < linhas * colunas:
+        raise ValueError(f"Grid incompleto: esperadas {linhas * colunas} células, lidas {len(celulas)}")
+    del celulas[linhas * colunas:]
+
+    def posicao(codigo: bytes):
+        indice = celulas.find(codigo)
+        return None if indice == -1 else divmod(indice, colunas)
+
+    return celulas, linhas, colunas, posicao(b'S'), posicao(b'G')
+
 def grid_para_grafo(grid: List[List[str]]) -> Tuple[Grafo, dict, dict]:
     """
     Converte um grid em um grafo
@@ -140,4 +296,105 @@ def imprimir_caminho_grid(grid: List[List[str]], caminho_ids: List[int],
     
     print("\nGrid com caminho marcado (* indica o caminho):")
     for linha in grid_caminho:
-        print(''.join(linha))
\ No newline at end of file
+        print(''.join(linha))
+
+def escrever_matriz_binaria(linhas: Iterable, nome_arquivo: str, colunas: int) -> int:
+    """
+    Grava as linhas de uma matriz (listas, arrays, linhas de NumPy ou um gerador)
+    uma a uma, sem montar a matriz inteira; o número de linhas é corrigido no
+    cabeçalho ao final. Retorna o número de linhas gravadas.
+    """
+    num_linhas = 0
+    with open(nome_arquivo, 'wb') as arquivo:
+        arquivo.write(_CABECALHO_MATRIZ.pack(_ASSINATURA_MATRIZ, _VERSAO_MATRIZ,
+                                             sys.byteorder == 'little', 0, colunas))
+        for linha in linhas:
+            dados = array('d', linha)
+            if len(dados) != colunas:
+                raise ValueError(f"Linha {num_linhas} com {len(dados)} colunas, esperado {colunas}")
+            dados.tofile(arquivo)
+            num_linhas += 1
+        arquivo.seek(0)
+        arquivo.write(_CABECALHO_MATRIZ.pack(_ASSINATURA_MATRIZ, _VERSAO_MATRIZ,
+                                             sys.byteorder == 'little', num_linhas, colunas))
+    return num_linhas
+
+def ler_matriz_binaria(nome_arquivo: str) -> Tuple[int, int, memoryview]:
+    """
+    Matriz gravada por escrever_matriz_binaria, mapeada em memória:
+    (linhas, colunas, dados), com dados[i * colunas + j] lido sob demanda
+    """
+    with open(nome_arquivo, 'rb') as arquivo:
+        dados = memoryview(mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ))
+    assinatura, versao, little_endian, linhas, colunas = _CABECALHO_MATRIZ.unpack_from(dados)
+    if assinatura != _ASSINATURA_MATRIZ or versao != _VERSAO_MATRIZ:
+        raise ValueError(f"{nome_arquivo} não é uma matriz binária reconhecida")
+    if little_endian != (sys.byteorder == 'little'):
+        raise ValueError(f"{nome_arquivo} foi gravado com outra ordem de bytes")
+    inicio = _CABECALHO_MATRIZ.size
+    return linhas, colunas, dados[inicio:inicio + 8 * linhas * colunas].cast('d')
+
+def escrever_json(valor, arquivo: TextIO, nivel: int = 0):
+    """
+    Grava valor como JSON em fluxo: dicionários e sequências de sequências (como
+    a matriz de floyd_warshall) são escritos elemento a elemento, com uma linha do
+    arquivo por linha da matriz, então nenhuma string do tamanho da matriz é
+    montada. Infinito, que JSON não representa, vira null.
+    """
+    recuo = "\n" + "  " * (nivel + 1)
+    if isinstance(valor, dict):
+        arquivo.write("{")
+        for i, (chave, item) in enumerate(valor.items()):
+            arquivo.write(("," if i else "") + recuo + json.dumps(str(chave), ensure_ascii=False) + ": ")
+            escrever_json(item, arquivo, nivel + 1)
+        arquivo.write(("\n" + "  " * nivel if valor else "") + "}")
+    elif _eh_sequencia(valor) and not _eh_linha(valor):
+        # Sequência de sequências (ou gerador de linhas): um elemento por vez
+        arquivo.write("[")
+        vazio = True
+        for i, item in enumerate(valor):
+            arquivo.write(("," if i else "") + recuo)
+            escrever_json(item, arquivo, nivel + 1)
+            vazio = False
+        arquivo.write(("\n" + "  " * nivel if not vazio else "") + "]")
+    elif _eh_linha_numerica(valor):
+        # Caminho rápido para linhas de matriz: só números, então trocar o texto é seguro
+        if not isinstance(valor, list):
+            valor = valor.tolist() if hasattr(valor, 'tolist') else list(valor)
+        arquivo.write(json.dumps(valor).replace("-Infinity", "null").replace("Infinity", "null"))
+    else:
+        arquivo.write(json.dumps(_sem_infinito(valor), ensure_ascii=False))
+
+def _eh_sequencia(valor) -> bool:
+    return not isinstance(valor, (str, bytes, dict)) and hasattr(valor, '__iter__')
+
+def _eh_linha(valor) -> bool:
+    """Sequência de valores simples, gravada por escrever_json de uma só vez"""
+    if isinstance(valor, (array, memoryview)):
+        return True
+    if np is not None and isinstance(valor, np.ndarray):
+        return valor.ndim <= 1
+    if isinstance(valor, (list, tuple)):
+        return all(item is None or isinstance(item, (bool, int, float, str)) for item in valor)
+    return False
+
+def _eh_linha_numerica(valor) -> bool:
+    if isinstance(valor, array):
+        return True
+    if np is not None and isinstance(valor, np.ndarray):
+        return valor.ndim == 1 and valor.dtype.kind in 'biuf'
+    if isinstance(valor, list):
+        return all(type(item) in (int, float) for item in valor)
+    return False
+
+def _sem_infinito(valor):
+    """Cópia rasa de um valor simples (ou lista de valores) com inf trocado por None"""
+    if isinstance(valor, float):
+        return None if valor in (float('inf'), float('-inf')) else valor
+    if np is not None and isinstance(valor, np.ndarray):
+        valor = valor.tolist()
+    if _eh_sequencia(valor):
+        return [_sem_infinito(item) for item in valor]
+    if np is not None and isinstance(valor, np.generic):
+        return _sem_infinito(valor.item())
+    return valor